@@ -0,0 +1,97 @@
+"""
+Throughput of the hot reads through the ORM repositories versus the raw asyncpg fast path
+(repository/fastpath.py), measured the way a request pays for them: a session per call
+(as get_db opens), the read, then validation and JSON encoding against the route's
+response_model.
+
+Each endpoint runs for --seconds per variant with --concurrency concurrent callers; the
+report gives requests per second and the speedup.
+
+Usage (from backend/):
+    python -m benchmarks.fastpath_throughput --seconds 10 --concurrency 20
+"""
+import argparse
+import asyncio
+import time
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+
+from configs.postgre import SessionFactory, engine
+from models import Order
+from repository.booking import OrderItemRepository, OrderRepository
+from repository.fastpath import FastReadRepository
+from repository.resources import DishRepository, TableRepository
+from schemas.booking import OrderItemFilter, OrderItemRead, OrderRead
+from schemas.resources import DishFilter, DishRead, DishReadExtended, TableFilter, TableReadExtended
+
+
+def endpoints(order_id: int):
+    """name -> (orm read, fast read, response_model of the route)."""
+    return {
+        "GET /tables": (
+            lambda db: TableRepository(db).get_all_tables(TableFilter()),
+            lambda db: FastReadRepository(db).get_tables(),
+            list[TableReadExtended],
+        ),
+        "GET /orders/{id}": (
+            lambda db: OrderRepository(db).get_order_by_id(order_id),
+            lambda db: FastReadRepository(db).get_order_by_id(order_id),
+            OrderRead | None,   # the route 404s on None; an empty database still runs
+        ),
+        "GET /orders/items?order_id=": (
+            lambda db: OrderItemRepository(db).get_all_order_items(OrderItemFilter(order_id=order_id)),
+            lambda db: FastReadRepository(db).get_order_items_by_order_id(order_id),
+            list[OrderItemRead],
+        ),
+        "GET /resources/dishes": (
+            lambda db: DishRepository(db).get_all_dishes(DishFilter()),
+            lambda db: FastReadRepository(db).get_dishes(),
+            list[DishRead | DishReadExtended],
+        ),
+    }
+
+
+async def run(read, adapter: TypeAdapter, seconds: float, concurrency: int) -> float:
+    done = 0
+    deadline = time.perf_counter() + seconds
+
+    async def caller():
+        nonlocal done
+        while time.perf_counter() < deadline:
+            async with SessionFactory() as db:
+                result = await read(db)
+                await db.commit()
+            adapter.dump_json(adapter.validate_python(result, from_attributes=True))
+            done += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(concurrency)))
+    return done / (time.perf_counter() - started)
+
+
+async def main(seconds: float, concurrency: int):
+    engine.echo = False
+    try:
+        async with SessionFactory() as db:
+            order_id = await db.scalar(
+                select(Order.id).order_by(Order.id.desc()).limit(1)
+            ) or 0
+
+        print(f"{concurrency} concurrent callers, {seconds:g}s per variant, order id {order_id}\n")
+        print(f"{'endpoint':<30} {'orm req/s':>10} {'fast req/s':>11} {'speedup':>8}")
+        for name, (orm_read, fast_read, response_model) in endpoints(order_id).items():
+            adapter = TypeAdapter(response_model)
+            orm = await run(orm_read, adapter, seconds, concurrency)
+            fast = await run(fast_read, adapter, seconds, concurrency)
+            print(f"{name:<30} {orm:>10.1f} {fast:>11.1f} {fast / orm:>7.2f}x")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.seconds, args.concurrency))
@@ -0,0 +1,212 @@
+"""
+Before/after query plans for the repository filters covered by the foreign key index
+migration (d7e41b9a3c26).
+
+Builds scratch copies of the filtered tables in a schema that is dropped afterwards,
+fills them with seeded synthetic data, runs EXPLAIN (ANALYZE, BUFFERS) for every filter
+without the indexes, creates them with the migration's definitions and runs it again.
+Full JSON plans can be written to a file for review or diffing between runs.
+
+Usage (from backend/):
+    python -m benchmarks.fk_index_plans --orders 200000 --output fk_plans.json
+"""
+import argparse
+import asyncio
+import json
+import statistics
+
+from sqlalchemy import text
+
+from configs.postgre import engine
+
+SCHEMA = "bench_fk_indexes"
+
+SETUP = f"""
+DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;
+
+CREATE SCHEMA {SCHEMA};
+
+CREATE TABLE {SCHEMA}.orders (
+    id INTEGER PRIMARY KEY,
+    table_id INTEGER,
+    status_id INTEGER,
+    guest_id INTEGER
+);
+
+CREATE TABLE {SCHEMA}.order_items (
+    id SERIAL PRIMARY KEY,
+    order_id INTEGER,
+    dish_id INTEGER,
+    quantity INTEGER,
+    status_id INTEGER
+);
+
+CREATE TABLE {SCHEMA}.payments (
+    id SERIAL PRIMARY KEY,
+    booking_id INTEGER NOT NULL,
+    amount NUMERIC(18, 2) NOT NULL,
+    status_id INTEGER NOT NULL
+);
+
+CREATE TABLE {SCHEMA}.feedbacks (
+    id SERIAL PRIMARY KEY,
+    order_id INTEGER,
+    comment TEXT NOT NULL,
+    rating INTEGER
+);
+
+CREATE TABLE {SCHEMA}.dish_tags (
+    dish_id INTEGER,
+    tag_id INTEGER,
+    PRIMARY KEY (dish_id, tag_id)
+)
+"""
+
+# Seeded data so runs are comparable: 40 tables, 5 order statuses with most orders
+# completed, ~4 items and ~1.1 payments per order, feedback on a fifth of the orders.
+FILL = f"""
+SELECT setseed(0.42);
+
+INSERT INTO {SCHEMA}.orders (id, table_id, status_id, guest_id)
+SELECT i, i % 40 + 1, CASE WHEN random() < 0.97 THEN 5 ELSE 1 + (random() * 3)::int END,
+       CASE WHEN random() < 0.3 THEN (random() * 20000)::int END
+FROM generate_series(1, :orders) AS i;
+
+INSERT INTO {SCHEMA}.order_items (order_id, dish_id, quantity, status_id)
+SELECT o.id, (random() * 300)::int + 1, 1 + (random() * 3)::int, 4
+FROM {SCHEMA}.orders o, generate_series(1, 4);
+
+INSERT INTO {SCHEMA}.payments (booking_id, amount, status_id)
+SELECT o.id, 100000 + (random() * 900000)::int, CASE WHEN random() < 0.9 THEN 2 ELSE 1 + (random() * 4)::int END
+FROM {SCHEMA}.orders o, generate_series(1, 2) AS n
+WHERE n = 1 OR random() < 0.1;
+
+INSERT INTO {SCHEMA}.feedbacks (order_id, comment, rating)
+SELECT o.id, 'ngon', 1 + (random() * 4)::int
+FROM {SCHEMA}.orders o
+WHERE random() < 0.2;
+
+INSERT INTO {SCHEMA}.dish_tags (dish_id, tag_id)
+SELECT d, t FROM generate_series(1, 300) AS d, generate_series(1, 30) AS t
+WHERE random() < 0.15
+"""
+
+INDEXES = [
+    ("ix_order_items_order_id", "order_items", "order_id"),
+    ("ix_order_items_dish_id", "order_items", "dish_id"),
+    ("ix_orders_table_id", "orders", "table_id"),
+    ("ix_orders_status_id", "orders", "status_id"),
+    ("ix_orders_guest_id", "orders", "guest_id"),
+    ("ix_payments_booking_id", "payments", "booking_id"),
+    ("ix_payments_status_id", "payments", "status_id"),
+    ("ix_feedbacks_order_id", "feedbacks", "order_id"),
+    ("ix_dish_tags_tag_id", "dish_tags", "tag_id"),
+]
+
+# Repository method -> the statement shape it issues (ids picked from the middle of the data)
+QUERIES = {
+    "OrderItemRepository.get_order_items_by_order_id":
+        f"SELECT * FROM {SCHEMA}.order_items WHERE order_id = {{mid}}",
+    "OrderItemRepository.get_all_order_items(dish_id)":
+        f"SELECT * FROM {SCHEMA}.order_items WHERE dish_id = 17",
+    "OrderRepository.get_all_orders(table_id)":
+        f"SELECT * FROM {SCHEMA}.orders WHERE table_id = 7",
+    "OrderRepository.get_all_orders(status_id=pending)":
+        f"SELECT * FROM {SCHEMA}.orders WHERE status_id = 1",
+    "OrderRepository.get_all_orders(guest_id)":
+        f"SELECT * FROM {SCHEMA}.orders WHERE guest_id = 311",
+    "list_payments_repo(booking_id)":
+        f"SELECT * FROM {SCHEMA}.payments WHERE booking_id = {{mid}}",
+    "list_payments_repo(status_id=pending)":
+        f"SELECT * FROM {SCHEMA}.payments WHERE status_id = 1",
+    "FeedbackRepository.create_feedback (order check)":
+        f"SELECT * FROM {SCHEMA}.feedbacks WHERE order_id = {{mid}}",
+    "Tag.dishes load / tag delete cascade":
+        f"SELECT * FROM {SCHEMA}.dish_tags WHERE tag_id = 12",
+    "DELETE FROM orders (FK check on order_items)":
+        f"SELECT 1 FROM {SCHEMA}.order_items WHERE order_id = {{mid}} FOR KEY SHARE",
+}
+
+
+def summarize(plan: dict) -> str:
+    """Node types of a plan tree, outermost first."""
+    nodes = []
+    stack = [plan]
+    while stack:
+        node = stack.pop()
+        name = node["Node Type"]
+        if "Index Name" in node:
+            name += f" ({node['Index Name']})"
+        nodes.append(name)
+        stack.extend(reversed(node.get("Plans", [])))
+    return " > ".join(nodes)
+
+
+async def explain_all(conn, mid: int, repeat: int) -> dict[str, dict]:
+    results = {}
+    for name, query in QUERIES.items():
+        statement = query.format(mid=mid)
+        timings = []
+        for _ in range(repeat):
+            plan = await conn.scalar(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}"))
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            timings.append(plan[0]["Execution Time"])
+        top = plan[0]["Plan"]
+        results[name] = {
+            "sql": statement,
+            "ms": statistics.median(timings),
+            "buffers": top.get("Shared Hit Blocks", 0) + top.get("Shared Read Blocks", 0),
+            "shape": summarize(top),
+            "plan": plan,
+        }
+    return results
+
+
+async def main(orders: int, repeat: int, output: str | None):
+    engine.echo = False
+    async with engine.begin() as conn:
+        # asyncpg runs one command per prepared statement
+        for statement in SETUP.split(";\n\n"):
+            await conn.execute(text(statement))
+        for statement in FILL.split(";\n\n"):
+            await conn.execute(text(statement), {"orders": orders} if ":orders" in statement else {})
+
+    try:
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            for table in ("orders", "order_items", "payments", "feedbacks", "dish_tags"):
+                await conn.execute(text(f"VACUUM ANALYZE {SCHEMA}.{table}"))
+            before = await explain_all(conn, orders // 2, repeat)
+
+            for name, table, column in INDEXES:
+                await conn.execute(text(f"CREATE INDEX CONCURRENTLY {name} ON {SCHEMA}.{table} ({column})"))
+            for table in ("orders", "order_items", "payments", "feedbacks", "dish_tags"):
+                await conn.execute(text(f"ANALYZE {SCHEMA}.{table}"))
+            after = await explain_all(conn, orders // 2, repeat)
+
+        print(f"{orders} orders, median of {repeat} runs")
+        print(f"{'query':<50} {'before ms':>10} {'after ms':>9} {'bufs':>13}")
+        for name in QUERIES:
+            b, a = before[name], after[name]
+            print(f"{name:<50} {b['ms']:>10.3f} {a['ms']:>9.3f} {b['buffers']:>6}->{a['buffers']:<6}")
+            print(f"    before: {b['shape']}")
+            print(f"    after:  {a['shape']}")
+
+        if output:
+            with open(output, "w") as f:
+                json.dump({"orders": orders, "before": before, "after": after}, f, indent=2)
+            print(f"\nPlans written to {output}")
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write before/after JSON plans to this file")
+    args = parser.parse_args()
+    asyncio.run(main(args.orders, args.repeat, args.output))
@@ -0,0 +1,129 @@
+"""
+Compare bulk UPDATE cost on ingredients with the old FOR EACH ROW history trigger
+and the FOR EACH STATEMENT trigger using transition tables.
+
+Runs against DATABASE_URL in a scratch schema that is dropped afterwards.
+
+Usage (from backend/):
+    python -m benchmarks.ingredient_history_trigger --rows 800 --repeat 20
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import text
+
+from configs.postgre import engine
+
+SCHEMA = "bench_ingredient_history"
+
+SETUP = f"""
+DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;
+
+CREATE SCHEMA {SCHEMA};
+
+CREATE TABLE {SCHEMA}.ingredients (
+    id SERIAL PRIMARY KEY,
+    quantity DOUBLE PRECISION
+);
+
+CREATE TABLE {SCHEMA}.ingredient_histories (
+    id SERIAL PRIMARY KEY,
+    ingredient_id INTEGER NOT NULL,
+    old_quantity DOUBLE PRECISION NOT NULL,
+    new_quantity DOUBLE PRECISION NOT NULL,
+    quantity_change DOUBLE PRECISION NOT NULL,
+    reason VARCHAR(255),
+    created_at TIMESTAMP
+);
+
+CREATE FUNCTION {SCHEMA}.log_row() RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.quantity IS DISTINCT FROM OLD.quantity THEN
+        INSERT INTO {SCHEMA}.ingredient_histories
+            (ingredient_id, old_quantity, new_quantity, quantity_change, created_at)
+        VALUES (OLD.id, OLD.quantity, NEW.quantity, NEW.quantity - OLD.quantity, NOW());
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION {SCHEMA}.log_statement() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO {SCHEMA}.ingredient_histories
+        (ingredient_id, old_quantity, new_quantity, quantity_change, reason, created_at)
+    SELECT n.id, o.quantity, n.quantity, n.quantity - o.quantity,
+           NULLIF(current_setting('app.ingredient_change_reason', true), ''), NOW()
+    FROM new_rows n JOIN old_rows o ON o.id = n.id
+    WHERE n.quantity IS DISTINCT FROM o.quantity;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TRIGGERS = {
+    "row": f"""
+        CREATE TRIGGER trg_bench AFTER UPDATE ON {SCHEMA}.ingredients
+        FOR EACH ROW EXECUTE FUNCTION {SCHEMA}.log_row()
+    """,
+    "statement": f"""
+        CREATE TRIGGER trg_bench AFTER UPDATE ON {SCHEMA}.ingredients
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION {SCHEMA}.log_statement()
+    """,
+}
+
+
+async def run_variant(variant: str, rows: int, repeat: int) -> list[float]:
+    timings = []
+    async with engine.connect() as conn:
+        await conn.execute(text(f"DROP TRIGGER IF EXISTS trg_bench ON {SCHEMA}.ingredients"))
+        await conn.execute(text(TRIGGERS[variant]))
+        await conn.commit()
+
+        for _ in range(repeat):
+            # Each run is rolled back so every variant starts from the same state
+            trans = await conn.begin()
+            await conn.execute(text("SELECT set_config('app.ingredient_change_reason', 'benchmark', true)"))
+            start = time.perf_counter()
+            await conn.execute(text(
+                f"UPDATE {SCHEMA}.ingredients SET quantity = quantity - 1 WHERE id <= :rows"
+            ), {"rows": rows})
+            timings.append((time.perf_counter() - start) * 1000)
+
+            written = await conn.scalar(text(f"SELECT count(*) FROM {SCHEMA}.ingredient_histories"))
+            assert written == rows, f"{variant}: expected {rows} history rows, got {written}"
+            await trans.rollback()
+    return timings
+
+
+async def main(rows: int, repeat: int):
+    engine.echo = False
+    async with engine.begin() as conn:
+        # asyncpg runs one command per prepared statement
+        for statement in SETUP.split(";\n\n"):
+            await conn.execute(text(statement))
+        await conn.execute(text(
+            f"INSERT INTO {SCHEMA}.ingredients (quantity) SELECT 1000 FROM generate_series(1, :rows)"
+        ), {"rows": rows})
+
+    try:
+        print(f"Bulk UPDATE of {rows} ingredients, {repeat} runs each")
+        print(f"{'trigger':<10} {'median ms':>10} {'p95 ms':>10} {'min ms':>10}")
+        for variant in TRIGGERS:
+            timings = sorted(await run_variant(variant, rows, repeat))
+            p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+            print(f"{variant:<10} {statistics.median(timings):>10.2f} {p95:>10.2f} {timings[0]:>10.2f}")
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=800)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
@@ -0,0 +1,98 @@
+"""
+Pool occupancy under load: how many pooled connections concurrent requests hold when each
+one does its queries and then spends time on work that does not need the database
+(response serialization, an external upload, a model fit), simulated with a sleep.
+
+Two modes run the same requests against the app's engine:
+    hold     the session (and its connection) lives until the request ends, as before
+    release  the connection goes back to the pool after the last statement
+             (get_db with scope="function", or release_connection before slow work)
+
+The pool is sampled every millisecond; the report gives mean and peak checked-out
+connections, time spent waiting for a checkout, and requests per second. With a small
+pool, "hold" queues requests behind connections that sit idle.
+
+Usage (from backend/):
+    python -m benchmarks.pool_occupancy --requests 500 --concurrency 50 --slow-ms 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import text
+
+from configs.postgre import SessionFactory, engine, release_connection
+
+QUERY = text("SELECT id, number, seats, status_id FROM tables ORDER BY id LIMIT 20")
+
+
+async def request(mode: str, slow_s: float, waits: list[float]):
+    async with SessionFactory() as db:
+        started = time.perf_counter()
+        await db.execute(QUERY)
+        waits.append(time.perf_counter() - started)
+        if mode == "release":
+            await release_connection(db)
+        await asyncio.sleep(slow_s)
+
+
+async def sample(pool, samples: list[int], stop: asyncio.Event):
+    while not stop.is_set():
+        samples.append(pool.checkedout())
+        await asyncio.sleep(0.001)
+
+
+async def run(mode: str, requests: int, concurrency: int, slow_s: float) -> dict:
+    pool = engine.sync_engine.pool
+    samples: list[int] = []
+    waits: list[float] = []
+    gate = asyncio.Semaphore(concurrency)
+    stop = asyncio.Event()
+
+    async def one():
+        async with gate:
+            await request(mode, slow_s, waits)
+
+    sampler = asyncio.create_task(sample(pool, samples, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await sampler
+
+    return {
+        "mean_checked_out": statistics.fmean(samples),
+        "peak_checked_out": max(samples),
+        "mean_wait_ms": statistics.fmean(waits) * 1000,
+        "p95_wait_ms": statistics.quantiles(waits, n=20)[-1] * 1000,
+        "rps": requests / elapsed,
+    }
+
+
+async def main(requests: int, concurrency: int, slow_ms: float):
+    engine.echo = False
+    pool = engine.sync_engine.pool
+    print(f"pool size {pool.size()}, overflow {pool._max_overflow}, "
+          f"{requests} requests, {concurrency} concurrent, {slow_ms:g} ms of non-DB work each\n")
+
+    try:
+        # Warm the pool so neither mode pays for opening connections
+        await run("release", concurrency, concurrency, 0)
+        results = {mode: await run(mode, requests, concurrency, slow_ms / 1000) for mode in ("hold", "release")}
+    finally:
+        await engine.dispose()
+
+    print(f"{'mode':<8} {'mean conns':>10} {'peak':>5} {'wait ms':>8} {'p95 wait':>9} {'req/s':>8}")
+    for mode, r in results.items():
+        print(f"{mode:<8} {r['mean_checked_out']:>10.2f} {r['peak_checked_out']:>5} "
+              f"{r['mean_wait_ms']:>8.2f} {r['p95_wait_ms']:>9.2f} {r['rps']:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--slow-ms", type=float, default=50, help="non-DB work per request after its queries")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.slow_ms))
@@ -0,0 +1,112 @@
+"""
+Python-side cost of the hot repository lookups: building the select() and computing its
+cache key on every call (before) versus lambda statements that do both once per call site
+(after), then executed end to end.
+
+Part 1 needs no database: it times statement construction plus cache-key generation, the
+work SQLAlchemy does on each execute before it finds the compiled SQL in its cache.
+Part 2 runs each query against the database through one session (one connection) and
+reports microseconds per query. It also counts pg_prepared_statements on that connection
+before and after the runs: with asyncpg's prepared statement cache the count should only
+grow by one statement per distinct query, however many times each runs.
+
+Usage (from backend/):
+    python -m benchmarks.statement_overhead --iterations 20000 --queries 2000
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import func, lambda_stmt, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from configs.postgre import engine
+from models import Dish, Order, OrderItem, Table
+
+
+def built(order_id, dish_id, table_id):
+    """The lookups as the repositories wrote them before: a new construct per call."""
+    return {
+        "get_order_by_id": lambda: select(Order).where(Order.id == order_id),
+        "get_dish_by_id": lambda: select(Dish).where(Dish.id == dish_id),
+        "get_table_by_id": lambda: select(Table).options(selectinload(Table.status)).where(Table.id == table_id),
+        "get_order_items_by_order_id": lambda: select(OrderItem).options(
+            selectinload(OrderItem.dish), selectinload(OrderItem.status)
+        ).filter(OrderItem.order_id == order_id),
+    }
+
+
+def cached(order_id, dish_id, table_id):
+    """The same lookups as lambda statements, as the repositories write them now."""
+    return {
+        "get_order_by_id": lambda: lambda_stmt(lambda: select(Order).where(Order.id == order_id)),
+        "get_dish_by_id": lambda: lambda_stmt(lambda: select(Dish).where(Dish.id == dish_id)),
+        "get_table_by_id": lambda: lambda_stmt(
+            lambda: select(Table).options(selectinload(Table.status)).where(Table.id == table_id)),
+        "get_order_items_by_order_id": lambda: lambda_stmt(lambda: select(OrderItem).options(
+            selectinload(OrderItem.dish), selectinload(OrderItem.status)
+        ).filter(OrderItem.order_id == order_id)),
+    }
+
+
+def per_call_us(make, iterations: int) -> float:
+    make()._generate_cache_key()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        make()._generate_cache_key()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+async def prepared_count(db: AsyncSession) -> int:
+    return await db.scalar(text("SELECT count(*) FROM pg_prepared_statements"))
+
+
+async def main(iterations: int, queries: int):
+    engine.echo = False
+
+    print(f"Statement build + cache key, {iterations} calls each")
+    print(f"{'query':<30} {'before us':>10} {'after us':>10}")
+    ids = (1, 1, 1)
+    for name, make in built(*ids).items():
+        after = cached(*ids)[name]
+        print(f"{name:<30} {per_call_us(make, iterations):>10.2f} {per_call_us(after, iterations):>10.2f}")
+
+    try:
+        async with engine.connect() as conn:
+            db = AsyncSession(bind=conn)
+            ids = (
+                await db.scalar(select(func.min(Order.id))) or 1,
+                await db.scalar(select(func.min(Dish.id))) or 1,
+                await db.scalar(select(func.min(Table.id))) or 1,
+            )
+            prepared_before = await prepared_count(db)
+
+            print(f"\nExecuted end to end, {queries} queries each")
+            print(f"{'query':<30} {'before us':>10} {'after us':>10}")
+            for name, make in built(*ids).items():
+                timings = []
+                for statements in (built(*ids), cached(*ids)):
+                    make_stmt = statements[name]
+                    (await db.execute(make_stmt())).scalars().all()
+                    started = time.perf_counter()
+                    for _ in range(queries):
+                        (await db.execute(make_stmt())).scalars().all()
+                        db.expunge_all()
+                    timings.append((time.perf_counter() - started) / queries * 1e6)
+                print(f"{name:<30} {timings[0]:>10.1f} {timings[1]:>10.1f}")
+
+            prepared_after = await prepared_count(db)
+            await db.close()
+    finally:
+        await engine.dispose()
+
+    print(f"\npg_prepared_statements on the connection: {prepared_before} before the runs, {prepared_after} after")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20000, help="statement builds per query in part 1")
+    parser.add_argument("--queries", type=int, default=2000, help="executions per query and variant in part 2")
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations, args.queries))
@@ -0,0 +1,123 @@
+"""
+Cost of a "today's orders" range query as order history grows, with the BRIN index on
+orders.created_at versus a full scan (no time filter index, as before).
+
+Runs against DATABASE_URL in a scratch schema that is dropped afterwards. Rows are
+appended in created_at order at a steady rate, like real orders; every step grows the
+table, then runs EXPLAIN (ANALYZE, BUFFERS) for the last day with and without the index.
+
+Usage (from backend/):
+    python -m benchmarks.time_range_scan --sizes 100000 1000000 5000000 --per-day 2000
+"""
+import argparse
+import asyncio
+import json
+import statistics
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from configs.postgre import engine
+
+SCHEMA = "bench_time_range"
+
+SETUP = f"""
+DROP SCHEMA IF EXISTS {SCHEMA} CASCADE;
+
+CREATE SCHEMA {SCHEMA};
+
+CREATE TABLE {SCHEMA}.orders (
+    id SERIAL PRIMARY KEY,
+    table_id INTEGER,
+    status_id INTEGER,
+    guest_id INTEGER,
+    created_at TIMESTAMP NOT NULL,
+    completed_at TIMESTAMP
+);
+
+CREATE INDEX ix_bench_orders_created_at_brin ON {SCHEMA}.orders
+    USING brin (created_at) WITH (pages_per_range = 32)
+"""
+
+EPOCH = datetime(2020, 1, 1)
+
+QUERY = f"""
+SELECT id, table_id, status_id, guest_id, created_at
+FROM {SCHEMA}.orders
+WHERE created_at >= timestamp '{{start}}' AND created_at < timestamp '{{end}}'
+"""
+
+
+async def grow(conn, current: int, target: int, per_day: int):
+    seconds_per_order = 86400 / per_day
+    await conn.execute(text(f"""
+        INSERT INTO {SCHEMA}.orders (table_id, status_id, guest_id, created_at, completed_at)
+        SELECT i % 40 + 1, 5, NULL,
+               CAST(:epoch AS timestamp) + make_interval(secs => i * CAST(:step AS double precision)),
+               CAST(:epoch AS timestamp) + make_interval(secs => i * CAST(:step AS double precision) + 3600)
+        FROM generate_series(:start, :stop) AS i
+    """), {"epoch": EPOCH, "step": seconds_per_order, "start": current + 1, "stop": target})
+
+
+async def explain(conn, query: str, use_index: bool, repeat: int) -> tuple[float, int, int]:
+    """(median execution ms, shared buffers touched, rows) of the range query."""
+    timings = []
+    for _ in range(repeat):
+        trans = await conn.begin()
+        if not use_index:
+            await conn.execute(text("SET LOCAL enable_bitmapscan = off"))
+            await conn.execute(text("SET LOCAL enable_indexscan = off"))
+        plan = await conn.scalar(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}"))
+        await trans.rollback()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        top = plan[0]
+        timings.append(top["Execution Time"])
+        node = top["Plan"]
+    buffers = node.get("Shared Hit Blocks", 0) + node.get("Shared Read Blocks", 0)
+    return statistics.median(timings), buffers, node.get("Actual Rows", 0)
+
+
+async def main(sizes: list[int], per_day: int, repeat: int):
+    engine.echo = False
+    async with engine.begin() as conn:
+        for statement in SETUP.split(";\n\n"):
+            await conn.execute(text(statement))
+
+    try:
+        print(f"Last-day range query, {per_day} orders/day, median of {repeat} runs")
+        print(f"{'rows':>10} {'day rows':>9} {'brin ms':>9} {'brin bufs':>10} "
+              f"{'scan ms':>9} {'scan bufs':>10} {'brin size':>10}")
+        current = 0
+        for size in sorted(sizes):
+            async with engine.begin() as conn:
+                await grow(conn, current, size, per_day)
+            current = size
+            async with engine.connect() as conn:
+                # VACUUM cannot run in a transaction; it also summarizes the new BRIN ranges
+                conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                await conn.execute(text(f"VACUUM ANALYZE {SCHEMA}.orders"))
+
+            end = EPOCH + timedelta(seconds=size * 86400 / per_day)
+            query = QUERY.format(start=end - timedelta(days=1), end=end)
+            async with engine.connect() as conn:
+                brin_ms, brin_buffers, rows = await explain(conn, query, True, repeat)
+                scan_ms, scan_buffers, _ = await explain(conn, query, False, repeat)
+                index_size = await conn.scalar(text(
+                    f"SELECT pg_size_pretty(pg_relation_size('{SCHEMA}.ix_bench_orders_created_at_brin'))"
+                ))
+            print(f"{size:>10} {rows:>9} {brin_ms:>9.2f} {brin_buffers:>10} "
+                  f"{scan_ms:>9.2f} {scan_buffers:>10} {index_size:>10}")
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000, 5000000])
+    parser.add_argument("--per-day", type=int, default=2000, help="orders per simulated day")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.per_day, args.repeat))
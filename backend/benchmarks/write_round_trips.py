@@ -0,0 +1,227 @@
+"""
+Round trips per write endpoint: how many statements (and commits) each repository write
+sends to Postgres, counted with engine events, plus its wall time.
+
+Everything runs on one connection inside an outer transaction that is rolled back at the
+end, so the database is left as it was. Repository commits become RELEASE SAVEPOINT
+(counted as the commit); the SAVEPOINT that opens each one stands in for BEGIN and is not
+counted. Lookup rows the writes depend on (statuses with the ids the code assumes) are
+inserted if missing, inside the same transaction; their id sequences are moved past them.
+
+Write the counts to a file and pass it back as --baseline on another checkout to compare,
+e.g. before/after the switch to INSERT/UPDATE/DELETE ... RETURNING.
+
+Usage (from backend/):
+    python -m benchmarks.write_round_trips --output round_trips.json
+    python -m benchmarks.write_round_trips --baseline round_trips.json
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.postgre import engine
+from repository.booking import OrderItemRepository, OrderRepository, OrderStatusRepository
+from repository.feedback import FeedbackRepository
+from repository.payments import create_payment_repo, refund_payment_repo, update_payment_status_repo
+from repository.payments.PaymentMethod import PaymentMethodRepository
+from repository.payments.PaymentProvider import PaymentProviderRepository
+from repository.resources import DishRepository, TableRepository, TableStatusRepository, TagRepository
+from schemas.booking import OrderCreate, OrderItemCreate, OrderItemUpdate, OrderStatusCreate, OrderUpdate
+from schemas.feedback import FeedbackCreate, FeedbackUpdate
+from schemas.payments import PaymentCreate, PaymentRefund, PaymentUpdate
+from schemas.payments.payments import PaymentMethodCreate, PaymentProviderCreate
+from schemas.resources import (DishCreate, DishUpdate, TableCreate, TableStatusCreate, TableStatusUpdate, TableUpdate,
+    TagCreate, TagUpdate)
+
+LOOKUPS = """
+INSERT INTO table_statuses (id, status) VALUES (1, 'available'), (2, 'serving') ON CONFLICT DO NOTHING;
+
+INSERT INTO order_statuses (id, status) VALUES (1, 'pending'), (2, 'preparing'), (5, 'completed') ON CONFLICT DO NOTHING;
+
+INSERT INTO order_item_statuses (id, status) VALUES (1, 'pending'), (2, 'cooking'), (3, 'ready'), (4, 'served')
+ON CONFLICT DO NOTHING;
+
+INSERT INTO payment_statuses (id, status)
+VALUES (1, 'pending'), (2, 'success'), (3, 'failed'), (4, 'expired'), (5, 'refunded') ON CONFLICT DO NOTHING;
+
+SELECT setval(pg_get_serial_sequence('table_statuses', 'id'), (SELECT max(id) FROM table_statuses));
+
+SELECT setval(pg_get_serial_sequence('order_statuses', 'id'), (SELECT max(id) FROM order_statuses));
+
+SELECT setval(pg_get_serial_sequence('order_item_statuses', 'id'), (SELECT max(id) FROM order_item_statuses));
+
+SELECT setval(pg_get_serial_sequence('payment_statuses', 'id'), (SELECT max(id) FROM payment_statuses))
+"""
+
+
+class RoundTripCounter:
+    def __init__(self):
+        self.statements = 0
+        self.commits = 0
+        self.rollbacks = 0
+
+    def reset(self):
+        self.statements = self.commits = self.rollbacks = 0
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        head = statement.lstrip()[:24].upper()
+        if head.startswith("SAVEPOINT"):
+            return
+        if head.startswith("RELEASE SAVEPOINT"):
+            self.commits += 1
+        elif head.startswith("ROLLBACK TO SAVEPOINT"):
+            self.rollbacks += 1
+        else:
+            self.statements += 1
+
+
+def scenarios(tag: str):
+    """(endpoint, call) pairs, run in order; calls share a dict of ids created so far."""
+    async def table_status_create(db, ids):
+        ids["table_status"] = (await TableStatusRepository(db).create_table_status(
+            TableStatusCreate(status=f"bench {tag}"))).id
+
+    async def table_create(db, ids):
+        ids["table"] = (await TableRepository(db).create_table(
+            TableCreate(number=f"B-{tag}", seats=4, status_id=1))).id
+
+    async def tag_create(db, ids):
+        ids["tag"] = (await TagRepository(db).create_tag(TagCreate(name=f"bench {tag}"))).id
+
+    async def dish_create(db, ids):
+        ids["dish"] = (await DishRepository(db).create_dish(
+            DishCreate(name=f"bench {tag}", price=50000, tag_ids=[ids["tag"]]))).id
+
+    async def order_create(db, ids):
+        ids["order"] = (await OrderRepository(db).create_order(OrderCreate(table_id=ids["table"]))).id
+
+    async def order_item_create(db, ids):
+        ids["order_item"] = (await OrderItemRepository(db).create_order_item(
+            OrderItemCreate(order_id=ids["order"], dish_id=ids["dish"], quantity=2, status_id=1))).id
+
+    async def feedback_create(db, ids):
+        ids["feedback"] = (await FeedbackRepository(db).create_feedback(
+            FeedbackCreate(order_id=ids["order"], comment="bench", rating=5))).id
+
+    async def payment_method_create(db, ids):
+        ids["method"] = (await PaymentMethodRepository(db).create(PaymentMethodCreate(name=f"bench {tag}"))).id
+
+    async def payment_provider_create(db, ids):
+        ids["provider"] = (await PaymentProviderRepository(db).create(PaymentProviderCreate(name=f"bench {tag}"))).id
+
+    async def payment_create(db, ids):
+        ids["payment"] = (await create_payment_repo(db, PaymentCreate(
+            booking_id=ids["order"], currency="VND", amount=100000,
+            method_id=ids["method"], provider_id=ids["provider"]))).id
+
+    return [
+        ("POST /tables-statuses", table_status_create),
+        ("PUT /tables-statuses/{id}", lambda db, ids: TableStatusRepository(db).update_table_status(
+            ids["table_status"], TableStatusUpdate(status=f"bench {tag} 2"))),
+        ("POST /tables", table_create),
+        ("PUT /tables/{id}", lambda db, ids: TableRepository(db).update_table(
+            ids["table"], TableUpdate(seats=6))),
+        ("POST /resources/tags", tag_create),
+        ("PUT /resources/tags/{id}", lambda db, ids: TagRepository(db).update_tag(
+            ids["tag"], TagUpdate(name=f"bench {tag} 2"))),
+        ("POST /resources/dishes", dish_create),
+        ("PUT /resources/dishes/{id}", lambda db, ids: DishRepository(db).update_dish(
+            ids["dish"], DishUpdate(price=55000))),
+        ("POST /order/statuses", lambda db, ids: OrderStatusRepository(db).create_status(
+            OrderStatusCreate(status=f"bench {tag}"))),
+        ("POST /orders", order_create),
+        ("PUT /orders/{id}", lambda db, ids: OrderRepository(db).update_order(
+            ids["order"], OrderUpdate(status_id=2))),
+        ("POST /orders/items", order_item_create),
+        ("PUT /orders/items/{id}", lambda db, ids: OrderItemRepository(db).update_order_item(
+            ids["order_item"], OrderItemUpdate(quantity=3))),
+        ("POST /feedbacks", feedback_create),
+        ("PUT /feedbacks/{id}", lambda db, ids: FeedbackRepository(db).update_feedback(
+            ids["feedback"], FeedbackUpdate(comment="bench 2"))),
+        ("POST /payment-methods", payment_method_create),
+        ("POST /payment-providers", payment_provider_create),
+        ("POST /payments", payment_create),
+        ("PUT /payments/{id}", lambda db, ids: update_payment_status_repo(
+            db, ids["payment"], PaymentUpdate(status_id=2))),
+        ("POST /payments/{id}/refund", lambda db, ids: refund_payment_repo(
+            db, ids["payment"], PaymentRefund(amount=50000))),
+        ("POST /orders/{id}/complete", lambda db, ids: OrderRepository(db).complete_order(ids["order"])),
+        ("DELETE /orders/items/{id}", lambda db, ids: OrderItemRepository(db).delete_order_item(ids["order_item"])),
+        ("DELETE /feedbacks/{id}", lambda db, ids: FeedbackRepository(db).delete_feedback(ids["feedback"])),
+        ("DELETE /resources/dishes/{id}", lambda db, ids: DishRepository(db).delete_dish(ids["dish"])),
+        ("DELETE /resources/tags/{id}", lambda db, ids: TagRepository(db).delete_tag(ids["tag"])),
+        ("DELETE /tables-statuses/{id}", lambda db, ids: TableStatusRepository(db).delete_table_status(
+            ids["table_status"])),
+    ]
+
+
+async def main(output: str | None, baseline: str | None):
+    engine.echo = False
+    counter = RoundTripCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter.before_cursor_execute)
+
+    results = {}
+    try:
+        async with engine.connect() as conn:
+            outer = await conn.begin()
+            for statement in LOOKUPS.split(";\n\n"):
+                await conn.execute(text(statement))
+
+            ids = {}
+            for name, call in scenarios(uuid.uuid4().hex[:8]):
+                # A fresh session per request with one commit at the end, as get_db does
+                async with AsyncSession(
+                    bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False
+                ) as db:
+                    counter.reset()
+                    started = time.perf_counter()
+                    await call(db, ids)
+                    await db.commit()
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                results[name] = {
+                    "statements": counter.statements,
+                    "commits": counter.commits,
+                    "rollbacks": counter.rollbacks,
+                    "ms": round(elapsed_ms, 3),
+                }
+            await outer.rollback()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", counter.before_cursor_execute)
+        await engine.dispose()
+
+    before = None
+    if baseline:
+        with open(baseline) as f:
+            before = json.load(f)
+
+    print(f"{'endpoint':<40} {'stmts':>6} {'commit':>6} {'ms':>8}" + (f" {'baseline':>9} {'saved':>6}" if before else ""))
+    total = saved = 0
+    for name, r in results.items():
+        trips = r["statements"] + r["commits"] + r["rollbacks"]
+        total += trips
+        line = f"{name:<40} {r['statements']:>6} {r['commits']:>6} {r['ms']:>8.2f}"
+        if before and name in before:
+            b = before[name]
+            old = b["statements"] + b["commits"] + b["rollbacks"]
+            saved += old - trips
+            line += f" {old:>9} {old - trips:>6}"
+        print(line)
+    print(f"\n{total} round trips in total" + (f", {saved} fewer than the baseline" if before else ""))
+
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Counts written to {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="write per-endpoint counts to this JSON file")
+    parser.add_argument("--baseline", help="counts from another checkout to compare against")
+    args = parser.parse_args()
+    asyncio.run(main(args.output, args.baseline))
@@ -0,0 +1,75 @@
+"""
+Compare JSON and MessagePack for typical WebSocket event frames: encode cost per
+frame, bytes on the wire, and the cost of a broadcast when every socket encodes
+on its own (old send_json path) versus once per encoding.
+
+Pure CPU: no server is started and nothing connects to the database
+(the app config still expects DATABASE_URL to be set).
+
+Usage (from backend/):
+    python -m benchmarks.ws_encoding --sockets 500
+"""
+import argparse
+import json
+import timeit
+from datetime import datetime
+
+import msgpack
+
+from schemas.booking import OrderItemBase, OrderRead
+from schemas.payments import Payment
+from ws.manager import ENCODING_JSON, ENCODING_MSGPACK, encode
+
+
+def sample_frames() -> dict[str, dict]:
+    order = OrderRead(id=1042, table_id=7, status_id=2, guest_id=311)
+    item = OrderItemBase(id=88121, order_id=1042, dish_id=17, status_id=3, quantity=2)
+    payment = Payment(
+        id=5531, booking_id=1042, amount=485000.0, currency="VND", method_id=1, provider_id=2,
+        status_id=2, paid_at=datetime(2026, 10, 19, 19, 42, 7), qr_url="https://dummy-qr/pay_5531",
+        provider_transaction_id="pending_3f9a0c1e5b7d4a2c8e6f1b3d5a7c9e0f",
+    )
+    kitchen_burst = [
+        {"event": "order_item_updated", "data": item.model_copy(update={"id": item.id + i}).model_dump(mode="json")}
+        for i in range(15)
+    ]
+    return {
+        "order_updated": {"event": "order_updated", "data": order.model_dump(mode="json")},
+        "order_item_updated": {"event": "order_item_updated", "data": item.model_dump(mode="json")},
+        "payment_updated": {"event": "payment_updated", "data": payment.model_dump(mode="json")},
+        "batch of 15 items": {"event": "batch", "events": kitchen_burst},
+    }
+
+
+def per_call_us(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main(sockets: int, number: int):
+    frames = sample_frames()
+
+    print(f"{'frame':<20} {'json B':>8} {'msgpack B':>10} {'saved':>6} {'json us':>9} {'msgpack us':>11}")
+    for name, frame in frames.items():
+        json_bytes = len(encode(frame, ENCODING_JSON).encode())
+        msgpack_bytes = len(encode(frame, ENCODING_MSGPACK))
+        json_us = per_call_us(lambda: encode(frame, ENCODING_JSON), number)
+        msgpack_us = per_call_us(lambda: encode(frame, ENCODING_MSGPACK), number)
+        saved = (1 - msgpack_bytes / json_bytes) * 100
+        print(f"{name:<20} {json_bytes:>8} {msgpack_bytes:>10} {saved:>5.0f}% {json_us:>9.2f} {msgpack_us:>11.2f}")
+
+    frame = frames["order_item_updated"]
+    # Old path: starlette's send_json ran json.dumps for every socket
+    per_socket = per_call_us(lambda: [json.dumps(frame) for _ in range(sockets)], max(number // sockets, 10))
+    # New path: one JSON and one msgpack encoding per broadcast, shared by all sockets
+    once = per_call_us(lambda: (encode(frame, ENCODING_JSON), msgpack.packb(frame, use_bin_type=True)), number)
+    print()
+    print(f"broadcast encode cost to {sockets} sockets: "
+          f"{per_socket:.0f} us per-socket vs {once:.2f} us once per encoding")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sockets", type=int, default=500)
+    parser.add_argument("--number", type=int, default=20000, help="iterations per timing")
+    args = parser.parse_args()
+    main(args.sockets, args.number)
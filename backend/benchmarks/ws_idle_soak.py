@@ -0,0 +1,129 @@
+"""
+Soak test for idle WebSocket connections: memory and CPU the API process spends
+per connected-but-silent client.
+
+Starts a server subprocess that mounts only the /ws router, opens N client
+connections that never send anything, and samples the server's RSS and CPU
+time from /proc (Linux) before, after connecting and across an idle period.
+The server keeps uvicorn's protocol pings on, so the idle CPU includes keepalive.
+
+Usage (from backend/):
+    python -m benchmarks.ws_idle_soak --connections 10000 --idle 60
+
+Both processes need a file descriptor limit above --connections; the script
+raises its soft limit to the hard limit and the server inherits it.
+"""
+import argparse
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import time
+
+import websockets
+
+CLK_TCK = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+def serve(port: int, ping_interval: float):
+    import uvicorn
+    from fastapi import FastAPI
+    from ws import router as ws_router
+
+    app = FastAPI()
+    app.include_router(ws_router)
+    uvicorn.run(
+        app,
+        host="127.0.0.1",
+        port=port,
+        log_level="warning",
+        ws_ping_interval=ping_interval,
+        ws_ping_timeout=ping_interval,
+        backlog=4096,
+    )
+
+
+def sample(pid: int) -> tuple[float, float]:
+    """(rss MiB, cpu seconds user+system) of a process."""
+    with open(f"/proc/{pid}/statm") as f:
+        rss_pages = int(f.read().split()[1])
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    cpu = (int(fields[11]) + int(fields[12])) / CLK_TCK
+    return rss_pages * PAGE_SIZE / 2**20, cpu
+
+
+async def wait_until_up(url: str, timeout: float = 20):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            async with websockets.connect(url):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.2)
+
+
+async def main(connections: int, idle: float, port: int, ping_interval: float, batch: int):
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    if hard < connections + 100:
+        print(f"warning: fd hard limit {hard} is below {connections} connections", file=sys.stderr)
+
+    server = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.ws_idle_soak", "--serve", "--port", str(port),
+         "--ping-interval", str(ping_interval)],
+    )
+    url = f"ws://127.0.0.1:{port}/ws"
+    clients = []
+    try:
+        await wait_until_up(url)
+        await asyncio.sleep(1)
+        base_rss, base_cpu = sample(server.pid)
+
+        started = time.perf_counter()
+        for i in range(0, connections, batch):
+            # Client-side pings off: only the server's keepalive is measured
+            opened = await asyncio.gather(*(
+                websockets.connect(url, ping_interval=None, close_timeout=1)
+                for _ in range(min(batch, connections - i))
+            ))
+            clients.extend(opened)
+        connect_seconds = time.perf_counter() - started
+        await asyncio.sleep(2)
+        connected_rss, connected_cpu = sample(server.pid)
+
+        await asyncio.sleep(idle)
+        idle_rss, idle_cpu = sample(server.pid)
+        alive = sum(1 for client in clients if client.state.name == "OPEN")
+
+        per_conn_kib = (idle_rss - base_rss) * 1024 / connections
+        idle_cpu_pct = (idle_cpu - connected_cpu) / idle * 100
+        print(f"connections           {connections} ({alive} still open after idle)")
+        print(f"connect time          {connect_seconds:.1f}s")
+        print(f"server RSS            {base_rss:.1f} -> {connected_rss:.1f} -> {idle_rss:.1f} MiB")
+        print(f"RSS per connection    {per_conn_kib:.1f} KiB")
+        print(f"idle CPU ({idle:.0f}s)        {idle_cpu_pct:.2f}% of one core total")
+        print(f"idle CPU per 1k conns {idle_cpu_pct / connections * 1000:.3f}% of one core")
+    finally:
+        await asyncio.gather(*(client.close() for client in clients), return_exceptions=True)
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connections", type=int, default=10000)
+    parser.add_argument("--idle", type=float, default=60, help="seconds to stay idle before sampling")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--ping-interval", type=float, default=20)
+    parser.add_argument("--batch", type=int, default=500, help="connections opened concurrently")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.serve:
+        serve(args.port, args.ping_interval)
+    else:
+        asyncio.run(main(args.connections, args.idle, args.port, args.ping_interval, args.batch))
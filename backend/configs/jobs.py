@@ -0,0 +1,35 @@
+# backend/configs/jobs.py
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Load .env backend
+BASE_DIR = Path(__file__).resolve().parent.parent
+env_path = BASE_DIR / ".env"
+load_dotenv(env_path)
+
+
+@dataclass
+class JobConfig:
+    api_workers: int = 1                # workers started inside the API process, 0 = none
+    poll_interval_seconds: float = 5.0  # idle workers poll at least this often
+    batch_size: int = 1                 # jobs claimed per round trip
+    job_timeout_seconds: float = 300
+    stale_after_seconds: float = 900    # running jobs locked longer than this are requeued
+    backoff_base_seconds: float = 5
+    backoff_max_seconds: float = 3600
+    keep_finished_days: int = 7
+
+
+job_config = JobConfig(
+    api_workers=int(os.getenv("JOB_API_WORKERS", "1")),
+    poll_interval_seconds=float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "5")),
+    batch_size=int(os.getenv("JOB_BATCH_SIZE", "1")),
+    job_timeout_seconds=float(os.getenv("JOB_TIMEOUT_SECONDS", "300")),
+    stale_after_seconds=float(os.getenv("JOB_STALE_AFTER_SECONDS", "900")),
+    backoff_base_seconds=float(os.getenv("JOB_BACKOFF_BASE_SECONDS", "5")),
+    backoff_max_seconds=float(os.getenv("JOB_BACKOFF_MAX_SECONDS", "3600")),
+    keep_finished_days=int(os.getenv("JOB_KEEP_FINISHED_DAYS", "7")),
+)
@@ -0,0 +1,42 @@
+# backend/configs/notification.py
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+# Load .env backend
+BASE_DIR = Path(__file__).resolve().parent.parent
+env_path = BASE_DIR / ".env"
+load_dotenv(env_path)
+
+
+@dataclass
+class NotificationConfig:
+    enabled: bool = True
+    low_stock_channel: str = "ingredient_low_stock"
+    cooldown_seconds: float = 1800      # same ingredient is alerted at most once per cooldown
+    batch_window_seconds: float = 1.0   # crossings arriving within the window go out together
+    min_interval_seconds: float = 10.0  # at most one delivery per interval, the rest accumulates
+    email_enabled: bool = False
+    smtp_host: str = "localhost"
+    smtp_port: int = 1025               # local SMTP stand-in (mailpit in docker-compose)
+    smtp_sender: str = "alerts@restaurant.local"
+    email_recipients: list[str] = field(default_factory=list)
+
+
+def _env_list(name: str) -> list[str]:
+    return [item.strip() for item in os.getenv(name, "").split(",") if item.strip()]
+
+
+notification_config = NotificationConfig(
+    enabled=os.getenv("NOTIFICATIONS_ENABLED", "true").lower() == "true",
+    cooldown_seconds=float(os.getenv("ALERT_COOLDOWN_SECONDS", "1800")),
+    batch_window_seconds=float(os.getenv("ALERT_BATCH_WINDOW_SECONDS", "1.0")),
+    min_interval_seconds=float(os.getenv("ALERT_MIN_INTERVAL_SECONDS", "10")),
+    email_enabled=os.getenv("ALERT_EMAIL_ENABLED", "false").lower() == "true",
+    smtp_host=os.getenv("SMTP_HOST", "localhost"),
+    smtp_port=int(os.getenv("SMTP_PORT", "1025")),
+    smtp_sender=os.getenv("SMTP_SENDER", "alerts@restaurant.local"),
+    email_recipients=_env_list("ALERT_EMAIL_RECIPIENTS"),
+)
@@ -1,8 +1,10 @@
 import os
 import re
 import ssl
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -13,13 +15,30 @@ DATABASE_URL = re.sub(
     os.getenv('DATABASE_URL')
 )
 
+# Plain libpq-style DSN for dedicated asyncpg connections kept outside the pool
+ASYNCPG_DSN = make_url(DATABASE_URL).set(drivername="postgresql", query={}).render_as_string(hide_password=False)
+
 ssl_context = ssl.create_default_context()
 engine = create_async_engine(
     DATABASE_URL,
     echo=True,
-    connect_args={"ssl": ssl_context}
+    connect_args={
+        "ssl": ssl_context,
+        # asyncpg prepares each distinct SQL string once per connection and reuses it
+        "prepared_statement_cache_size": int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "100")),
+    },
+    # SQLAlchemy's compiled SQL cache, keyed by statement structure
+    query_cache_size=int(os.getenv("DB_QUERY_CACHE_SIZE", "500")),
+    pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    pool_timeout=float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30")),
+    pool_recycle=int(os.getenv("DB_POOL_RECYCLE_SECONDS", "-1")),
 )
 
+# Serve the hottest reads (floor status, order by id, items of an order, menu) with
+# hand-written SQL on the asyncpg connection instead of the ORM; see repository/fastpath.py
+FAST_READS = os.getenv("DB_FAST_READS", "false").lower() == "true"
+
 # Session class for ORM
 SessionFactory = sessionmaker(
     engine, expire_on_commit=False, class_=AsyncSession
@@ -28,5 +47,56 @@ SessionFactory = sessionmaker(
 Base = declarative_base()
 
 async def get_db():
+    """
+    Unit of work: one session and one transaction per request. Repositories only flush;
+    the transaction commits once after the handler returns and rolls back if it raised.
+    Declare it as Depends(get_db, scope="function") so the commit happens, and the
+    connection goes back to the pool, before the response is serialized and sent.
+
+    The session is lazy: no connection is checked out until its first statement, so a
+    request answered from a cache, or rejected before touching the database, never takes
+    one from the pool.
+    """
     async with SessionFactory() as session:
-        yield session
\ No newline at end of file
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+
+
+# Marks a session whose open transaction has written (ORM flushes or INSERT/UPDATE/DELETE
+# statements), so release_connection can refuse to commit it early
+_WROTE = "wrote_in_transaction"
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_dml(state):
+    if state.is_insert or state.is_update or state.is_delete:
+        state.session.info[_WROTE] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session, flush_context):
+    session.info[_WROTE] = True
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _clear_writes(session):
+    session.info.pop(_WROTE, None)
+
+
+async def release_connection(session: AsyncSession):
+    """
+    Hand the request's connection back to the pool ahead of slow work that no longer needs
+    the database (external uploads, waiting on something slow). Only for read-only stretches:
+    it ends the transaction early, which would break the one commit per request of get_db,
+    so it raises if the transaction has written or has pending changes. The next statement
+    checks out a fresh connection and starts a new transaction.
+    """
+    if session.info.get(_WROTE) or session.new or session.dirty or session.deleted:
+        raise RuntimeError("release_connection called after writes; the unit of work would commit early.")
+    if session.in_transaction():
+        await session.commit()
\ No newline at end of file
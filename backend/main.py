@@ -6,12 +6,48 @@ if (major, minor) < (3, 10):
         f"Python 3.10+ required, current version: {sys.version}"
     )
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
+from configs.jobs import job_config
+from configs.notification import notification_config
+from configs.postgre import engine
+from repository.jobs import JOB_NOTIFY_CHANNEL
+from repository.outbox import OUTBOX_NOTIFY_CHANNEL
 from routes.v1 import all_v1_routers
-from ws import router as ws_router
+from services.jobs import JobWorkerPool
+from services.resources import notification_service
+from utils.pg_listener import pg_listener
+from utils.query_capture import query_capture
+from ws import router as ws_router, outbox_dispatcher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if query_capture.enabled:
+        query_capture.attach(engine)
+    job_workers = JobWorkerPool(job_config.api_workers)
+    pg_listener.add_handler(OUTBOX_NOTIFY_CHANNEL, outbox_dispatcher.wake)
+    outbox_dispatcher.start()
+    if notification_config.enabled:
+        pg_listener.add_handler(notification_config.low_stock_channel, notification_service.handle_notification)
+        notification_service.start()
+    if job_workers.workers:
+        pg_listener.add_handler(JOB_NOTIFY_CHANNEL, job_workers.wake)
+        job_workers.start()
+    pg_listener.start()
+    yield
+    await job_workers.stop()
+    await outbox_dispatcher.stop()
+    await pg_listener.stop()
+    await notification_service.stop()
+    if query_capture.enabled:
+        query_capture.detach()
+        query_capture.dump()
+
 
-app = FastAPI(title="Restaurant API", version="1.0.0")
+app = FastAPI(title="Restaurant API", version="1.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -46,4 +82,12 @@ app.include_router(api_router)
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        # Protocol-level keepalive: ping idle sockets, drop peers that miss the pong
+        ws_ping_interval=20,
+        ws_ping_timeout=20,
+    )
\ No newline at end of file
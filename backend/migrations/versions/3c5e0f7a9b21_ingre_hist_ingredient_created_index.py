@@ -0,0 +1,33 @@
+"""ingre-hist ingredient/created_at index
+
+Revision ID: 3c5e0f7a9b21
+Revises: 970e7acffb91
+Create Date: 2026-10-19 15:12:40.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c5e0f7a9b21'
+down_revision: Union[str, Sequence[str], None] = '970e7acffb91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Time-series reads always filter one or more ingredients over a created_at range
+    op.create_index(
+        'ix_ingredient_histories_ingredient_id_created_at',
+        'ingredient_histories',
+        ['ingredient_id', 'created_at'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_ingredient_histories_ingredient_id_created_at', table_name='ingredient_histories')
@@ -0,0 +1,67 @@
+"""outbox events
+
+Revision ID: 5b7e2d9c8a14
+Revises: e2f9b7c41d08
+Create Date: 2026-10-19 18:41:09.630571
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b7e2d9c8a14'
+down_revision: Union[str, Sequence[str], None] = 'e2f9b7c41d08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('outbox_events',
+    sa.Column('id', sa.BigInteger(), nullable=False),
+    sa.Column('event', sa.String(length=100), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('available_at', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('dispatched_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_outbox_events_pending', 'outbox_events', ['id'],
+        postgresql_where=sa.text('dispatched_at IS NULL'),
+    )
+
+    # Wake the dispatcher when a transaction that wrote events commits.
+    # One NOTIFY per statement is enough, the dispatcher reads everything pending.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION notify_outbox_event()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        PERFORM pg_notify('outbox', '');
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE TRIGGER trg_outbox_event_notify
+    AFTER INSERT ON outbox_events
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notify_outbox_event();
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+    DROP TRIGGER IF EXISTS trg_outbox_event_notify ON outbox_events;
+    DROP FUNCTION IF EXISTS notify_outbox_event();
+    """)
+    op.drop_index('ix_outbox_events_pending', table_name='outbox_events')
+    op.drop_table('outbox_events')
@@ -0,0 +1,105 @@
+"""statement-level ingre-hist trigger
+
+Revision ID: 868689effe48
+Revises: 501a3e6d1f9c
+Create Date: 2026-10-19 09:12:41.503117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '868689effe48'
+down_revision: Union[str, Sequence[str], None] = '501a3e6d1f9c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("""
+    DROP TRIGGER IF EXISTS trg_ingredient_history ON ingredients;
+    DROP FUNCTION IF EXISTS log_ingredient_quantity_change();
+    """)
+
+    # One invocation per UPDATE statement; all history rows are written in a single INSERT.
+    # The reason comes from the transaction-local setting app.ingredient_change_reason.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION log_ingredient_quantity_changes()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        INSERT INTO ingredient_histories (
+            ingredient_id,
+            old_quantity,
+            new_quantity,
+            quantity_change,
+            reason,
+            created_at
+        )
+        SELECT
+            n.id,
+            o.quantity,
+            n.quantity,
+            n.quantity - o.quantity,
+            NULLIF(current_setting('app.ingredient_change_reason', true), ''),
+            NOW()
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        WHERE n.quantity IS DISTINCT FROM o.quantity;
+
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE TRIGGER trg_ingredient_history
+    AFTER UPDATE ON ingredients
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION log_ingredient_quantity_changes();
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+    DROP TRIGGER IF EXISTS trg_ingredient_history ON ingredients;
+    DROP FUNCTION IF EXISTS log_ingredient_quantity_changes();
+    """)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION log_ingredient_quantity_change()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF NEW.quantity IS DISTINCT FROM OLD.quantity THEN
+            INSERT INTO ingredient_histories (
+                ingredient_id,
+                old_quantity,
+                new_quantity,
+                quantity_change,
+                created_at
+            )
+            VALUES (
+                OLD.id,
+                OLD.quantity,
+                NEW.quantity,
+                NEW.quantity - OLD.quantity,
+                NOW()
+            );
+        END IF;
+
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE TRIGGER trg_ingredient_history
+    AFTER UPDATE ON ingredients
+    FOR EACH ROW
+    EXECUTE FUNCTION log_ingredient_quantity_change();
+    """)
@@ -0,0 +1,46 @@
+"""dish recipe and stock consumption
+
+Revision ID: 970e7acffb91
+Revises: b39982120839
+Create Date: 2026-10-19 13:47:05.219846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '970e7acffb91'
+down_revision: Union[str, Sequence[str], None] = 'b39982120839'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('dish_ingredients',
+    sa.Column('dish_id', sa.Integer(), nullable=False),
+    sa.Column('ingredient_id', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['dish_id'], ['dishes.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['ingredient_id'], ['ingredients.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('dish_id', 'ingredient_id')
+    )
+    op.create_index('ix_dish_ingredients_ingredient_id', 'dish_ingredients', ['ingredient_id'])
+
+    op.add_column('order_items', sa.Column('stock_consumed', sa.Boolean(), server_default=sa.false(), nullable=False))
+    # Only served-but-not-yet-consumed items are ever looked up by the consumption sweep
+    op.create_index(
+        'ix_order_items_pending_consumption', 'order_items', ['order_id'],
+        postgresql_where=sa.text('NOT stock_consumed'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_order_items_pending_consumption', table_name='order_items')
+    op.drop_column('order_items', 'stock_consumed')
+    op.drop_index('ix_dish_ingredients_ingredient_id', table_name='dish_ingredients')
+    op.drop_table('dish_ingredients')
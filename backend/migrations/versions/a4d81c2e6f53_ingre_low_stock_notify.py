@@ -0,0 +1,108 @@
+"""ingre low stock notify
+
+Revision ID: a4d81c2e6f53
+Revises: 3c5e0f7a9b21
+Create Date: 2026-10-19 16:05:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d81c2e6f53'
+down_revision: Union[str, Sequence[str], None] = '3c5e0f7a9b21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Besides writing history, announce every ingredient that crossed below its threshold
+    # in this statement on the ingredient_low_stock channel. Notifications are delivered on
+    # commit only, in chunks of 100 to stay under the 8000 byte payload limit.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION log_ingredient_quantity_changes()
+    RETURNS TRIGGER AS $$
+    DECLARE
+        payload TEXT;
+    BEGIN
+        INSERT INTO ingredient_histories (
+            ingredient_id,
+            old_quantity,
+            new_quantity,
+            quantity_change,
+            reason,
+            stock_take_id,
+            created_at
+        )
+        SELECT
+            n.id,
+            o.quantity,
+            n.quantity,
+            n.quantity - o.quantity,
+            NULLIF(current_setting('app.ingredient_change_reason', true), ''),
+            NULLIF(current_setting('app.stock_take_id', true), '')::uuid,
+            NOW()
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        WHERE n.quantity IS DISTINCT FROM o.quantity;
+
+        FOR payload IN
+            SELECT json_agg(json_build_object(
+                'id', c.id,
+                'quantity', c.quantity,
+                'threshold', c.threshold
+            ))::text
+            FROM (
+                SELECT n.id, n.quantity, n.threshold,
+                       (row_number() OVER (ORDER BY n.id) - 1) / 100 AS chunk
+                FROM new_rows n
+                JOIN old_rows o ON o.id = n.id
+                WHERE COALESCE(n.quantity, 0) < COALESCE(n.threshold, 0)
+                  AND COALESCE(o.quantity, 0) >= COALESCE(o.threshold, 0)
+            ) c
+            GROUP BY c.chunk
+        LOOP
+            PERFORM pg_notify('ingredient_low_stock', payload);
+        END LOOP;
+
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+    CREATE OR REPLACE FUNCTION log_ingredient_quantity_changes()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        INSERT INTO ingredient_histories (
+            ingredient_id,
+            old_quantity,
+            new_quantity,
+            quantity_change,
+            reason,
+            stock_take_id,
+            created_at
+        )
+        SELECT
+            n.id,
+            o.quantity,
+            n.quantity,
+            n.quantity - o.quantity,
+            NULLIF(current_setting('app.ingredient_change_reason', true), ''),
+            NULLIF(current_setting('app.stock_take_id', true), '')::uuid,
+            NOW()
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        WHERE n.quantity IS DISTINCT FROM o.quantity;
+
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
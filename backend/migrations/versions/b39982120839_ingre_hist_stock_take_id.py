@@ -0,0 +1,90 @@
+"""ingre-hist stock take id
+
+Revision ID: b39982120839
+Revises: 868689effe48
+Create Date: 2026-10-19 11:02:17.884310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b39982120839'
+down_revision: Union[str, Sequence[str], None] = '868689effe48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('ingredient_histories', sa.Column('stock_take_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_index('ix_ingredient_histories_stock_take_id', 'ingredient_histories', ['stock_take_id'])
+
+    # Same statement-level trigger, now also tagging rows with app.stock_take_id
+    op.execute("""
+    CREATE OR REPLACE FUNCTION log_ingredient_quantity_changes()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        INSERT INTO ingredient_histories (
+            ingredient_id,
+            old_quantity,
+            new_quantity,
+            quantity_change,
+            reason,
+            stock_take_id,
+            created_at
+        )
+        SELECT
+            n.id,
+            o.quantity,
+            n.quantity,
+            n.quantity - o.quantity,
+            NULLIF(current_setting('app.ingredient_change_reason', true), ''),
+            NULLIF(current_setting('app.stock_take_id', true), '')::uuid,
+            NOW()
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        WHERE n.quantity IS DISTINCT FROM o.quantity;
+
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+    CREATE OR REPLACE FUNCTION log_ingredient_quantity_changes()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        INSERT INTO ingredient_histories (
+            ingredient_id,
+            old_quantity,
+            new_quantity,
+            quantity_change,
+            reason,
+            created_at
+        )
+        SELECT
+            n.id,
+            o.quantity,
+            n.quantity,
+            n.quantity - o.quantity,
+            NULLIF(current_setting('app.ingredient_change_reason', true), ''),
+            NOW()
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        WHERE n.quantity IS DISTINCT FROM o.quantity;
+
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.drop_index('ix_ingredient_histories_stock_take_id', table_name='ingredient_histories')
+    op.drop_column('ingredient_histories', 'stock_take_id')
@@ -0,0 +1,128 @@
+"""order item status histories
+
+Revision ID: b83f1d6e2a57
+Revises: 5b7e2d9c8a14
+Create Date: 2026-10-19 20:12:44.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b83f1d6e2a57'
+down_revision: Union[str, Sequence[str], None] = '5b7e2d9c8a14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ORDER_ITEM_STATUS_READY = 3
+# LN(GAMMA) for utils.sketch (RELATIVE_ACCURACY = 0.02): bucket = CEIL(LN(seconds) / LN_GAMMA)
+LN_GAMMA = 0.040005334613699206
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('order_item_status_histories',
+    sa.Column('id', sa.BigInteger(), nullable=False),
+    sa.Column('order_item_id', sa.Integer(), nullable=False),
+    sa.Column('old_status_id', sa.SmallInteger(), nullable=True),
+    sa.Column('new_status_id', sa.SmallInteger(), nullable=False),
+    sa.Column('changed_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_order_item_status_histories_item_changed_at', 'order_item_status_histories',
+        ['order_item_id', 'changed_at'],
+    )
+    op.create_table('order_item_prep_time_sketches',
+    sa.Column('dish_id', sa.Integer(), nullable=False),
+    sa.Column('hour', sa.DateTime(), nullable=False),
+    sa.Column('bucket', sa.SmallInteger(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('dish_id', 'hour', 'bucket')
+    )
+    op.create_index('ix_order_item_prep_time_sketches_hour', 'order_item_prep_time_sketches', ['hour'])
+
+    # One INSERT per statement however many items it touched (bulk kitchen transitions
+    # included). Items reaching READY also add their prep time, measured from the insert,
+    # to the per-dish hourly sketch, so reading percentiles never scans the history.
+    op.execute("""
+    CREATE OR REPLACE FUNCTION log_order_item_inserts()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        INSERT INTO order_item_status_histories (order_item_id, old_status_id, new_status_id, changed_at)
+        SELECT n.id, NULL, n.status_id, timezone('utc', NOW())
+        FROM new_rows n
+        WHERE n.status_id IS NOT NULL;
+
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute(f"""
+    CREATE OR REPLACE FUNCTION log_order_item_status_changes()
+    RETURNS TRIGGER AS $$
+    DECLARE
+        now_utc TIMESTAMP := timezone('utc', NOW());
+    BEGIN
+        INSERT INTO order_item_status_histories (order_item_id, old_status_id, new_status_id, changed_at)
+        SELECT n.id, o.status_id, n.status_id, now_utc
+        FROM new_rows n
+        JOIN old_rows o ON o.id = n.id
+        WHERE n.status_id IS DISTINCT FROM o.status_id
+          AND n.status_id IS NOT NULL;
+
+        INSERT INTO order_item_prep_time_sketches (dish_id, hour, bucket, count)
+        SELECT
+            r.dish_id,
+            date_trunc('hour', now_utc),
+            CEIL(LN(GREATEST(EXTRACT(EPOCH FROM now_utc - h.changed_at), 1)) / {LN_GAMMA})::smallint AS bucket,
+            COUNT(*)
+        FROM new_rows r
+        JOIN old_rows o ON o.id = r.id
+        JOIN order_item_status_histories h
+          ON h.order_item_id = r.id AND h.old_status_id IS NULL
+        WHERE r.status_id = {ORDER_ITEM_STATUS_READY}
+          AND o.status_id IS DISTINCT FROM {ORDER_ITEM_STATUS_READY}
+          AND r.dish_id IS NOT NULL
+        GROUP BY r.dish_id, bucket
+        ON CONFLICT (dish_id, hour, bucket)
+        DO UPDATE SET count = order_item_prep_time_sketches.count + EXCLUDED.count;
+
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+    CREATE TRIGGER trg_order_item_insert_history
+    AFTER INSERT ON order_items
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION log_order_item_inserts();
+    """)
+
+    op.execute("""
+    CREATE TRIGGER trg_order_item_status_history
+    AFTER UPDATE ON order_items
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION log_order_item_status_changes();
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+    DROP TRIGGER IF EXISTS trg_order_item_status_history ON order_items;
+    DROP TRIGGER IF EXISTS trg_order_item_insert_history ON order_items;
+    DROP FUNCTION IF EXISTS log_order_item_status_changes();
+    DROP FUNCTION IF EXISTS log_order_item_inserts();
+    """)
+    op.drop_index('ix_order_item_prep_time_sketches_hour', table_name='order_item_prep_time_sketches')
+    op.drop_table('order_item_prep_time_sketches')
+    op.drop_index('ix_order_item_status_histories_item_changed_at', table_name='order_item_status_histories')
+    op.drop_table('order_item_status_histories')
@@ -0,0 +1,55 @@
+"""order timestamps brin
+
+Revision ID: c5a92e4f7b13
+Revises: b83f1d6e2a57
+Create Date: 2026-10-19 21:03:27.904416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a92e4f7b13'
+down_revision: Union[str, Sequence[str], None] = 'b83f1d6e2a57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UTC_NOW = sa.text("timezone('utc', now())")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing orders get the migration time as created_at; their real time is unknown.
+    op.add_column('orders', sa.Column('created_at', sa.DateTime(), server_default=UTC_NOW, nullable=False))
+    op.add_column('orders', sa.Column('completed_at', sa.DateTime(), nullable=True))
+    op.alter_column('feedbacks', 'created_at', server_default=UTC_NOW)
+    op.alter_column('payments', 'paid_at', server_default=UTC_NOW)
+
+    # BRIN keeps one min/max summary per 32 pages: a few kB for millions of rows, and a
+    # date-range scan only visits the page ranges that can match.
+    op.create_index(
+        'ix_orders_created_at_brin', 'orders', ['created_at'],
+        postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+    )
+    op.create_index(
+        'ix_feedbacks_created_at_brin', 'feedbacks', ['created_at'],
+        postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+    )
+    op.create_index(
+        'ix_payments_paid_at_brin', 'payments', ['paid_at'],
+        postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_payments_paid_at_brin', table_name='payments')
+    op.drop_index('ix_feedbacks_created_at_brin', table_name='feedbacks')
+    op.drop_index('ix_orders_created_at_brin', table_name='orders')
+    op.alter_column('payments', 'paid_at', server_default=None)
+    op.alter_column('feedbacks', 'created_at', server_default=None)
+    op.drop_column('orders', 'completed_at')
+    op.drop_column('orders', 'created_at')
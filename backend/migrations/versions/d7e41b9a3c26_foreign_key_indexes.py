@@ -0,0 +1,63 @@
+"""foreign key indexes
+
+Revision ID: d7e41b9a3c26
+Revises: c5a92e4f7b13
+Create Date: 2026-10-19 21:47:12.266035
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7e41b9a3c26'
+down_revision: Union[str, Sequence[str], None] = 'c5a92e4f7b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index, table, column). ingredient_histories.ingredient_id is already the leading
+# column of ix_ingredient_histories_ingredient_id_created_at and needs nothing here.
+INDEXES = [
+    ('ix_order_items_order_id', 'order_items', 'order_id'),
+    ('ix_order_items_dish_id', 'order_items', 'dish_id'),
+    ('ix_orders_table_id', 'orders', 'table_id'),
+    ('ix_orders_status_id', 'orders', 'status_id'),
+    ('ix_orders_guest_id', 'orders', 'guest_id'),
+    ('ix_payments_booking_id', 'payments', 'booking_id'),
+    ('ix_payments_status_id', 'payments', 'status_id'),
+    ('ix_feedbacks_order_id', 'feedbacks', 'order_id'),
+    ('ix_dish_tags_tag_id', 'dish_tags', 'tag_id'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY builds without blocking writes but cannot run inside a transaction.
+    # A failed concurrent build leaves an INVALID index behind; IF NOT EXISTS would keep it,
+    # so drop any leftover first and the migration can simply be re-run.
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            if _is_invalid(name):
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            op.create_index(
+                name, table, [column],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def _is_invalid(name: str) -> bool:
+    result = op.get_bind().execute(sa.text(
+        "SELECT NOT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+        "WHERE c.relname = :name"
+    ), {"name": name})
+    return bool(result.scalar())
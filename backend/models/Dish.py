@@ -12,6 +12,7 @@ class Dish(Base):
     image_url = Column(String(500), nullable=True)  # URL to Supabase storage
 
     order_items = relationship("OrderItem", back_populates="dish")
+    recipe_items = relationship("DishIngredient", back_populates="dish", cascade="all, delete-orphan")
 
     # Many-to-many relationship with tags
     tags = relationship(
@@ -1,17 +1,21 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Text, DateTime
+from sqlalchemy import Column, Index, Integer, String, ForeignKey, Text, DateTime, text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from configs.postgre import Base
 
 class Feedback(Base):
     __tablename__ = "feedbacks"
+    __table_args__ = (
+        Index("ix_feedbacks_created_at_brin", "created_at", postgresql_using="brin",
+              postgresql_with={"pages_per_range": 32}),
+    )
 
     id = Column(Integer, primary_key=True)
-    order_id = Column(Integer, ForeignKey("orders.id"), nullable=True)  
+    order_id = Column(Integer, ForeignKey("orders.id"), nullable=True, index=True)  
     # optional link to order
 
     comment = Column(Text, nullable=False)
     rating = Column(Integer, nullable=True)  # 1-5 stars
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=text("timezone('utc', now())"))
 
     order = relationship("Order", back_populates="feedbacks")
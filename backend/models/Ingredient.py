@@ -1,5 +1,6 @@
 from datetime import datetime
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Float
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Float
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from configs.postgre import Base
 
@@ -26,10 +27,14 @@ class Ingredient(Base):
         back_populates="ingredient",
         cascade="all, delete-orphan"
     )
+    recipe_items = relationship("DishIngredient", back_populates="ingredient", cascade="all, delete-orphan")
 
 
 class IngredientHistory(Base):
     __tablename__ = "ingredient_histories"
+    __table_args__ = (
+        Index("ix_ingredient_histories_ingredient_id_created_at", "ingredient_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True)
     ingredient_id = Column(Integer, ForeignKey("ingredients.id"), nullable=False)
@@ -37,6 +42,7 @@ class IngredientHistory(Base):
     new_quantity = Column(Float, nullable=False)
     quantity_change = Column(Float, nullable=False)  
     reason = Column(String(255), nullable=True)
+    stock_take_id = Column(UUID(as_uuid=True), nullable=True, index=True)  # shared by rows of one bulk adjustment
     created_at = Column(DateTime, default=datetime.utcnow)    
 
     ingredient = relationship("Ingredient", back_populates="histories")
@@ -0,0 +1,53 @@
+from datetime import datetime
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from configs.postgre import Base
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_SUCCEEDED = "succeeded"
+JOB_STATUS_FAILED = "failed"
+
+
+class Job(Base):
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_running_locked_at", "locked_at", postgresql_where=text("status = 'running'")),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    name = Column(String(100), nullable=False)             # key in the job registry
+    payload = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    status = Column(String(20), nullable=False, server_default=JOB_STATUS_QUEUED)
+    priority = Column(Integer, nullable=False, server_default="0")   # higher runs first
+    attempts = Column(Integer, nullable=False, server_default="0")
+    max_attempts = Column(Integer, nullable=False, server_default="5")
+    run_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_at = Column(DateTime, nullable=True)
+    locked_by = Column(String(100), nullable=True)
+    last_error = Column(Text, nullable=True)
+    schedule_id = Column(Integer, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+
+# Workers only ever scan runnable jobs, in claim order
+Index(
+    "ix_jobs_runnable",
+    Job.priority.desc(),
+    Job.run_at,
+    postgresql_where=text("status = 'queued'"),
+)
+
+
+class JobSchedule(Base):
+    __tablename__ = "job_schedules"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False, unique=True)
+    job_name = Column(String(100), nullable=False)
+    cron = Column(String(100), nullable=False)              # 5-field cron expression, UTC
+    payload = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    enabled = Column(Boolean, nullable=False, server_default=text("true"))
+    next_run_at = Column(DateTime, nullable=False)
+    last_run_at = Column(DateTime, nullable=True)
@@ -1,6 +1,7 @@
+from datetime import datetime
 from configs.postgre import Base
 from sqlalchemy.orm import relationship
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, DateTime, Index, Integer, String, ForeignKey, text
 
 
 class OrderStatus(Base):
@@ -14,11 +15,19 @@ class OrderStatus(Base):
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # Rows are appended in created_at order, so a BRIN range index stays tiny and exact enough
+        Index("ix_orders_created_at_brin", "created_at", postgresql_using="brin",
+              postgresql_with={"pages_per_range": 32}),
+    )
 
     id = Column(Integer, primary_key=True)
-    table_id = Column(Integer, ForeignKey("tables.id"))
-    status_id = Column(Integer, ForeignKey("order_statuses.id"))
-    guest_id = Column(Integer, ForeignKey("guests.id"), nullable=True)
+    table_id = Column(Integer, ForeignKey("tables.id"), index=True)
+    status_id = Column(Integer, ForeignKey("order_statuses.id"), index=True)
+    guest_id = Column(Integer, ForeignKey("guests.id"), nullable=True, index=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow,
+                        server_default=text("timezone('utc', now())"))
+    completed_at = Column(DateTime, nullable=True)
 
     table = relationship("Table", back_populates="orders")
     items = relationship("OrderItem", back_populates="order", cascade="all, delete-orphan")
@@ -1,6 +1,14 @@
+from datetime import datetime
 from configs.postgre import Base 
 from sqlalchemy.orm import relationship
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import (BigInteger, Boolean, Column, DateTime, Index, Integer, PrimaryKeyConstraint,
+    SmallInteger, String, ForeignKey, false, text)
+
+# Seeded order_item_statuses ids the code relies on
+ORDER_ITEM_STATUS_PENDING = 1
+ORDER_ITEM_STATUS_COOKING = 2
+ORDER_ITEM_STATUS_READY = 3
+ORDER_ITEM_STATUS_SERVED = 4
 
 class OrderItemStatus(Base):
     __tablename__ = "order_item_statuses"
@@ -12,13 +20,52 @@ class OrderItemStatus(Base):
 
 class OrderItem(Base):
     __tablename__ = "order_items"
+    __table_args__ = (
+        Index("ix_order_items_pending_consumption", "order_id", postgresql_where=text("NOT stock_consumed")),
+    )
 
     id = Column(Integer, primary_key=True)
-    order_id = Column(Integer, ForeignKey("orders.id"))
-    dish_id = Column(Integer, ForeignKey("dishes.id"))
+    order_id = Column(Integer, ForeignKey("orders.id"), index=True)
+    dish_id = Column(Integer, ForeignKey("dishes.id"), index=True)
     quantity = Column(Integer, default=1)
     status_id = Column(Integer, ForeignKey("order_item_statuses.id"))
+    # Set once the item's recipe has been deducted from ingredient stock
+    stock_consumed = Column(Boolean, nullable=False, default=False, server_default=false())
 
     order = relationship("Order", back_populates="items")
     dish = relationship("Dish", back_populates="order_items")
-    status = relationship("OrderItemStatus", back_populates="order_items")
\ No newline at end of file
+    status = relationship("OrderItemStatus", back_populates="order_items")
+
+
+class OrderItemStatusHistory(Base):
+    """
+    One row per status change, written by statement-level triggers on order_items
+    (old_status_id is NULL for the insert). No foreign key, so the log outlives deleted items.
+    """
+    __tablename__ = "order_item_status_histories"
+    __table_args__ = (
+        Index("ix_order_item_status_histories_item_changed_at", "order_item_id", "changed_at"),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    order_item_id = Column(Integer, nullable=False)
+    old_status_id = Column(SmallInteger, nullable=True)
+    new_status_id = Column(SmallInteger, nullable=False)
+    changed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class OrderItemPrepTimeSketch(Base):
+    """
+    Prep time (insert -> ready) histograms per dish and hour, maintained by the same trigger.
+    Each row is one log-scale bucket (see utils.sketch), so any set of rows merges by summing counts.
+    """
+    __tablename__ = "order_item_prep_time_sketches"
+    __table_args__ = (
+        PrimaryKeyConstraint("dish_id", "hour", "bucket"),
+        Index("ix_order_item_prep_time_sketches_hour", "hour"),
+    )
+
+    dish_id = Column(Integer, nullable=False)
+    hour = Column(DateTime, nullable=False)         # start of the UTC hour the item became ready
+    bucket = Column(SmallInteger, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,21 @@
+from datetime import datetime
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import JSONB
+from configs.postgre import Base
+
+
+class OutboxEvent(Base):
+    __tablename__ = "outbox_events"
+    __table_args__ = (
+        # The dispatcher only ever reads undelivered events, oldest first
+        Index("ix_outbox_events_pending", "id", postgresql_where=text("dispatched_at IS NULL")),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    event = Column(String(100), nullable=False)
+    payload = Column(JSONB, nullable=False)
+    attempts = Column(Integer, nullable=False, server_default="0")
+    last_error = Column(Text, nullable=True)
+    available_at = Column(DateTime, nullable=False, default=datetime.utcnow)  # pushed back on failed delivery
+    created_at = Column(DateTime, default=datetime.utcnow)
+    dispatched_at = Column(DateTime, nullable=True)
@@ -1,6 +1,6 @@
 from configs.postgre import Base
 from sqlalchemy.orm import relationship
-from sqlalchemy import Column, Integer, Numeric, String, ForeignKey, DateTime
+from sqlalchemy import Column, Index, Integer, Numeric, String, ForeignKey, DateTime, text
 from datetime import datetime
 
 
@@ -36,9 +36,14 @@ class PaymentStatus(Base):
 
 class Payment(Base):
     __tablename__ = "payments"
+    __table_args__ = (
+        # paid_at is set on insert and only moves forward on success, so it tracks insert order
+        Index("ix_payments_paid_at_brin", "paid_at", postgresql_using="brin",
+              postgresql_with={"pages_per_range": 32}),
+    )
 
     id = Column(Integer, primary_key=True)
-    booking_id = Column(Integer, ForeignKey("orders.id"), nullable=False)
+    booking_id = Column(Integer, ForeignKey("orders.id"), nullable=False, index=True)
     currency = Column(String(3), nullable=False)
     amount = Column(Numeric(18, 2), nullable=False)
     method_id = Column(Integer, ForeignKey("payment_methods.id"), nullable=False)
@@ -46,8 +51,8 @@ class Payment(Base):
     provider_transaction_id = Column(String(255), unique=True, nullable=False)
     gateway_txn_ref = Column(String(255), nullable=True)
     expired_at = Column(DateTime(timezone=True), nullable=True)
-    paid_at = Column(DateTime, default=datetime.utcnow)
-    status_id = Column(Integer, ForeignKey("payment_statuses.id"), nullable=False)
+    paid_at = Column(DateTime, default=datetime.utcnow, server_default=text("timezone('utc', now())"))
+    status_id = Column(Integer, ForeignKey("payment_statuses.id"), nullable=False, index=True)
     method = relationship("PaymentMethod", back_populates="payments")
     provider = relationship("PaymentProvider", back_populates="payments")
     status = relationship("PaymentStatus", back_populates="payments")
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Float, ForeignKey, Integer
+from sqlalchemy.orm import relationship
+from configs.postgre import Base
+
+class DishIngredient(Base):
+    """Recipe line: how much of an ingredient one portion of a dish consumes."""
+    __tablename__ = "dish_ingredients"
+
+    dish_id = Column(Integer, ForeignKey("dishes.id", ondelete="CASCADE"), primary_key=True)
+    ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="CASCADE"), primary_key=True, index=True)
+    quantity = Column(Float, nullable=False)  # in the ingredient's unit, per portion
+
+    dish = relationship("Dish", back_populates="recipe_items")
+    ingredient = relationship("Ingredient", back_populates="recipe_items")
@@ -7,7 +7,7 @@ dish_tags_association = Table(
     'dish_tags',
     Base.metadata,
     Column('dish_id', Integer, ForeignKey('dishes.id', ondelete='CASCADE'), primary_key=True),
-    Column('tag_id', Integer, ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True)
+    Column('tag_id', Integer, ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True, index=True)
 )
 
 
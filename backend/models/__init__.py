@@ -3,9 +3,12 @@ from .Equipment import Equipment, EquipmentType, EquipmentStatus
 from .Feedback import Feedback
 from .Ingredient import Ingredient, IngredientUnit, IngredientHistory
 from .Order import Order, OrderStatus
-from .OrderItem import OrderItem, OrderItemStatus
+from .OrderItem import OrderItem, OrderItemStatus, OrderItemStatusHistory, OrderItemPrepTimeSketch
 from .Table import Table, TableStatus
 from .User import User, Role
 from .Payment import Payment, PaymentMethod, PaymentProvider, PaymentStatus
 from .Guest import Guest
-from .Tag import Tag, dish_tags_association
\ No newline at end of file
+from .Tag import Tag, dish_tags_association
+from .Recipe import DishIngredient
+from .Job import Job, JobSchedule
+from .Outbox import OutboxEvent
@@ -0,0 +1,92 @@
+from typing import TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+S = TypeVar("S", bound=BaseModel)
+
+
+def returning_columns(model, schema: type[BaseModel]) -> list:
+    """Columns of model's table that the schema reads, in schema field order."""
+    columns = model.__table__.c
+    return [columns[name] for name in schema.model_fields if name in columns]
+
+
+def changed_fields(data: BaseModel) -> dict:
+    """Fields of a partial update payload that were actually set (None means unchanged)."""
+    return {k: v for k, v in data.model_dump().items() if v is not None}
+
+
+def constraint_violated(exc: IntegrityError, constraint: str) -> bool:
+    """
+    Whether the error came from the named constraint (Postgres defaults: <table>_<column>_key
+    for unique, <table>_<column>_fkey for foreign keys). Lets a write rely on the constraint
+    instead of a SELECT beforehand.
+    """
+    return constraint in str(exc.orig)
+
+
+def _one_as(result, schema: type[S]) -> S | None:
+    row = result.one_or_none()
+    return schema.model_validate(dict(row._mapping)) if row is not None else None
+
+
+async def insert_returning(db: AsyncSession, model, values: dict, schema: type[S]) -> S:
+    result = await db.execute(
+        insert(model.__table__).values(**values).returning(*returning_columns(model, schema))
+    )
+    return schema.model_validate(dict(result.one()._mapping))
+
+
+async def update_returning(db: AsyncSession, model, ident: int, values: dict, schema: type[S], *where) -> S | None:
+    """Update one row by id; None if it does not exist (or does not match `where`)."""
+    if not values:
+        return await select_as(db, model, ident, schema)
+    table = model.__table__
+    result = await db.execute(
+        update(table)
+        .where(table.c.id == ident, *where)
+        .values(**values)
+        .returning(*returning_columns(model, schema))
+    )
+    return _one_as(result, schema)
+
+
+async def delete_returning(db: AsyncSession, model, ident: int, schema: type[S], *where) -> S | None:
+    table = model.__table__
+    result = await db.execute(
+        delete(table).where(table.c.id == ident, *where).returning(*returning_columns(model, schema))
+    )
+    return _one_as(result, schema)
+
+
+async def select_as(db: AsyncSession, model, ident: int, schema: type[S]) -> S | None:
+    table = model.__table__
+    result = await db.execute(select(*returning_columns(model, schema)).where(table.c.id == ident))
+    return _one_as(result, schema)
+
+
+class BaseRepository:
+    """
+    Writes as single statements: INSERT / UPDATE / DELETE ... RETURNING the columns of a
+    read schema, mapped straight to it. This replaces add -> commit -> refresh (and
+    select -> update -> refresh) with one round trip plus the commit.
+    Statements go to the table, not the ORM, so nothing is left in the identity map to go
+    stale. Read schemas with relationship fields still need a SELECT.
+    """
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _insert_returning(self, model, values: dict, schema: type[S]) -> S:
+        return await insert_returning(self.db, model, values, schema)
+
+    async def _update_returning(self, model, ident: int, values: dict, schema: type[S], *where) -> S | None:
+        return await update_returning(self.db, model, ident, values, schema, *where)
+
+    async def _delete_returning(self, model, ident: int, schema: type[S], *where) -> S | None:
+        return await delete_returning(self.db, model, ident, schema, *where)
+
+    async def _get_as(self, model, ident: int, schema: type[S]) -> S | None:
+        return await select_as(self.db, model, ident, schema)
@@ -1,6 +1,11 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, delete, select, update
-from models import Order, Table, Guest, TableStatus
+from datetime import datetime
+
+from sqlalchemy import and_, lambda_stmt, select, update
+from sqlalchemy.exc import IntegrityError
+from models import Order, Table
+from repository.base import BaseRepository, constraint_violated
+from repository.outbox import add_outbox_event
+from repository.resources import RecipeRepository
 
 from schemas.booking import (
     OrderCreate,
@@ -14,53 +19,45 @@ TABLE_STATUS_SERVING = 2
 
 ORDER_STATUS_COMPLETED = 5
 
-class OrderRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
+class OrderRepository(BaseRepository):
     async def create_order(self, data: OrderCreate) -> OrderRead:
         """
         Create a new order at a table.
         Validates table and guest exist (if provided).
         Updates table status to SERVING when order is created.
         """
-        # Validate table exists
-        table = await self.db.execute(
-            select(Table).where(Table.id == data.table_id)
+        # Claim the table: AVAILABLE -> SERVING in one statement, which also validates it
+        claimed = await self.db.execute(
+            update(Table)
+            .where(Table.id == data.table_id, Table.status_id == TABLE_STATUS_AVAILABLE)
+            .values(status_id=TABLE_STATUS_SERVING)
+            .returning(Table.id)
+            .execution_options(synchronize_session=False)
         )
-        table_obj = table.scalar_one_or_none()
-        if table_obj is None:
-            raise ValueError(f"Table with id {data.table_id} does not exist.")
-        if table_obj.status_id != TABLE_STATUS_AVAILABLE:
+        if claimed.scalar_one_or_none() is None:
+            exists = await self.db.scalar(select(Table.id).where(Table.id == data.table_id))
+            if exists is None:
+                raise ValueError(f"Table with id {data.table_id} does not exist.")
             raise ValueError(f"Table with id {data.table_id} is not available.")
 
-        # Validate guest if provided
-        if data.guest_id is not None:
-            guest = await self.db.execute(
-                select(Guest).where(Guest.id == data.guest_id)
-            )
-            if guest.scalar_one_or_none() is None:
-                raise ValueError(f"Guest with id {data.guest_id} does not exist.")
-
         # Create order with default status_id = 1 (pending) if not provided
         status_id = data.status_id if data.status_id is not None else 1
-        
-        order = Order(
-            table_id=data.table_id,
-            status_id=status_id,
-            guest_id=data.guest_id,
-        )
-        self.db.add(order)
-        
-        # Update table status to SERVING
-        await self.db.execute(
-            update(Table).where(Table.id == data.table_id).values(status_id=TABLE_STATUS_SERVING)
-        )
 
-        await self.db.commit()
-        await self.db.refresh(order)
+        try:
+            result = await self._insert_returning(
+                Order,
+                {"table_id": data.table_id, "status_id": status_id, "guest_id": data.guest_id},
+                OrderRead,
+            )
+            add_outbox_event(self.db, "order_created", result)
+            await self.db.flush()
+        except IntegrityError as e:
+            await self.db.rollback()
+            if constraint_violated(e, "orders_guest_id_fkey"):
+                raise ValueError(f"Guest with id {data.guest_id} does not exist.")
+            raise
 
-        return OrderRead.model_validate(order)
+        return result
 
     async def get_all_orders(self, filters: OrderFilter) -> list[OrderRead]:
         """Get all orders with optional filters"""
@@ -73,6 +70,10 @@ class OrderRepository:
             conditions.append(Order.status_id == filters.status_id)
         if filters.guest_id is not None:
             conditions.append(Order.guest_id == filters.guest_id)
+        if filters.created_from is not None:
+            conditions.append(Order.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            conditions.append(Order.created_at < filters.created_to)
 
         if conditions:
             query = query.where(and_(*conditions))
@@ -84,8 +85,10 @@ class OrderRepository:
 
     async def get_order_by_id(self, order_id: int) -> OrderRead | None:
         """Get order by id"""
+        # Hot lookups are lambda statements: built and cache-keyed once per call site, with
+        # the closure variable (order_id) bound as a parameter on every later call
         result = await self.db.execute(
-            select(Order).where(Order.id == order_id)
+            lambda_stmt(lambda: select(Order).where(Order.id == order_id))
         )
         order = result.scalar_one_or_none()
         
@@ -98,21 +101,6 @@ class OrderRepository:
         self, order_id: int, data: OrderUpdate
     ) -> OrderRead | None:
         """Update order status or guest_id"""
-        order = await self.db.execute(
-            select(Order).where(Order.id == order_id)
-        )
-        order = order.scalar_one_or_none()
-        if order is None:
-            return None
-
-        # Validate guest if provided
-        if data.guest_id is not None:
-            guest = await self.db.execute(
-                select(Guest).where(Guest.id == data.guest_id)
-            )
-            if guest.scalar_one_or_none() is None:
-                raise ValueError(f"Guest with id {data.guest_id} does not exist.")
-
         update_data = {}
         if data.status_id is not None:
             update_data["status_id"] = data.status_id
@@ -120,30 +108,26 @@ class OrderRepository:
             update_data["guest_id"] = data.guest_id
 
         if not update_data:
-            return OrderRead.model_validate(order)
-
-        await self.db.execute(
-            update(Order).where(Order.id == order_id).values(**update_data)
-        )
-        await self.db.commit()
-        await self.db.refresh(order)
+            return await self._get_as(Order, order_id, OrderRead)
+
+        try:
+            result = await self._update_returning(Order, order_id, update_data, OrderRead)
+            if result is None:
+                return None
+            add_outbox_event(self.db, "order_updated", result)
+            await self.db.flush()
+        except IntegrityError as e:
+            await self.db.rollback()
+            if constraint_violated(e, "orders_guest_id_fkey"):
+                raise ValueError(f"Guest with id {data.guest_id} does not exist.")
+            raise
 
-        return OrderRead.model_validate(order)
+        return result
 
     async def delete_order(self, order_id: int) -> OrderRead | None:
         """Delete order (cascade deletes items)"""
-        order = await self.db.execute(
-            select(Order).where(Order.id == order_id)
-        )
-        order = order.scalar_one_or_none()
-        if order is None:
-            return None
-
-        # Get data before deletion for response
-        result = OrderRead.model_validate(order)
-
-        await self.db.execute(delete(Order).where(Order.id == order_id))
-        await self.db.commit()
+        result = await self._delete_returning(Order, order_id, OrderRead)
+        await self.db.flush()
 
         return result
 
@@ -152,25 +136,25 @@ class OrderRepository:
         Complete an order: sets order status to COMPLETED (5) 
         and table status back to AVAILABLE (1)
         """
-        order = await self.db.execute(
-            select(Order).where(Order.id == order_id)
-        )
-        order = order.scalar_one_or_none()
-        
-        if order is None:
-            raise ValueError(f"Order with id {order_id} does not exist.")
-        
         # Update order status to COMPLETED
-        await self.db.execute(
-            update(Order).where(Order.id == order_id).values(status_id=ORDER_STATUS_COMPLETED)
+        result = await self._update_returning(
+            Order, order_id,
+            {"status_id": ORDER_STATUS_COMPLETED, "completed_at": datetime.utcnow()},
+            OrderRead,
         )
+        if result is None:
+            raise ValueError(f"Order with id {order_id} does not exist.")
         
         # Update table status to AVAILABLE
         await self.db.execute(
-            update(Table).where(Table.id == order.table_id).values(status_id=TABLE_STATUS_AVAILABLE)
+            update(Table).where(Table.id == result.table_id).values(status_id=TABLE_STATUS_AVAILABLE)
         )
+
+        # Deduct ingredient stock for everything served on this order in one batch
+        await RecipeRepository(self.db).consume_served_items(order_id)
+
+        add_outbox_event(self.db, "order_completed", result)
         
-        await self.db.commit()
-        await self.db.refresh(order)
+        await self.db.flush()
         
-        return OrderRead.model_validate(order)
\ No newline at end of file
+        return result
\ No newline at end of file
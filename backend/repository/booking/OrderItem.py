@@ -1,34 +1,47 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, delete, select, update
+from sqlalchemy import ARRAY, Integer, and_, any_, lambda_stmt, literal, select, update
 from sqlalchemy.orm import selectinload
 from models import OrderItem
+from models.OrderItem import (ORDER_ITEM_STATUS_COOKING, ORDER_ITEM_STATUS_PENDING, ORDER_ITEM_STATUS_READY,
+    ORDER_ITEM_STATUS_SERVED)
+from repository.base import BaseRepository, changed_fields
+from repository.outbox import add_outbox_event
 from schemas.booking import (
     OrderItemCreate,
     OrderItemRead,
     OrderItemUpdate,
     OrderItemFilter,
-    OrderItemBase
+    OrderItemBase,
+    OrderItemBulkTransition,
+    OrderItemBulkTransitionRead,
 )
 
-class OrderItemRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
+_allowed_transitions = {
+    ORDER_ITEM_STATUS_PENDING: {ORDER_ITEM_STATUS_COOKING, ORDER_ITEM_STATUS_READY},
+    ORDER_ITEM_STATUS_COOKING: {ORDER_ITEM_STATUS_READY},
+    ORDER_ITEM_STATUS_READY: {ORDER_ITEM_STATUS_SERVED},
+}
 
+
+def _sources_for(target: int) -> set[int]:
+    """Statuses an item may move to target from."""
+    return {current for current, targets in _allowed_transitions.items() if target in targets}
+
+
+class OrderItemRepository(BaseRepository):
     async def create_order_item(self, data: OrderItemCreate) -> OrderItemBase:
-        order_item = OrderItem(**data.model_dump())
-        self.db.add(order_item)
-        await self.db.commit()
-        await self.db.refresh(order_item)
-        return OrderItemBase.model_validate(order_item)
+        result = await self._insert_returning(OrderItem, data.model_dump(), OrderItemBase)
+        add_outbox_event(self.db, "order_item_created", result)
+        await self.db.flush()
+        return result
 
     async def get_order_item_by_id(self, order_item_id: int) -> OrderItemRead | None:
         result = await self.db.execute(
-            select(OrderItem)
+            lambda_stmt(lambda: select(OrderItem)
             .options(
                 selectinload(OrderItem.dish),
                 selectinload(OrderItem.status)
             )
-            .where(OrderItem.id == order_item_id)  
+            .where(OrderItem.id == order_item_id))
         )
         order_item = result.scalar_one_or_none()
 
@@ -61,52 +74,89 @@ class OrderItemRepository:
         return [OrderItemRead.model_validate(item) for item in order_items]
     
     async def update_order_item(self, order_item_id: int, data: OrderItemUpdate) -> OrderItemBase | None:
-        result = await self.db.execute(
-            select(OrderItem).where(OrderItem.id == order_item_id)
-        )
-        order_item = result.scalar_one_or_none()
-
-        if order_item is None:
-            return None
-
-        update_data = {k: v for k, v in data.model_dump().items() if v is not None}
+        update_data = changed_fields(data)
         if not update_data:
-            return order_item
-
-        await self.db.execute(
-            update(OrderItem)
-            .where(OrderItem.id == order_item_id)
-            .values(**update_data)
-        )
-        await self.db.commit()
+            return await self._get_as(OrderItem, order_item_id, OrderItemBase)
 
-        await self.db.refresh(order_item)
-        return OrderItemBase.model_validate(order_item)
-    
-    async def delete_order_item(self, order_item_id: int) -> OrderItemBase | None:
-        result = await self.db.execute(
-            select(OrderItem).where(OrderItem.id == order_item_id)
-        )
-        order_item = result.scalar_one_or_none()
+        where = []
+        if "status_id" in update_data:
+            # Same rules as the bulk transition endpoint; keeping the current status is allowed
+            target = update_data["status_id"]
+            where.append(OrderItem.status_id.in_(_sources_for(target) | {target}))
 
-        if order_item is None:
+        result = await self._update_returning(OrderItem, order_item_id, update_data, OrderItemBase, *where)
+        if result is None:
+            if where and await self._get_as(OrderItem, order_item_id, OrderItemBase) is not None:
+                raise ValueError("INVALID_STATUS_TRANSITION")
             return None
+        add_outbox_event(self.db, "order_item_updated", result)
+        await self.db.flush()
 
-        await self.db.execute(
-            delete(OrderItem).where(OrderItem.id == order_item_id)
-        )
-        await self.db.commit()
-        return OrderItemBase.model_validate(order_item)
+        return result
+    
+    async def delete_order_item(self, order_item_id: int) -> OrderItemBase | None:
+        result = await self._delete_returning(OrderItem, order_item_id, OrderItemBase)
+        await self.db.flush()
+        return result
     
     async def get_order_items_by_order_id(self, order_id: int) -> list[OrderItemRead]:
         result = await self.db.execute(
-        select(OrderItem)
+        lambda_stmt(lambda: select(OrderItem)
         .options(
             selectinload(OrderItem.dish),
             selectinload(OrderItem.status)
         )
-        .filter(OrderItem.order_id == order_id)
+        .filter(OrderItem.order_id == order_id))
         )
 
         order_items = result.scalars().all()
-        return [OrderItemRead.model_validate(item) for item in order_items]
\ No newline at end of file
+        return [OrderItemRead.model_validate(item) for item in order_items]
+
+    async def transition_order_items(self, data: OrderItemBulkTransition) -> OrderItemBulkTransitionRead:
+        """
+        Move many items to to_status_id in one UPDATE ... RETURNING. Only rows currently in
+        an allowed source status are touched, so an item that changed concurrently is skipped
+        rather than overwritten. Publishes a single order_items_updated event.
+        """
+        target = data.to_status_id
+        sources = _sources_for(target)
+        if data.from_status_id is not None:
+            if data.from_status_id not in sources:
+                raise ValueError("INVALID_STATUS_TRANSITION")
+            sources = {data.from_status_id}
+        if not sources:
+            raise ValueError("INVALID_STATUS_TRANSITION")
+
+        if data.ids is not None:
+            # One array parameter: the statement text does not depend on how many ids are sent
+            scope = OrderItem.id == any_(literal(data.ids, ARRAY(Integer)))
+        else:
+            scope = OrderItem.order_id == data.order_id
+
+        result = await self.db.execute(
+            update(OrderItem)
+            .where(scope, OrderItem.status_id.in_(sources))
+            .values(status_id=target)
+            .returning(
+                OrderItem.id,
+                OrderItem.order_id,
+                OrderItem.dish_id,
+                OrderItem.status_id,
+                OrderItem.quantity,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        items = [OrderItemBase.model_validate(row) for row in result.all()]
+        items.sort(key=lambda item: item.id)
+
+        if items:
+            add_outbox_event(self.db, "order_items_updated", {
+                "order_ids": sorted({item.order_id for item in items}),
+                "status_id": target,
+                "items": [item.model_dump(mode="json") for item in items],
+            })
+        await self.db.flush()
+
+        updated_ids = {item.id for item in items}
+        skipped_ids = [i for i in dict.fromkeys(data.ids or []) if i not in updated_ids]
+        return OrderItemBulkTransitionRead(items=items, skipped_ids=skipped_ids)
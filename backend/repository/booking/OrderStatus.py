@@ -1,23 +1,23 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, delete, select, update
+from sqlalchemy import and_, select
+from sqlalchemy.exc import IntegrityError
 
 from models import OrderStatus
-from schemas.booking import OrderStatusCreate, OrderStatusFilter, OrderStatusUpdate
+from repository.base import BaseRepository, changed_fields, constraint_violated
+from schemas.booking import OrderStatusCreate, OrderStatusFilter, OrderStatusRead, OrderStatusUpdate
 
+UNIQUE_STATUS = "order_statuses_status_key"
 
-class OrderStatusRepository:
-	def __init__(self, db: AsyncSession):
-		self.db = db
 
-	async def create_status(self, data: OrderStatusCreate) -> OrderStatus:
-		existing = await self.db.execute(select(OrderStatus).where(OrderStatus.status == data.status))
-		if existing.scalar_one_or_none() is not None:
-			raise ValueError(f"Order status '{data.status}' already exists")
-
-		status = OrderStatus(status=data.status)
-		self.db.add(status)
-		await self.db.commit()
-		await self.db.refresh(status)
+class OrderStatusRepository(BaseRepository):
+	async def create_status(self, data: OrderStatusCreate) -> OrderStatusRead:
+		try:
+			status = await self._insert_returning(OrderStatus, {"status": data.status}, OrderStatusRead)
+			await self.db.flush()
+		except IntegrityError as e:
+			await self.db.rollback()
+			if constraint_violated(e, UNIQUE_STATUS):
+				raise ValueError(f"Order status '{data.status}' already exists")
+			raise
 
 		return status
 
@@ -40,34 +40,20 @@ class OrderStatusRepository:
 		return result.scalar_one_or_none()
 		
 
-	async def update_status(self, status_id: int, data: OrderStatusUpdate) -> OrderStatus | None:
-		status = await self.get_status_by_id(status_id)
-		if status is None:
-			return None
-
-		update_data = {}
-		if data.status is not None:
-			exists = await self.db.execute(select(OrderStatus).where(OrderStatus.status == data.status, OrderStatus.id != status_id))
-			if exists.scalar_one_or_none() is not None:
+	async def update_status(self, status_id: int, data: OrderStatusUpdate) -> OrderStatusRead | None:
+		try:
+			status = await self._update_returning(OrderStatus, status_id, changed_fields(data), OrderStatusRead)
+			await self.db.flush()
+		except IntegrityError as e:
+			await self.db.rollback()
+			if constraint_violated(e, UNIQUE_STATUS):
 				raise ValueError(f"Order status '{data.status}' already exists")
-
-			update_data["status"] = data.status
-
-		if not update_data:
-			return status
-
-		await self.db.execute(update(OrderStatus).where(OrderStatus.id == status_id).values(**update_data))
-		await self.db.commit()
-		await self.db.refresh(status)
+			raise
 
 		return status
 
-	async def delete_status(self, status_id: int) -> OrderStatus | None:
-		status = await self.get_status_by_id(status_id)
-		if status is None:
-			return None
-
-		await self.db.execute(delete(OrderStatus).where(OrderStatus.id == status_id))
-		await self.db.commit()
+	async def delete_status(self, status_id: int) -> OrderStatusRead | None:
+		status = await self._delete_returning(OrderStatus, status_id, OrderStatusRead)
+		await self.db.flush()
 
 		return status
\ No newline at end of file
@@ -0,0 +1,96 @@
+import asyncpg
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from repository.base import BaseRepository
+from schemas.booking import OrderItemRead
+from schemas.resources import TableReadExtended
+
+# Hand-written SQL for the highest-QPS reads. Rows come straight from asyncpg and are
+# mapped to dicts shaped like the read schemas; no ORM objects, identity map or
+# selectinload round trips. Used by the routes only when DB_FAST_READS is on.
+
+TABLES_SQL = """
+SELECT t.id, t.number, t.seats, t.status_id, s.status
+FROM tables t LEFT JOIN table_statuses s ON s.id = t.status_id
+ORDER BY t.id
+"""
+
+ORDER_SQL = """
+SELECT id, table_id, status_id, guest_id, created_at, completed_at
+FROM orders WHERE id = $1
+"""
+
+ORDER_ITEMS_SQL = """
+SELECT oi.id, oi.order_id, oi.dish_id, oi.status_id, oi.quantity,
+       d.name, d.price, d.description, d.image_url, s.status
+FROM order_items oi
+LEFT JOIN dishes d ON d.id = oi.dish_id
+LEFT JOIN order_item_statuses s ON s.id = oi.status_id
+WHERE oi.order_id = $1
+ORDER BY oi.id
+"""
+
+DISHES_SQL = """
+SELECT id, name, price, description, image_url
+FROM dishes ORDER BY id
+"""
+
+
+async def driver_connection(db: AsyncSession) -> asyncpg.Connection:
+    """The asyncpg connection under the session's pooled connection (checked out if needed)."""
+    conn = await db.connection()
+    raw = await conn.get_raw_connection()
+    return raw.driver_connection
+
+
+def _require_related(schema, record: dict, *related: str) -> dict:
+    """
+    The joins are LEFT JOINs because the foreign keys are nullable: a row with a NULL key
+    comes back with its related dict set to None instead of vanishing. The ORM path fails
+    validating such a row; validate it against the read schema here so the fast path
+    raises the same ValidationError. Complete rows skip validation.
+    """
+    if any(record[key] is None for key in related):
+        schema.model_validate(record)
+    return record
+
+
+class FastReadRepository(BaseRepository):
+    """
+    Read-only fast path. Each method is one statement and returns what the matching
+    repository method returns after model_dump(): TableReadExtended, OrderRead,
+    OrderItemRead and DishRead shapes; tests/test_fastpath_db.py checks that.
+    """
+    async def get_tables(self) -> list[dict]:
+        conn = await driver_connection(self.db)
+        return [
+            _require_related(TableReadExtended, {
+                "id": r["id"], "number": r["number"], "seats": r["seats"], "status_id": r["status_id"],
+                "status": {"id": r["status_id"], "status": r["status"]} if r["status"] is not None else None,
+            }, "status")
+            for r in await conn.fetch(TABLES_SQL)
+        ]
+
+    async def get_order_by_id(self, order_id: int) -> dict | None:
+        conn = await driver_connection(self.db)
+        row = await conn.fetchrow(ORDER_SQL, order_id)
+        return dict(row) if row is not None else None
+
+    async def get_order_items_by_order_id(self, order_id: int) -> list[dict]:
+        conn = await driver_connection(self.db)
+        return [
+            _require_related(OrderItemRead, {
+                "id": r["id"], "order_id": r["order_id"], "dish_id": r["dish_id"],
+                "status_id": r["status_id"], "quantity": r["quantity"],
+                "dish": {
+                    "id": r["dish_id"], "name": r["name"], "price": r["price"],
+                    "description": r["description"], "image_url": r["image_url"],
+                } if r["name"] is not None else None,
+                "status": {"id": r["status_id"], "status": r["status"]} if r["status"] is not None else None,
+            }, "dish", "status")
+            for r in await conn.fetch(ORDER_ITEMS_SQL, order_id)
+        ]
+
+    async def get_dishes(self) -> list[dict]:
+        conn = await driver_connection(self.db)
+        return [dict(r) for r in await conn.fetch(DISHES_SQL)]
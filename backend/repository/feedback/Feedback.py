@@ -1,27 +1,34 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, delete, select, update
-from models import Feedback, Order
+from sqlalchemy import and_, exists, insert, literal, select
+from sqlalchemy.exc import IntegrityError
+from models import Feedback
+from repository.base import BaseRepository, changed_fields, constraint_violated, returning_columns
 from schemas.feedback import (
     FeedbackCreate,
     FeedbackFilter,
+    FeedbackRead,
     FeedbackUpdate,
 )
 
 
-class FeedbackRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
-
-    async def create_feedback(self, data: FeedbackCreate) -> Feedback:
-        feedback = await self.db.execute(select(Feedback).where(Feedback.order_id == data.order_id))
-        if (feedback.scalar_one_or_none() is not None):
+class FeedbackRepository(BaseRepository):
+    async def create_feedback(self, data: FeedbackCreate) -> FeedbackRead:
+        # INSERT ... SELECT ... WHERE NOT EXISTS: the one-feedback-per-order check and the
+        # insert are one statement, so no row comes back when feedback already exists
+        values = data.model_dump()
+        table = Feedback.__table__
+        row = (await self.db.execute(
+            insert(table)
+            .from_select(
+                list(values),
+                select(*[literal(v, table.c[k].type) for k, v in values.items()])
+                .where(~exists().where(table.c.order_id == data.order_id)),
+            )
+            .returning(*returning_columns(Feedback, FeedbackRead))
+        )).one_or_none()
+        if row is None:
             raise ValueError(f"Feedback for order_id {data.order_id} already exists.")
-        feedback = Feedback(**data.model_dump())  
-        self.db.add(feedback)
-        await self.db.commit()
-        await self.db.refresh(feedback)  
-        return feedback
+        await self.db.flush()
+        return FeedbackRead.model_validate(dict(row._mapping))
 
 
     async def get_all_feedback(self, filters: FeedbackFilter) -> list[Feedback]:
@@ -34,6 +41,10 @@ class FeedbackRepository:
             conditions.append(Feedback.comment.ilike(f"%{filters.comment}%"))
         if filters.rating is not None:
             conditions.append(Feedback.rating == filters.rating)
+        if filters.created_from is not None:
+            conditions.append(Feedback.created_at >= filters.created_from)
+        if filters.created_to is not None:
+            conditions.append(Feedback.created_at < filters.created_to)
 
         if conditions:
             query = query.where(and_(*conditions))
@@ -45,32 +56,19 @@ class FeedbackRepository:
         result = await self.db.execute(select(Feedback).where(Feedback.id == feedback_id))
         return result.scalar_one_or_none()
     
-    async def update_feedback(self, feedback_id: int, data: FeedbackUpdate) -> Feedback | None:
-        feedback = await self.get_feedback_by_id(feedback_id)
-        if feedback is None:
-            return None
-        
-        update_data = {k: v for k, v in data.model_dump().items() if v is not None}
-        if not update_data:
-            return feedback
-        
-        if 'order_id' in update_data:
-            order = await self.db.execute(select(Order).where(Order.id == update_data['order_id']))
-            if order.scalar_one_or_none() is None:
+    async def update_feedback(self, feedback_id: int, data: FeedbackUpdate) -> FeedbackRead | None:
+        update_data = changed_fields(data)
+        try:
+            feedback = await self._update_returning(Feedback, feedback_id, update_data, FeedbackRead)
+            await self.db.flush()
+        except IntegrityError as e:
+            await self.db.rollback()
+            if constraint_violated(e, "feedbacks_order_id_fkey"):
                 raise ValueError(f"Order with id {update_data['order_id']} does not exist.")
-
-        await self.db.execute(
-            update(Feedback)
-            .where(Feedback.id == feedback_id)
-            .values(**update_data)
-        )
-        await self.db.commit()
+            raise
         return feedback
     
-    async def delete_feedback(self, feedback_id: int) -> bool:
-        feedback = await self.get_feedback_by_id(feedback_id)
-        if feedback is None:
-            return None
-        await self.db.execute(delete(Feedback).where(Feedback.id == feedback_id))
-        await self.db.commit()
+    async def delete_feedback(self, feedback_id: int) -> FeedbackRead | None:
+        feedback = await self._delete_returning(Feedback, feedback_id, FeedbackRead)
+        await self.db.flush()
         return feedback
\ No newline at end of file
@@ -0,0 +1,249 @@
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, case, delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from models import Job, JobSchedule
+from models.Job import JOB_STATUS_QUEUED, JOB_STATUS_RUNNING, JOB_STATUS_SUCCEEDED, JOB_STATUS_FAILED
+from schemas.jobs import (
+    JobCreate,
+    JobFilter,
+    JobScheduleCreate,
+    JobScheduleRead,
+    JobScheduleUpdate,
+)
+from repository.base import BaseRepository, changed_fields, constraint_violated
+from utils.cron import CronExpression
+
+JOB_NOTIFY_CHANNEL = "jobs"
+
+
+class JobRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _notify(self):
+        # Delivered on commit; wakes idle workers instead of waiting for their next poll
+        await self.db.execute(select(func.pg_notify(JOB_NOTIFY_CHANNEL, "")))
+
+    async def enqueue(self, data: JobCreate, schedule_id: int | None = None, commit: bool = True) -> Job:
+        job = Job(
+            name=data.name,
+            payload=data.payload,
+            priority=data.priority,
+            max_attempts=data.max_attempts,
+            run_at=data.run_at or datetime.utcnow(),
+            schedule_id=schedule_id,
+        )
+        self.db.add(job)
+        await self.db.flush()
+        await self._notify()
+        if commit:
+            await self.db.commit()
+        return job
+
+    async def get_jobs(self, filters: JobFilter) -> list[Job]:
+        query = select(Job)
+        conditions = []
+
+        if filters.name is not None:
+            conditions.append(Job.name == filters.name)
+        if filters.status is not None:
+            conditions.append(Job.status == filters.status)
+
+        if conditions:
+            query = query.where(and_(*conditions))
+
+        result = await self.db.execute(query.order_by(Job.id.desc()).limit(filters.limit))
+        return result.scalars().all()
+
+    async def get_job_by_id(self, job_id: int) -> Job | None:
+        result = await self.db.execute(select(Job).where(Job.id == job_id))
+        return result.scalar_one_or_none()
+
+    async def claim_jobs(self, worker_id: str, limit: int = 1) -> list[Job]:
+        """
+        Lock up to `limit` runnable jobs for this worker. SKIP LOCKED lets concurrent
+        workers claim disjoint rows without waiting on each other.
+        """
+        now = datetime.utcnow()
+        runnable = (
+            select(Job.id)
+            .where(Job.status == JOB_STATUS_QUEUED, Job.run_at <= now)
+            .order_by(Job.priority.desc(), Job.run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.db.execute(
+            update(Job)
+            .where(Job.id.in_(runnable))
+            .values(
+                status=JOB_STATUS_RUNNING,
+                locked_at=now,
+                locked_by=worker_id,
+                attempts=Job.attempts + 1,
+            )
+            .returning(Job)
+            .execution_options(synchronize_session=False)
+        )
+        jobs = result.scalars().all()
+        await self.db.commit()
+        return jobs
+
+    async def complete_job(self, job_id: int, worker_id: str) -> bool:
+        result = await self.db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.locked_by == worker_id, Job.status == JOB_STATUS_RUNNING)
+            .values(
+                status=JOB_STATUS_SUCCEEDED,
+                finished_at=datetime.utcnow(),
+                locked_at=None,
+                locked_by=None,
+                last_error=None,
+            )
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+
+    async def fail_job(
+        self,
+        job: Job,
+        worker_id: str,
+        error: str,
+        backoff_base: float,
+        backoff_max: float,
+    ) -> bool:
+        """Requeue with exponential backoff and jitter, or mark failed once attempts run out."""
+        now = datetime.utcnow()
+        if job.attempts >= job.max_attempts:
+            values = {"status": JOB_STATUS_FAILED, "finished_at": now}
+        else:
+            delay = min(backoff_base * 2 ** (job.attempts - 1), backoff_max)
+            delay *= random.uniform(0.8, 1.2)
+            values = {"status": JOB_STATUS_QUEUED, "run_at": now + timedelta(seconds=delay)}
+
+        result = await self.db.execute(
+            update(Job)
+            .where(Job.id == job.id, Job.locked_by == worker_id, Job.status == JOB_STATUS_RUNNING)
+            .values(locked_at=None, locked_by=None, last_error=error[:4000], **values)
+        )
+        await self.db.commit()
+        return result.rowcount == 1
+
+    async def requeue_stale(self, stale_after: float) -> int:
+        """Release jobs whose worker died mid-run; jobs out of attempts are failed instead."""
+        now = datetime.utcnow()
+        exhausted = Job.attempts >= Job.max_attempts
+        result = await self.db.execute(
+            update(Job)
+            .where(
+                Job.status == JOB_STATUS_RUNNING,
+                Job.locked_at < now - timedelta(seconds=stale_after),
+            )
+            .values(
+                status=case((exhausted, JOB_STATUS_FAILED), else_=JOB_STATUS_QUEUED),
+                finished_at=case((exhausted, now), else_=None),
+                last_error="Worker lock expired",
+                locked_at=None,
+                locked_by=None,
+            )
+        )
+        await self.db.commit()
+        return result.rowcount
+
+    async def retry_job(self, job_id: int) -> Job | None:
+        job = await self.get_job_by_id(job_id)
+        if job is None:
+            return None
+        if job.status != JOB_STATUS_FAILED:
+            raise ValueError(f"Only failed jobs can be retried, job {job_id} is {job.status}.")
+
+        job.status = JOB_STATUS_QUEUED
+        job.attempts = 0
+        job.run_at = datetime.utcnow()
+        job.finished_at = None
+        await self._notify()
+        await self.db.flush()
+        return job
+
+    async def delete_finished(self, older_than_days: int) -> int:
+        result = await self.db.execute(
+            delete(Job).where(
+                Job.status.in_([JOB_STATUS_SUCCEEDED, JOB_STATUS_FAILED]),
+                Job.finished_at < datetime.utcnow() - timedelta(days=older_than_days),
+            )
+        )
+        await self.db.commit()
+        return result.rowcount
+
+
+class JobScheduleRepository(BaseRepository):
+    async def create_schedule(self, data: JobScheduleCreate) -> JobScheduleRead:
+        values = {**data.model_dump(), "next_run_at": CronExpression(data.cron).next_after(datetime.utcnow())}
+        try:
+            schedule = await self._insert_returning(JobSchedule, values, JobScheduleRead)
+            await self.db.flush()
+        except IntegrityError as e:
+            await self.db.rollback()
+            if constraint_violated(e, "job_schedules_name_key"):
+                raise ValueError(f"Schedule with name '{data.name}' already exists.")
+            raise
+        return schedule
+
+    async def get_all_schedules(self) -> list[JobSchedule]:
+        result = await self.db.execute(select(JobSchedule).order_by(JobSchedule.id))
+        return result.scalars().all()
+
+    async def get_schedule_by_id(self, schedule_id: int) -> JobSchedule | None:
+        result = await self.db.execute(select(JobSchedule).where(JobSchedule.id == schedule_id))
+        return result.scalar_one_or_none()
+
+    async def update_schedule(self, schedule_id: int, data: JobScheduleUpdate) -> JobScheduleRead | None:
+        update_data = changed_fields(data)
+        if "cron" in update_data:
+            update_data["next_run_at"] = CronExpression(update_data["cron"]).next_after(datetime.utcnow())
+
+        try:
+            schedule = await self._update_returning(JobSchedule, schedule_id, update_data, JobScheduleRead)
+            await self.db.flush()
+        except IntegrityError as e:
+            await self.db.rollback()
+            if constraint_violated(e, "job_schedules_name_key"):
+                raise ValueError(f"Schedule with name '{data.name}' already exists.")
+            raise
+        return schedule
+
+    async def delete_schedule(self, schedule_id: int) -> JobScheduleRead | None:
+        schedule = await self._delete_returning(JobSchedule, schedule_id, JobScheduleRead)
+        await self.db.flush()
+        return schedule
+
+    async def enqueue_due(self) -> int:
+        """
+        Turn every due schedule into a job. Rows are locked with SKIP LOCKED so concurrent
+        workers never fire the same schedule twice; missed runs collapse into one job.
+        """
+        now = datetime.utcnow()
+        result = await self.db.execute(
+            select(JobSchedule)
+            .where(JobSchedule.enabled.is_(True), JobSchedule.next_run_at <= now)
+            .with_for_update(skip_locked=True)
+        )
+        schedules = result.scalars().all()
+        if not schedules:
+            await self.db.commit()
+            return 0
+
+        job_repository = JobRepository(self.db)
+        for schedule in schedules:
+            await job_repository.enqueue(
+                JobCreate(name=schedule.job_name, payload=schedule.payload),
+                schedule_id=schedule.id,
+                commit=False,
+            )
+            schedule.last_run_at = schedule.next_run_at
+            schedule.next_run_at = CronExpression(schedule.cron).next_after(now)
+
+        await self.db.commit()
+        return len(schedules)
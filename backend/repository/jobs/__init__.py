@@ -0,0 +1 @@
+from .Job import JobRepository, JobScheduleRepository, JOB_NOTIFY_CHANNEL
@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, select, update
+from models import OutboxEvent
+
+OUTBOX_NOTIFY_CHANNEL = "outbox"
+
+
+def add_outbox_event(db: AsyncSession, event: str, data: BaseModel | dict) -> OutboxEvent:
+    """
+    Stage an event in the caller's transaction. It becomes visible to the dispatcher
+    only if that transaction commits, so a write and its event succeed or fail together.
+    """
+    payload = data.model_dump(mode="json") if isinstance(data, BaseModel) else data
+    outbox_event = OutboxEvent(event=event, payload=payload)
+    db.add(outbox_event)
+    return outbox_event
+
+
+class OutboxRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def claim_batch(self, limit: int) -> list[OutboxEvent]:
+        """
+        Lock the oldest deliverable events. The locks are held until the caller commits,
+        so concurrent dispatchers skip each other's batches.
+        """
+        result = await self.db.execute(
+            select(OutboxEvent)
+            .where(OutboxEvent.dispatched_at.is_(None), OutboxEvent.available_at <= datetime.utcnow())
+            .order_by(OutboxEvent.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return result.scalars().all()
+
+    async def mark_dispatched(self, event_ids: list[int]):
+        if event_ids:
+            await self.db.execute(
+                update(OutboxEvent)
+                .where(OutboxEvent.id.in_(event_ids))
+                .values(dispatched_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
+            )
+
+    async def mark_failed(self, event: OutboxEvent, error: str, retry_in: float):
+        await self.db.execute(
+            update(OutboxEvent)
+            .where(OutboxEvent.id == event.id)
+            .values(
+                attempts=OutboxEvent.attempts + 1,
+                last_error=error[:4000],
+                available_at=datetime.utcnow() + timedelta(seconds=retry_in),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def delete_dispatched(self, older_than_days: int) -> int:
+        result = await self.db.execute(
+            delete(OutboxEvent).where(
+                OutboxEvent.dispatched_at < datetime.utcnow() - timedelta(days=older_than_days)
+            )
+        )
+        await self.db.commit()
+        return result.rowcount
@@ -0,0 +1 @@
+from .Outbox import OutboxRepository, add_outbox_event, OUTBOX_NOTIFY_CHANNEL
@@ -1,20 +1,18 @@
 from typing import List, Optional
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 
 from models.Payment import PaymentMethod as PaymentMethodModel
+from repository.base import BaseRepository
 from schemas.payments.payments import (
     PaymentMethodCreate,
+    PaymentMethodRead,
     PaymentMethodUpdate,
 )
 
 
-class PaymentMethodRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
+class PaymentMethodRepository(BaseRepository):
     async def get_all(self) -> List[PaymentMethodModel]:
         result = await self.db.execute(select(PaymentMethodModel))
         return list(result.scalars().all())
@@ -25,13 +23,10 @@ class PaymentMethodRepository:
         )
         return result.scalar_one_or_none()
 
-    async def create(self, data: PaymentMethodCreate) -> PaymentMethodModel:
-        method = PaymentMethodModel(
-            name=data.name,
-        )
-        self.db.add(method)
+    async def create(self, data: PaymentMethodCreate) -> PaymentMethodRead:
         try:
-            await self.db.commit()
+            method = await self._insert_returning(PaymentMethodModel, {"name": data.name}, PaymentMethodRead)
+            await self.db.flush()
         except IntegrityError:
             await self.db.rollback()
             # name đã unique, nên lỗi này là do trùng name
@@ -40,22 +35,16 @@ class PaymentMethodRepository:
             await self.db.rollback()
             raise
 
-        await self.db.refresh(method)
         return method
 
     async def update(
         self,
         method_id: int,
         data: PaymentMethodUpdate,
-    ) -> Optional[PaymentMethodModel]:
-        method = await self.get_by_id(method_id)
-        if method is None:
-            return None
-
-        method.name = data.name
-
+    ) -> Optional[PaymentMethodRead]:
         try:
-            await self.db.commit()
+            method = await self._update_returning(PaymentMethodModel, method_id, {"name": data.name}, PaymentMethodRead)
+            await self.db.flush()
         except IntegrityError:
             await self.db.rollback()
             raise ValueError("METHOD_NAME_EXISTS")
@@ -63,19 +52,14 @@ class PaymentMethodRepository:
             await self.db.rollback()
             raise
 
-        await self.db.refresh(method)
         return method
 
     async def delete(self, method_id: int) -> bool:
-        method = await self.get_by_id(method_id)
-        if method is None:
-            return False
-
-        await self.db.delete(method)
         try:
-            await self.db.commit()
+            method = await self._delete_returning(PaymentMethodModel, method_id, PaymentMethodRead)
+            await self.db.flush()
         except Exception:
             await self.db.rollback()
             raise
 
-        return True
+        return method is not None
@@ -1,7 +1,7 @@
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.Payment import PaymentProvider as PaymentProviderModel
+from repository.base import BaseRepository
 from schemas.payments.payments import (
     PaymentProviderRead,
     PaymentProviderCreate,
@@ -9,10 +9,7 @@ from schemas.payments.payments import (
 )
 
 
-class PaymentProviderRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
+class PaymentProviderRepository(BaseRepository):
     async def get_all(self) -> list[PaymentProviderRead]:
         stmt = select(PaymentProviderModel)
         result = await self.db.execute(stmt)
@@ -30,57 +27,37 @@ class PaymentProviderRepository:
         return PaymentProviderRead.model_validate(provider)
 
     async def create(self, data: PaymentProviderCreate) -> PaymentProviderRead:
-        provider = PaymentProviderModel(name=data.name)
-        self.db.add(provider)
-
         try:
-            await self.db.commit()
+            provider = await self._insert_returning(PaymentProviderModel, {"name": data.name}, PaymentProviderRead)
+            await self.db.flush()
         except Exception:
             await self.db.rollback()
             raise
 
-        await self.db.refresh(provider)
-        return PaymentProviderRead.model_validate(provider)
+        return provider
 
     async def update(
         self,
         provider_id: int,
         data: PaymentProviderUpdate,
     ) -> PaymentProviderRead | None:
-        stmt = select(PaymentProviderModel).where(
-            PaymentProviderModel.id == provider_id
-        )
-        result = await self.db.execute(stmt)
-        provider = result.scalar_one_or_none()
-        if provider is None:
-            return None
-
-        provider.name = data.name
-
         try:
-            await self.db.commit()
+            provider = await self._update_returning(
+                PaymentProviderModel, provider_id, {"name": data.name}, PaymentProviderRead
+            )
+            await self.db.flush()
         except Exception:
             await self.db.rollback()
             raise
 
-        await self.db.refresh(provider)
-        return PaymentProviderRead.model_validate(provider)
+        return provider
 
     async def delete(self, provider_id: int) -> bool:
-        stmt = select(PaymentProviderModel).where(
-            PaymentProviderModel.id == provider_id
-        )
-        result = await self.db.execute(stmt)
-        provider = result.scalar_one_or_none()
-        if provider is None:
-            return False
-
-        await self.db.delete(provider)
-
         try:
-            await self.db.commit()
+            provider = await self._delete_returning(PaymentProviderModel, provider_id, PaymentProviderRead)
+            await self.db.flush()
         except Exception:
             await self.db.rollback()
             raise
 
-        return True
+        return provider is not None
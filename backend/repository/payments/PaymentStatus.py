@@ -1,19 +1,16 @@
 from typing import List, Optional 
 
 from sqlalchemy import select 
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.Payment import PaymentStatus as PaymentStatusModel
+from repository.base import BaseRepository
 from schemas.payments.payments import (
     PaymentStatusCreate,
     PaymentStatusUpdate, 
     PaymentStatusRead,
 )
 
-class PaymentStatusRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
+class PaymentStatusRepository(BaseRepository):
     async def get_all(self) -> List[PaymentStatusModel]:
         result = await self.db.execute(select(PaymentStatusModel))
         return list(result.scalars().all())
@@ -27,38 +24,35 @@ class PaymentStatusRepository:
     async def create(
             self,
             data: PaymentStatusCreate,
-    ) -> PaymentStatusModel:
-        status = PaymentStatusModel(**data.model_dump())
-        self.db.add(status)
+    ) -> PaymentStatusRead:
         try:
-            await self.db.commit()
+            status = await self._insert_returning(PaymentStatusModel, data.model_dump(), PaymentStatusRead)
+            await self.db.flush()
         except Exception:
             await self.db.rollback()
             raise 
-        await self.db.refresh(status)
         return status 
     
     async def update(
             self,
-            status: PaymentStatusModel,
+            status_id: int,
             data: PaymentStatusUpdate,
-    ) -> PaymentStatusModel:
-        for field, value in data.model_dump(exclude_unset=True).items():
-            setattr(status, field, value)
-
-        self.db.add(status)
+    ) -> Optional[PaymentStatusRead]:
         try:
-            await self.db.commit()
+            status = await self._update_returning(
+                PaymentStatusModel, status_id, data.model_dump(exclude_unset=True), PaymentStatusRead
+            )
+            await self.db.flush()
         except Exception:
             await self.db.rollback()
             raise 
-        await self.db.refresh(status)
         return status
     
-    async def delete(self, status: PaymentStatusModel) -> None: 
-        await self.db.delete(status)
+    async def delete(self, status_id: int) -> bool: 
         try: 
-            await self.db.commit()
+            status = await self._delete_returning(PaymentStatusModel, status_id, PaymentStatusRead)
+            await self.db.flush()
         except Exception:
             await self.db.rollback()
-            raise 
\ No newline at end of file
+            raise 
+        return status is not None
\ No newline at end of file
@@ -1,11 +1,13 @@
 import uuid
 from datetime import datetime
+from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from models.Payment import Payment as PaymentModel
+from repository.outbox import add_outbox_event
 from schemas.payments import (
     Payment,
     PaymentCreate,
@@ -32,7 +34,8 @@ def build_qr_url(payment_id: int) -> str:
     return f"https://dummy-qr/pay_{payment_id}"
 
 
-def map_db_to_schema(db_payment: PaymentModel) -> Payment:
+def map_db_to_schema(db_payment) -> Payment:
+    """Map a Payment ORM object or a RETURNING row (same attribute names)."""
     return Payment(
         id=db_payment.id,
         booking_id=db_payment.booking_id,
@@ -55,6 +58,8 @@ async def list_payments_repo(
     db: AsyncSession,
     booking_id: Optional[int] = None,
     status_id: Optional[int] = None,
+    paid_from: Optional[datetime] = None,
+    paid_to: Optional[datetime] = None,
 ) -> list[Payment]:
     stmt = select(PaymentModel)
 
@@ -64,6 +69,12 @@ async def list_payments_repo(
     if status_id is not None:
         stmt = stmt.where(PaymentModel.status_id == status_id)
 
+    if paid_from is not None:
+        stmt = stmt.where(PaymentModel.paid_at >= paid_from)
+
+    if paid_to is not None:
+        stmt = stmt.where(PaymentModel.paid_at < paid_to)
+
     result = await db.execute(stmt)
     payments = result.scalars().all()
     return [map_db_to_schema(p) for p in payments]
@@ -81,26 +92,32 @@ async def get_payment_repo(db: AsyncSession, payment_id: int) -> Optional[Paymen
 
 # --- Create payment ---
 
-async def create_payment_repo(db: AsyncSession, data: PaymentCreate) -> Payment:
-    db_payment = PaymentModel(
-        booking_id=data.booking_id,
-        currency=data.currency,
-        amount=data.amount,
-        method_id=data.method_id,
-        provider_id=data.provider_id,
-        status_id=PAYMENT_STATUS_PENDING,
-        provider_transaction_id=generate_pending_txn_id(),
-    )
+_payment_columns = PaymentModel.__table__.c
 
-    db.add(db_payment)
+
+async def create_payment_repo(db: AsyncSession, data: PaymentCreate) -> Payment:
     try:
-        await db.commit()
+        result = await db.execute(
+            insert(PaymentModel.__table__)
+            .values(
+                booking_id=data.booking_id,
+                currency=data.currency,
+                amount=data.amount,
+                method_id=data.method_id,
+                provider_id=data.provider_id,
+                status_id=PAYMENT_STATUS_PENDING,
+                provider_transaction_id=generate_pending_txn_id(),
+            )
+            .returning(*_payment_columns)
+        )
+        payment = map_db_to_schema(result.one())
+        add_outbox_event(db, "payment_created", payment)
+        await db.flush()
     except Exception:
         await db.rollback()
         raise
 
-    await db.refresh(db_payment)
-    return map_db_to_schema(db_payment)
+    return payment
 
 
 # --- Update status ---
@@ -120,35 +137,41 @@ async def update_payment_status_repo(
     payment_id: int,
     data: PaymentUpdate,
 ) -> Payment:
-    result = await db.execute(
-        select(PaymentModel).where(PaymentModel.id == payment_id)
-    )
-    payment = result.scalar_one_or_none()
-    if payment is None:
-        raise ValueError("PAYMENT_NOT_FOUND")
-
-    current = payment.status_id
+    """
+    Conditional UPDATE ... RETURNING: the row only changes if its current status may move to
+    the target, so the transition check and the write are one statement. The payment is
+    read back only on the error path, to tell PAYMENT_NOT_FOUND from an invalid transition.
+    """
     target = data.status_id
+    sources = [current for current, targets in _allowed_transitions.items() if target in targets]
 
-    if current not in _allowed_transitions or target not in _allowed_transitions[current]:
-        raise ValueError("INVALID_STATUS_TRANSITION")
-
-    payment.status_id = target
-
-    if current == PAYMENT_STATUS_PENDING and target == PAYMENT_STATUS_SUCCESS:
-        payment.paid_at = datetime.utcnow()
-
+    values = {"status_id": target}
+    if target == PAYMENT_STATUS_SUCCESS:
+        # only reachable from PENDING
+        values["paid_at"] = datetime.utcnow()
     if data.provider_transaction_id is not None:
-        payment.provider_transaction_id = data.provider_transaction_id
+        values["provider_transaction_id"] = data.provider_transaction_id
 
     try:
-        await db.commit()
+        result = await db.execute(
+            update(PaymentModel.__table__)
+            .where(_payment_columns.id == payment_id, _payment_columns.status_id.in_(sources))
+            .values(**values)
+            .returning(*_payment_columns)
+        )
+        row = result.one_or_none()
+        if row is None:
+            if await get_payment_repo(db, payment_id) is None:
+                raise ValueError("PAYMENT_NOT_FOUND")
+            raise ValueError("INVALID_STATUS_TRANSITION")
+        payment = map_db_to_schema(row)
+        add_outbox_event(db, "payment_updated", payment)
+        await db.flush()
     except Exception:
         await db.rollback()
         raise
 
-    await db.refresh(payment)
-    return map_db_to_schema(payment)
+    return payment
 
 
 # --- Webhook ---
@@ -175,29 +198,33 @@ async def refund_payment_repo(
     payment_id: int,
     data: PaymentRefund,
 ) -> Payment:
-    result = await db.execute(
-        select(PaymentModel).where(PaymentModel.id == payment_id)
-    )
-    payment = result.scalar_one_or_none()
-    if payment is None:
-        raise ValueError("PAYMENT_NOT_FOUND")
-
-    if payment.status_id != PAYMENT_STATUS_SUCCESS:
-        raise ValueError("ONLY_SUCCESS_CAN_REFUND")
-
-    total_amount = float(payment.amount)
-    refund_amount = data.amount if data.amount is not None else total_amount
-
-    if refund_amount <= 0 or refund_amount > total_amount:
-        raise ValueError("INVALID_REFUND_AMOUNT")
-
-    payment.status_id = PAYMENT_STATUS_REFUNDED
+    # Status and amount checks ride on the UPDATE; a full refund has no amount to check
+    conditions = [_payment_columns.id == payment_id, _payment_columns.status_id == PAYMENT_STATUS_SUCCESS]
+    if data.amount is not None:
+        conditions.append(_payment_columns.amount >= Decimal(str(data.amount)))
 
     try:
-        await db.commit()
+        row = None
+        if data.amount is None or data.amount > 0:
+            result = await db.execute(
+                update(PaymentModel.__table__)
+                .where(*conditions)
+                .values(status_id=PAYMENT_STATUS_REFUNDED)
+                .returning(*_payment_columns)
+            )
+            row = result.one_or_none()
+        if row is None:
+            current = await get_payment_repo(db, payment_id)
+            if current is None:
+                raise ValueError("PAYMENT_NOT_FOUND")
+            if current.status_id != PAYMENT_STATUS_SUCCESS:
+                raise ValueError("ONLY_SUCCESS_CAN_REFUND")
+            raise ValueError("INVALID_REFUND_AMOUNT")
+        payment = map_db_to_schema(row)
+        add_outbox_event(db, "payment_updated", payment)
+        await db.flush()
     except Exception:
         await db.rollback()
         raise
 
-    await db.refresh(payment)
-    return map_db_to_schema(payment)
+    return payment
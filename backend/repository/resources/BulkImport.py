@@ -0,0 +1,144 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, text
+
+# Staging table DDL and merge statement per entity.
+# Staging tables are temporary and dropped on commit, so a failed import leaves nothing behind.
+_STAGING = {
+    "ingredients": {
+        "columns": ("row_no", "name", "unit_id", "quantity", "threshold"),
+        "ddl": """
+            CREATE TEMP TABLE import_ingredients (
+                row_no INTEGER NOT NULL,
+                name VARCHAR(255) NOT NULL,
+                unit_id INTEGER NOT NULL,
+                quantity DOUBLE PRECISION,
+                threshold DOUBLE PRECISION
+            ) ON COMMIT DROP
+        """,
+        "merge": """
+            INSERT INTO ingredients (name, unit_id, quantity, threshold)
+            SELECT name, unit_id, quantity, threshold
+            FROM import_ingredients
+            ORDER BY row_no
+            ON CONFLICT (name) DO NOTHING
+            RETURNING name
+        """,
+        "key": "name",
+    },
+    "tables": {
+        "columns": ("row_no", "number", "seats", "status_id"),
+        "ddl": """
+            CREATE TEMP TABLE import_tables (
+                row_no INTEGER NOT NULL,
+                number VARCHAR(255) NOT NULL,
+                seats INTEGER NOT NULL,
+                status_id INTEGER NOT NULL
+            ) ON COMMIT DROP
+        """,
+        "merge": """
+            INSERT INTO tables (number, seats, status_id)
+            SELECT number, seats, status_id
+            FROM import_tables
+            ORDER BY row_no
+            ON CONFLICT (number) DO NOTHING
+            RETURNING number
+        """,
+        "key": "number",
+    },
+    "equipments": {
+        "columns": ("row_no", "name", "type_id", "status_id"),
+        "ddl": """
+            CREATE TEMP TABLE import_equipments (
+                row_no INTEGER NOT NULL,
+                name VARCHAR(255) NOT NULL,
+                type_id INTEGER NOT NULL,
+                status_id INTEGER NOT NULL
+            ) ON COMMIT DROP
+        """,
+        "merge": """
+            INSERT INTO equipments (name, type_id, status_id)
+            SELECT name, type_id, status_id
+            FROM import_equipments
+            ORDER BY row_no
+        """,
+        "key": None,
+    },
+    "dishes": {
+        "columns": ("row_no", "name", "price", "description", "image_url", "tag_ids"),
+        "ddl": """
+            CREATE TEMP TABLE import_dishes (
+                row_no INTEGER NOT NULL,
+                id INTEGER,
+                name VARCHAR(255) NOT NULL,
+                price NUMERIC(10, 2) NOT NULL,
+                description TEXT,
+                image_url VARCHAR(500),
+                tag_ids INTEGER[] NOT NULL
+            ) ON COMMIT DROP
+        """,
+        # Dishes have no natural key, so ids are drawn from the sequence up front
+        # and reused to link tags without a round-trip per dish.
+        "merge": """
+            UPDATE import_dishes
+            SET id = nextval(pg_get_serial_sequence('dishes', 'id'));
+
+            INSERT INTO dishes (id, name, price, description, image_url)
+            SELECT id, name, price, description, image_url
+            FROM import_dishes
+            ORDER BY row_no;
+
+            INSERT INTO dish_tags (dish_id, tag_id)
+            SELECT DISTINCT id, unnest(tag_ids)
+            FROM import_dishes
+        """,
+        "key": None,
+    },
+}
+
+
+class BulkImportRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_existing_ids(self, model, ids: set[int]) -> set[int]:
+        """Return the subset of ids that exist for the given look-up model, in one query."""
+        if not ids:
+            return set()
+        result = await self.db.execute(select(model.id).where(model.id.in_(ids)))
+        return set(result.scalars().all())
+
+    async def get_existing_values(self, column, values: set[str]) -> set[str]:
+        """Return the subset of values already present in a unique column."""
+        if not values:
+            return set()
+        result = await self.db.execute(select(column).where(column.in_(values)))
+        return set(result.scalars().all())
+
+    async def copy_and_merge(self, entity: str, records: list[tuple]) -> set | int:
+        """
+        Load records into a staging table with COPY and merge them into the target table.
+        Returns the set of inserted keys for entities with a unique key,
+        otherwise the number of inserted rows.
+        Runs inside the session transaction; the caller commits.
+        """
+        spec = _STAGING[entity]
+        staging_table = f"import_{entity}"
+
+        # Executing through the session starts the transaction the COPY joins
+        await self.db.execute(text(spec["ddl"]))
+
+        conn = await self.db.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            staging_table,
+            records=records,
+            columns=list(spec["columns"]),
+        )
+
+        if spec["key"] is None:
+            for statement in spec["merge"].split(";"):
+                await self.db.execute(text(statement))
+            return len(records)
+
+        result = await self.db.execute(text(spec["merge"]))
+        return set(result.scalars().all())
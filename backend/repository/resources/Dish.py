@@ -1,46 +1,29 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, delete, select, update
+from sqlalchemy import and_, delete, insert, lambda_stmt, select
 from sqlalchemy.orm import selectinload
 from models import Dish, Tag
+from models.Tag import dish_tags_association
+from repository.base import BaseRepository
 from schemas.resources import (
     DishCreate,
     DishFilter,
     DishUpdate,
+    DishRead,
+    DishReadExtended,
+    TagRead,
 )
 
 
-class DishRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
-    async def create_dish(self, data: DishCreate) -> Dish:
+class DishRepository(BaseRepository):
+    async def create_dish(self, data: DishCreate) -> DishReadExtended:
         """Create a new dish with optional tags."""
-        # Extract tag_ids before creating the dish
-        tag_ids = data.tag_ids
-        dish_data = data.model_dump(exclude={'tag_ids'})
-
-        dish = Dish(**dish_data)
-
-        # If tag_ids provided, fetch and associate tags
-        if tag_ids:
-            tags = await self._get_tags_by_ids(tag_ids)
-            if len(tags) != len(tag_ids):
-                found_ids = {tag.id for tag in tags}
-                missing_ids = set(tag_ids) - found_ids
-                raise ValueError(f"Tags with ids {missing_ids} do not exist.")
-            dish.tags = tags
-
-        self.db.add(dish)
-        await self.db.commit()
-        await self.db.refresh(dish)
-
-        # Reload dish with tags relationship loaded
-        result = await self.db.execute(
-            select(Dish)
-            .where(Dish.id == dish.id)
-            .options(selectinload(Dish.tags))
-        )
-        return result.scalar_one()
+        # Validate tags before writing anything
+        tags = await self._get_tag_reads(data.tag_ids)
+
+        dish = await self._insert_returning(Dish, data.model_dump(exclude={'tag_ids'}), DishRead)
+        await self._link_tags(dish.id, tags)
+        await self.db.flush()
+
+        return DishReadExtended(**dish.model_dump(), tags=tags)
 
     async def get_all_dishes(self, filters: DishFilter, include_tags: bool = False) -> list[Dish]:
         """Get all dishes with optional filters and eager load tags if requested."""
@@ -67,22 +50,19 @@ class DishRepository:
 
     async def get_dish_by_id(self, dish_id: int, include_tags: bool = False) -> Dish | None:
         """Get a dish by ID with optional tags eager loading."""
-        query = select(Dish).where(Dish.id == dish_id)
+        query = lambda_stmt(lambda: select(Dish).where(Dish.id == dish_id))
 
         if include_tags:
-            query = query.options(selectinload(Dish.tags))
+            query += lambda q: q.options(selectinload(Dish.tags))
 
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    async def update_dish(self, dish_id: int, data: DishUpdate, allow_null_image: bool = False) -> Dish | None:
+    async def update_dish(self, dish_id: int, data: DishUpdate, allow_null_image: bool = False) -> DishReadExtended | None:
         """Update a dish by ID, including tag associations."""
-        dish = await self.get_dish_by_id(dish_id)
-        if dish is None:
-            return None
-
-        # Extract tag_ids from update data
+        # Extract tag_ids from update data; validate them before writing anything
         tag_ids = data.tag_ids
+        tags = await self._get_tag_reads(tag_ids) if tag_ids is not None else None
 
         # Get all fields from the update data
         all_data = data.model_dump(exclude={'tag_ids'})
@@ -106,49 +86,49 @@ class DishRepository:
                 elif key == 'image_url' and allow_null_image:
                     update_data[key] = None
 
-        # Update basic fields if any
-        if update_data:
+        # Update basic fields if any (a plain SELECT of the row otherwise)
+        dish = await self._update_returning(Dish, dish_id, update_data, DishRead)
+        if dish is None:
+            return None
+
+        # Replace tags if tag_ids is provided (even if empty list to clear tags)
+        if tags is not None:
             await self.db.execute(
-                update(Dish)
-                .where(Dish.id == dish_id)
-                .values(**update_data)
+                delete(dish_tags_association).where(dish_tags_association.c.dish_id == dish_id)
             )
+            await self._link_tags(dish_id, tags)
+        else:
+            result = await self.db.execute(
+                select(Tag.id, Tag.name)
+                .join(dish_tags_association, dish_tags_association.c.tag_id == Tag.id)
+                .where(dish_tags_association.c.dish_id == dish_id)
+            )
+            tags = [TagRead.model_validate(dict(row._mapping)) for row in result]
 
-        # Update tags if tag_ids is provided (even if empty list to clear tags)
-        if tag_ids is not None:
-            if tag_ids:
-                tags = await self._get_tags_by_ids(tag_ids)
-                if len(tags) != len(tag_ids):
-                    found_ids = {tag.id for tag in tags}
-                    missing_ids = set(tag_ids) - found_ids
-                    raise ValueError(f"Tags with ids {missing_ids} do not exist.")
-                dish.tags = tags
-            else:
-                # Clear all tags if empty list provided
-                dish.tags = []
-
-        await self.db.commit()
-
-        # Reload dish with tags relationship loaded
-        result = await self.db.execute(
-            select(Dish)
-            .where(Dish.id == dish_id)
-            .options(selectinload(Dish.tags))
-        )
-        return result.scalar_one()
-
-    async def delete_dish(self, dish_id: int) -> Dish | None:
-        """Delete a dish by ID."""
-        dish = await self.get_dish_by_id(dish_id)
-        if dish is None:
-            return None
-        await self.db.execute(delete(Dish).where(Dish.id == dish_id))
-        await self.db.commit()
+        await self.db.flush()
+
+        return DishReadExtended(**dish.model_dump(), tags=tags)
+
+    async def delete_dish(self, dish_id: int) -> DishRead | None:
+        """Delete a dish by ID (dish_tags rows go with it via ON DELETE CASCADE)."""
+        dish = await self._delete_returning(Dish, dish_id, DishRead)
+        await self.db.flush()
         return dish
 
-    async def _get_tags_by_ids(self, tag_ids: list[int]) -> list[Tag]:
-        """Helper method to fetch tags by their IDs."""
+    async def _get_tag_reads(self, tag_ids: list[int]) -> list[TagRead]:
+        """Fetch tags by their IDs, raising if any does not exist."""
         if not tag_ids:
             return []
-        result = await self.db.execute(select(Tag).where(Tag.id.in_(tag_ids)))
-        return result.scalars().all()
\ No newline at end of file
+        result = await self.db.execute(select(Tag.id, Tag.name).where(Tag.id.in_(tag_ids)))
+        tags = [TagRead.model_validate(dict(row._mapping)) for row in result]
+        missing_ids = set(tag_ids) - {tag.id for tag in tags}
+        if missing_ids:
+            raise ValueError(f"Tags with ids {missing_ids} do not exist.")
+        return tags
+
+    async def _link_tags(self, dish_id: int, tags: list[TagRead]):
+        """Associate tags with a dish in one multi-row INSERT."""
+        if tags:
+            await self.db.execute(
+                insert(dish_tags_association).values([{"dish_id": dish_id, "tag_id": tag.id} for tag in tags])
+            )
\ No newline at end of file
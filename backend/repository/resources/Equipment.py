@@ -1,7 +1,8 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, delete, select, update
+from sqlalchemy import and_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 from models import Equipment, EquipmentType, EquipmentStatus
+from repository.base import BaseRepository, changed_fields, constraint_violated
 from schemas.resources import (
     EquipmentCreate,
     EquipmentFilter,
@@ -11,28 +12,31 @@ from schemas.resources import (
     EquipmentTypeCreate,
     EquipmentTypeFilter,
     EquipmentTypeUpdate,
+    EquipmentTypeRead,
     EquipmentStatusCreate,
     EquipmentStatusFilter,
     EquipmentStatusUpdate,
+    EquipmentStatusRead,
 )
 
-class EquipmentRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
+class EquipmentRepository(BaseRepository):
+    async def _write(self, statement, values: dict) -> EquipmentReadBase | None:
+        """Run an equipment insert/update, turning missing type/status references into ValueError"""
+        try:
+            equip = await statement
+            await self.db.flush()
+        except IntegrityError as e:
+            await self.db.rollback()
+            if constraint_violated(e, "equipments_type_id_fkey"):
+                raise ValueError(f"EquipmentType with id {values['type_id']} does not exist.")
+            if constraint_violated(e, "equipments_status_id_fkey"):
+                raise ValueError(f"EquipmentStatus with id {values['status_id']} does not exist.")
+            raise
+        return equip
 
     async def create_equipment(self, data: EquipmentCreate) -> EquipmentReadBase:
-        type_ = await self.db.execute(select(EquipmentType).where(EquipmentType.id == data.type_id))
-        if (type_.scalar_one_or_none() is None):
-            raise ValueError(f"EquipmentType with id {data.type_id} does not exist.")
-        status = await self.db.execute(select(EquipmentStatus).where(EquipmentStatus.id == data.status_id))
-        if (status.scalar_one_or_none() is None):
-            raise ValueError(f"EquipmentStatus with id {data.status_id} does not exist.")
-        equip = Equipment(**data.model_dump())  
-        self.db.add(equip)
-        await self.db.commit()
-        await self.db.refresh(equip)  
-        return equip
+        values = data.model_dump()
+        return await self._write(self._insert_returning(Equipment, values, EquipmentReadBase), values)
 
 
     async def get_all_equipment(self, filters: EquipmentFilter) -> list[EquipmentReadExtended]:
@@ -65,54 +69,21 @@ class EquipmentRepository:
         return equip
 
     async def delete_equipment(self, equipment_id: int) -> EquipmentReadBase | None:
-        get_equip = await self.db.execute(select(Equipment).where(Equipment.id == equipment_id))
-        equip = get_equip.scalar_one_or_none()
-        if equip:
-            await self.db.execute(delete(Equipment).where(Equipment.id == equipment_id))
-            await self.db.commit()
-        else:
-            return None
-        return equip   
+        equip = await self._delete_returning(Equipment, equipment_id, EquipmentReadBase)
+        await self.db.flush()
+        return equip
     
 
     async def update_equipment(self, equipment_id: int, data: EquipmentUpdate) -> EquipmentReadBase | None:
-        get_equip = await self.db.execute(select(Equipment).where(Equipment.id == equipment_id))
-        equip = get_equip.scalar_one_or_none()
-        if not equip:
-            return None
-
-        update_data = {}
-        for k, v in data.model_dump().items():
-            if v is not None:
-                update_data[k] = v
-
-        if not update_data:
-            return equip
-        
-        if 'type_id' in update_data:
-            type_ = await self.db.execute(select(EquipmentType).where(EquipmentType.id == update_data['type_id']))
-            if (type_.scalar_one_or_none() is None):
-                raise ValueError(f"EquipmentType with id {update_data['type_id']} does not exist.")
-        
-        if 'status_id' in update_data:
-            status = await self.db.execute(select(EquipmentStatus).where(EquipmentStatus.id == update_data['status_id']))
-            if (status.scalar_one_or_none() is None):
-                raise ValueError(f"EquipmentStatus with id {update_data['status_id']} does not exist.")
-
-        await self.db.execute(update(Equipment).where(Equipment.id == equipment_id).values(**update_data))
-        await self.db.commit()
-        await self.db.refresh(equip)
-        return equip
+        update_data = changed_fields(data)
+        return await self._write(
+            self._update_returning(Equipment, equipment_id, update_data, EquipmentReadBase), update_data
+        )
     
-class EquipmentTypeRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
-    async def create_equipment_type(self, data: EquipmentTypeCreate) -> EquipmentType:
-        equip_type = EquipmentType(**data.model_dump())  
-        self.db.add(equip_type)
-        await self.db.commit()
-        await self.db.refresh(equip_type)  
+class EquipmentTypeRepository(BaseRepository):
+    async def create_equipment_type(self, data: EquipmentTypeCreate) -> EquipmentTypeRead:
+        equip_type = await self._insert_returning(EquipmentType, data.model_dump(), EquipmentTypeRead)
+        await self.db.flush()
         return equip_type
     
     async def get_equipment_type_by_id(self, type_id: int) -> EquipmentType | None:
@@ -132,40 +103,20 @@ class EquipmentTypeRepository:
         result = await self.db.execute(query)
         return result.scalars().all()
     
-    async def update_equipment_type(self, type_id: int, data: EquipmentTypeUpdate) -> EquipmentType | None:
-        equip_type = await self.get_equipment_type_by_id(type_id)
-        if not equip_type:
-            return None
-
-        update_data = {}
-        for k, v in data.model_dump().items():
-            if v is not None:
-                update_data[k] = v
-
-        if not update_data:
-            return equip_type
-
-        await self.db.execute(update(EquipmentType).where(EquipmentType.id == type_id).values(**update_data))
-        await self.db.commit()
-        await self.db.refresh(equip_type)
+    async def update_equipment_type(self, type_id: int, data: EquipmentTypeUpdate) -> EquipmentTypeRead | None:
+        equip_type = await self._update_returning(EquipmentType, type_id, changed_fields(data), EquipmentTypeRead)
+        await self.db.flush()
         return equip_type
     
-    async def delete_equipment_type(self, type_id: int) -> EquipmentType | None:
-        equip_type = await self.get_equipment_type_by_id(type_id)
-        if equip_type:
-            await self.db.execute(delete(EquipmentType).where(EquipmentType.id == type_id))
-            await self.db.commit()
+    async def delete_equipment_type(self, type_id: int) -> EquipmentTypeRead | None:
+        equip_type = await self._delete_returning(EquipmentType, type_id, EquipmentTypeRead)
+        await self.db.flush()
         return equip_type
 
-class EquipmentStatusRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
-    async def create_equipment_status(self, data: EquipmentStatusCreate) -> EquipmentStatus:
-        equip_status = EquipmentStatus(**data.model_dump())  
-        self.db.add(equip_status)
-        await self.db.commit()
-        await self.db.refresh(equip_status)  
+class EquipmentStatusRepository(BaseRepository):
+    async def create_equipment_status(self, data: EquipmentStatusCreate) -> EquipmentStatusRead:
+        equip_status = await self._insert_returning(EquipmentStatus, data.model_dump(), EquipmentStatusRead)
+        await self.db.flush()
         return equip_status
     
     async def get_equipment_status_by_id(self, status_id: int) -> EquipmentStatus | None:
@@ -185,27 +136,12 @@ class EquipmentStatusRepository:
         result = await self.db.execute(query)
         return result.scalars().all()
     
-    async def update_equipment_status(self, status_id: int, data: EquipmentStatusUpdate) -> EquipmentStatus | None:
-        equip_status = await self.get_equipment_status_by_id(status_id)
-        if not equip_status:
-            return None
-        
-        update_data = {}
-        for k, v in data.model_dump().items():
-            if v is not None:
-                update_data[k] = v
-
-        if not update_data:
-            return equip_status
-
-        await self.db.execute(update(EquipmentStatus).where(EquipmentStatus.id == status_id).values(**update_data))
-        await self.db.commit()
-        await self.db.refresh(equip_status)
+    async def update_equipment_status(self, status_id: int, data: EquipmentStatusUpdate) -> EquipmentStatusRead | None:
+        equip_status = await self._update_returning(EquipmentStatus, status_id, changed_fields(data), EquipmentStatusRead)
+        await self.db.flush()
         return equip_status
     
-    async def delete_equipment_status(self, status_id: int) -> EquipmentStatus | None:
-        equip_status = await self.get_equipment_status_by_id(status_id)
-        if equip_status:
-            await self.db.execute(delete(EquipmentStatus).where(EquipmentStatus.id == status_id))
-            await self.db.commit()
+    async def delete_equipment_status(self, status_id: int) -> EquipmentStatusRead | None:
+        equip_status = await self._delete_returning(EquipmentStatus, status_id, EquipmentStatusRead)
+        await self.db.flush()
         return equip_status
\ No newline at end of file
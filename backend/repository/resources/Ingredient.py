@@ -1,7 +1,9 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import delete, select, update
+import uuid
+from sqlalchemy import Float, Integer, cast, column, func, select, update, values
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 from models import Ingredient, IngredientUnit, IngredientHistory
+from repository.base import BaseRepository, changed_fields, constraint_violated
 from schemas.resources import (
     IngredientCreate,
     IngredientUpdate, 
@@ -10,20 +12,31 @@ from schemas.resources import (
     IngredientReadExtended,
     IngredientUnitCreate,
     IngredientUnitUpdate,
-    IngredientUnitFilter)
-
-class IngredientRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
+    IngredientUnitFilter,
+    IngredientUnitRead,
+    IngredientStockTakeCreate,
+    IngredientStockTakeRead)
+
+# Read by the trg_ingredient_history trigger to fill ingredient_histories.reason
+INGREDIENT_CHANGE_REASON_SETTING = "app.ingredient_change_reason"
+INGREDIENT_STOCK_TAKE_SETTING = "app.stock_take_id"
+
+class IngredientRepository(BaseRepository):
+    async def set_change_reason(self, reason: str | None):
+        """Set the history reason for quantity changes made in the current transaction."""
+        await self.db.execute(
+            select(func.set_config(INGREDIENT_CHANGE_REASON_SETTING, reason or "", True))
+        )
 
     async def create_ingredient(self, data: IngredientCreate) -> IngredientReadBase:
-        unit = await self.db.execute(select(IngredientUnit).where(IngredientUnit.id == data.unit_id))
-        if (unit.scalar_one_or_none() is None):
-            raise ValueError(f"IngredientUnit with id {data.unit_id} does not exist.")
-        ingredient = Ingredient(**data.model_dump())
-        self.db.add(ingredient)
-        await self.db.commit()
-        await self.db.refresh(ingredient)
+        try:
+            ingredient = await self._insert_returning(Ingredient, data.model_dump(), IngredientReadBase)
+            await self.db.flush()
+        except IntegrityError as e:
+            await self.db.rollback()
+            if constraint_violated(e, "ingredients_unit_id_fkey"):
+                raise ValueError(f"IngredientUnit with id {data.unit_id} does not exist.")
+            raise
         return ingredient
     
     async def get_all_ingredients(self, filters: IngredientFilter) -> list[IngredientReadExtended]:
@@ -49,52 +62,83 @@ class IngredientRepository:
         ingre = result.scalar_one_or_none()
         return ingre
     
-    async def update_ingredient(self, ingredient_id: int, data: IngredientUpdate) -> IngredientReadBase | None:
-        get_ingredient = await self.db.execute(select(Ingredient).where(Ingredient.id == ingredient_id))
-        ingredient = get_ingredient.scalar_one_or_none()
-        if not ingredient:
-            return None
-
-        update_data = {}
-        for k, v in data.model_dump().items():
-            if v is not None:
-                update_data[k] = v
-
-        if not update_data:
-            return ingredient
-
-        if "unit_id" in update_data:
-            unit = await self.db.execute(select(IngredientUnit).where(IngredientUnit.id == update_data["unit_id"]))
-            if (unit.scalar_one_or_none() is None):
+    async def update_ingredient(self, ingredient_id: int, data: IngredientUpdate, reason: str | None = None) -> IngredientReadBase | None:
+        update_data = changed_fields(data)
+        if update_data and reason is not None:
+            await self.set_change_reason(reason)
+
+        try:
+            ingredient = await self._update_returning(Ingredient, ingredient_id, update_data, IngredientReadBase)
+            await self.db.flush()
+        except IntegrityError as e:
+            await self.db.rollback()
+            if constraint_violated(e, "ingredients_unit_id_fkey"):
                 raise ValueError(f"IngredientUnit with id {update_data['unit_id']} does not exist.")
+            raise
+        return ingredient
+    
+    async def adjust_stock(self, data: IngredientStockTakeCreate) -> IngredientStockTakeRead:
+        """
+        Apply absolute counts or deltas for many ingredients in one UPDATE ... FROM (VALUES ...).
+        History rows written by the trigger share one stock_take_id and reason.
+        """
+        stock_take_id = uuid.uuid4()
+
+        adjustments = values(
+            column("id", Integer),
+            column("quantity", Float),
+            column("delta", Float),
+            name="adjustments",
+        ).data([(item.ingredient_id, item.quantity, item.delta) for item in data.items])
 
         await self.db.execute(
-            update(Ingredient).where(Ingredient.id == ingredient_id).values(**update_data)
+            select(
+                func.set_config(INGREDIENT_CHANGE_REASON_SETTING, data.reason or "stock take", True),
+                func.set_config(INGREDIENT_STOCK_TAKE_SETTING, str(stock_take_id), True),
+            )
         )
-        await self.db.commit()
-        await self.db.refresh(ingredient)
-        return ingredient
-    
+
+        result = await self.db.execute(
+            update(Ingredient)
+            .where(Ingredient.id == adjustments.c.id)
+            .values(
+                # A VALUES column that is NULL in every row is typed text by Postgres (an
+                # all-count or all-delta batch), so cast both back to float here
+                quantity=func.coalesce(
+                    cast(adjustments.c.quantity, Float),
+                    func.coalesce(Ingredient.quantity, 0) + cast(adjustments.c.delta, Float),
+                )
+            )
+            .returning(
+                Ingredient.id,
+                Ingredient.name,
+                Ingredient.unit_id,
+                Ingredient.quantity,
+                Ingredient.threshold,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        await self.db.flush()
+
+        updated_ids = {row.id for row in rows}
+        return IngredientStockTakeRead(
+            stock_take_id=stock_take_id,
+            reason=data.reason,
+            items=[IngredientReadBase.model_validate(row) for row in rows],
+            missing_ids=[item.ingredient_id for item in data.items if item.ingredient_id not in updated_ids],
+        )
+
     async def delete_ingredient(self, ingredient_id: int) -> IngredientReadBase | None:
-        get_ingredient = await self.db.execute(select(Ingredient).where(Ingredient.id == ingredient_id))
-        ingredient = get_ingredient.scalar_one_or_none()
-        if ingredient:
-            await self.db.execute(delete(Ingredient).where(Ingredient.id == ingredient_id))
-            await self.db.commit()
-        else:
-            return None
+        ingredient = await self._delete_returning(Ingredient, ingredient_id, IngredientReadBase)
+        await self.db.flush()
         return ingredient
     
 
-class IngredientUnitRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
-    async def create_ingredient_unit(self, data: IngredientUnitCreate) -> IngredientUnit:
-        unit = IngredientUnit(**data.model_dump())
-        self.db.add(unit)
-        await self.db.commit()
-        await self.db.refresh(unit)
+class IngredientUnitRepository(BaseRepository):
+    async def create_ingredient_unit(self, data: IngredientUnitCreate) -> IngredientUnitRead:
+        unit = await self._insert_returning(IngredientUnit, data.model_dump(), IngredientUnitRead)
+        await self.db.flush()
         return unit
     
     async def get_all_ingredient_units(self, filters: IngredientUnitFilter) -> list[IngredientUnit]:
@@ -114,30 +158,13 @@ class IngredientUnitRepository:
         result = await self.db.execute(select(IngredientUnit).where(IngredientUnit.id == unit_id))
         return result.scalar_one_or_none()
     
-    async def update_ingredient_unit(self, unit_id: int, data: IngredientUnitUpdate) -> IngredientUnit | None:
-        unit = await self.get_ingredient_unit_by_id(unit_id)
-        if not unit:
-            return None
-
-        update_data = {}
-        for k, v in data.model_dump().items():
-            if v is not None:
-                update_data[k] = v
-
-        if not update_data:
-            return unit
-
-        await self.db.execute(
-            update(IngredientUnit).where(IngredientUnit.id == unit_id).values(**update_data)
-        )
-        await self.db.commit()
-        await self.db.refresh(unit)
+    async def update_ingredient_unit(self, unit_id: int, data: IngredientUnitUpdate) -> IngredientUnitRead | None:
+        unit = await self._update_returning(IngredientUnit, unit_id, changed_fields(data), IngredientUnitRead)
+        await self.db.flush()
         return unit
     
-    async def delete_ingredient_unit(self, unit_id: int) -> IngredientUnit | None:
-        unit = await self.get_ingredient_unit_by_id(unit_id)
-        if unit:
-            await self.db.execute(delete(IngredientUnit).where(IngredientUnit.id == unit_id))
-            await self.db.commit()
+    async def delete_ingredient_unit(self, unit_id: int) -> IngredientUnitRead | None:
+        unit = await self._delete_returning(IngredientUnit, unit_id, IngredientUnitRead)
+        await self.db.flush()
         return unit
     
\ No newline at end of file
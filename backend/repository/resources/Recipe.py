@@ -0,0 +1,125 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import selectinload
+from datetime import datetime
+
+from models import Dish, DishIngredient, Ingredient, Order, OrderItem
+from models.OrderItem import ORDER_ITEM_STATUS_SERVED
+from schemas.resources import (
+    IngredientReadBase,
+    RecipeUpdate,
+    RecipeItemRead,
+)
+from .Ingredient import INGREDIENT_CHANGE_REASON_SETTING
+
+
+class RecipeRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_recipe(self, dish_id: int) -> list[RecipeItemRead]:
+        result = await self.db.execute(
+            select(DishIngredient)
+            .options(selectinload(DishIngredient.ingredient))
+            .where(DishIngredient.dish_id == dish_id)
+        )
+        return [RecipeItemRead.model_validate(item) for item in result.scalars().all()]
+
+    async def set_recipe(self, dish_id: int, data: RecipeUpdate) -> list[RecipeItemRead] | None:
+        """Replace the recipe of a dish. Returns None if the dish does not exist."""
+        dish = await self.db.execute(select(Dish.id).where(Dish.id == dish_id))
+        if dish.scalar_one_or_none() is None:
+            return None
+
+        ingredient_ids = {item.ingredient_id for item in data.items}
+        if ingredient_ids:
+            found = await self.db.execute(select(Ingredient.id).where(Ingredient.id.in_(ingredient_ids)))
+            missing_ids = ingredient_ids - set(found.scalars().all())
+            if missing_ids:
+                raise ValueError(f"Ingredients with ids {missing_ids} do not exist.")
+
+        await self.db.execute(delete(DishIngredient).where(DishIngredient.dish_id == dish_id))
+        if data.items:
+            await self.db.execute(
+                insert(DishIngredient),
+                [
+                    {"dish_id": dish_id, "ingredient_id": item.ingredient_id, "quantity": item.quantity}
+                    for item in data.items
+                ],
+            )
+        await self.db.flush()
+
+        return await self.get_recipe(dish_id)
+
+    async def consume_served_items(
+        self,
+        order_id: int | None = None,
+        completed_from: datetime | None = None,
+        completed_to: datetime | None = None,
+    ) -> list[IngredientReadBase]:
+        """
+        Deduct the recipes of served, not yet consumed order items from ingredient stock.
+        Marking the items, aggregating usage per ingredient and the stock UPDATE run as one
+        statement, so the history trigger fires once for the whole batch.
+        Limited to one order when order_id is given, and/or to orders completed in
+        [completed_from, completed_to) (either bound optional); otherwise sweeps every
+        pending item.
+        Runs inside the caller's transaction; the caller commits.
+        """
+        order_items = OrderItem.__table__
+        recipes = DishIngredient.__table__
+        ingredients = Ingredient.__table__
+
+        served_filter = [
+            order_items.c.status_id == ORDER_ITEM_STATUS_SERVED,
+            order_items.c.stock_consumed.is_(False),
+        ]
+        if order_id is not None:
+            served_filter.append(order_items.c.order_id == order_id)
+        if completed_from is not None or completed_to is not None:
+            orders = Order.__table__
+            window = []
+            if completed_from is not None:
+                window.append(orders.c.completed_at >= completed_from)
+            if completed_to is not None:
+                window.append(orders.c.completed_at < completed_to)
+            served_filter.append(order_items.c.order_id.in_(select(orders.c.id).where(*window)))
+
+        served = (
+            update(order_items)
+            .where(*served_filter)
+            .values(stock_consumed=True)
+            .returning(order_items.c.dish_id, order_items.c.quantity)
+            .cte("served")
+        )
+        usage = (
+            select(
+                recipes.c.ingredient_id,
+                func.sum(recipes.c.quantity * served.c.quantity).label("amount"),
+            )
+            .join(served, served.c.dish_id == recipes.c.dish_id)
+            .group_by(recipes.c.ingredient_id)
+            .cte("usage")
+        )
+
+        if order_id is not None:
+            reason = f"order {order_id}"
+        elif completed_from is not None or completed_to is not None:
+            reason = f"orders completed {completed_from or '...'} to {completed_to or '...'}"
+        else:
+            reason = "served items"
+        await self.db.execute(select(func.set_config(INGREDIENT_CHANGE_REASON_SETTING, reason, True)))
+
+        result = await self.db.execute(
+            update(ingredients)
+            .where(ingredients.c.id == usage.c.ingredient_id)
+            .values(quantity=func.coalesce(ingredients.c.quantity, 0) - usage.c.amount)
+            .returning(
+                ingredients.c.id,
+                ingredients.c.name,
+                ingredients.c.unit_id,
+                ingredients.c.quantity,
+                ingredients.c.threshold,
+            )
+        )
+        return [IngredientReadBase.model_validate(row) for row in result.all()]
@@ -1,7 +1,8 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, delete, select, update
+from sqlalchemy import and_, lambda_stmt, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
 from models import Table, TableStatus
+from repository.base import BaseRepository, changed_fields, constraint_violated
 
 from schemas.resources import (
     TableCreate,
@@ -16,28 +17,22 @@ from schemas.resources import (
 )
 
 
-class TableRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
+class TableRepository(BaseRepository):
     async def create_table(self, data: TableCreate) -> TableReadBase:
         """
         Create a new table.
         Validates table number is unique.
         """
-        # Check if table number already exists
-        existing = await self.db.execute(
-            select(Table).where(Table.number == data.number)
-        )
-        if existing.scalar_one_or_none() is not None:
-            raise ValueError(f"Table number {data.number} already exists.")
-
-        table = Table(**data.model_dump())
-        self.db.add(table)
-        await self.db.commit()
-        await self.db.refresh(table)
+        try:
+            table = await self._insert_returning(Table, data.model_dump(), TableReadBase)
+            await self.db.flush()
+        except IntegrityError as e:
+            await self.db.rollback()
+            if constraint_violated(e, "tables_number_key"):
+                raise ValueError(f"Table number {data.number} already exists.")
+            raise
 
-        return TableReadBase.model_validate(table)
+        return table
 
     async def get_all_tables(self, filters: TableFilter) -> list[TableReadExtended]:
         """Get all tables with optional filters"""
@@ -62,11 +57,11 @@ class TableRepository:
     async def get_table_by_id(self, table_id: int) -> TableReadExtended | None:
         """Get table by id"""
         result = await self.db.execute(
-            select(Table)
+            lambda_stmt(lambda: select(Table)
             .options(
                 selectinload(Table.status)
             )
-            .where(Table.id == table_id)
+            .where(Table.id == table_id))
         )
         table = result.scalar_one_or_none()
         
@@ -79,65 +74,27 @@ class TableRepository:
         self, table_id: int, data: TableUpdate
     ) -> TableReadBase | None:
         """Update table info"""
-        table = await self.db.execute(
-            select(Table).where(Table.id == table_id)
-        )
-        table = table.scalar_one_or_none()
-        if table is None:
-            return None
-
-        # If updating number, check uniqueness
-        if data.number is not None and data.number != table.number:
-            existing = await self.db.execute(
-                select(Table).where(Table.number == data.number)
-            )
-            if existing.scalar_one_or_none() is not None:
+        try:
+            table = await self._update_returning(Table, table_id, changed_fields(data), TableReadBase)
+            await self.db.flush()
+        except IntegrityError as e:
+            await self.db.rollback()
+            if constraint_violated(e, "tables_number_key"):
                 raise ValueError(f"Table number {data.number} already exists.")
+            raise
 
-        update_data = {}
-        if data.number is not None:
-            update_data["number"] = data.number
-        if data.seats is not None:
-            update_data["seats"] = data.seats
-        if data.status_id is not None:
-            update_data["status_id"] = data.status_id
-
-        if not update_data:
-            return TableReadBase.model_validate(table)
-
-        await self.db.execute(
-            update(Table).where(Table.id == table_id).values(**update_data)
-        )
-        await self.db.commit()
-        await self.db.refresh(table)
-
-        return TableReadBase.model_validate(table)
+        return table
 
     async def delete_table(self, table_id: int) -> TableReadBase | None:
         """Delete table (cascade deletes orders)"""
-        table = await self.db.execute(
-            select(Table).where(Table.id == table_id)
-        )
-        table = table.scalar_one_or_none()
-        if table is None:
-            return None
-
-        result = TableReadBase.model_validate(table)
-
-        await self.db.execute(delete(Table).where(Table.id == table_id))
-        await self.db.commit()
-
-        return result
-
-class TableStatusRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
+        table = await self._delete_returning(Table, table_id, TableReadBase)
+        await self.db.flush()
+        return table
 
+class TableStatusRepository(BaseRepository):
     async def create_table_status(self, data: TableStatusCreate) -> TableStatusRead:
-        table_status = TableStatus(**data.model_dump())
-        self.db.add(table_status)
-        await self.db.commit()
-        await self.db.refresh(table_status)
+        table_status = await self._insert_returning(TableStatus, data.model_dump(), TableStatusRead)
+        await self.db.flush()
         return table_status
 
     async def get_table_status_by_id(self, status_id: int) -> TableStatusRead | None:
@@ -162,28 +119,11 @@ class TableStatusRepository:
         return [status for status in statuses]
 
     async def update_table_status(self, status_id: int, data: TableStatusUpdate) -> TableStatusRead | None:
-        status = await self.get_table_status_by_id(status_id)
-        if not status:
-            return None
-        
-        update_data = {}
-        for k, v in data.model_dump().items():
-            if v is not None:
-                update_data[k] = v
-
-        if not update_data:
-            return status
-        
-        await self.db.execute(update(TableStatus).where(TableStatus.id == status_id).values(**update_data))
-        await self.db.commit()
-        await self.db.refresh(status)
+        status = await self._update_returning(TableStatus, status_id, changed_fields(data), TableStatusRead)
+        await self.db.flush()
         return status
 
     async def delete_table_status(self, status_id: int) -> TableStatusRead | None:
-        status = await self.get_table_status_by_id(status_id)
-        if status is None:
-            return None
-        
-        await self.db.execute(delete(TableStatus).where(TableStatus.id == status_id))
-        await self.db.commit()
+        status = await self._delete_returning(TableStatus, status_id, TableStatusRead)
+        await self.db.flush()
         return status
\ No newline at end of file
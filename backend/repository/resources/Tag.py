@@ -1,19 +1,14 @@
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, and_
+from sqlalchemy import select, and_
 from models import Tag
-from schemas.resources import TagCreate, TagUpdate, TagFilter
+from repository.base import BaseRepository, changed_fields
+from schemas.resources import TagCreate, TagUpdate, TagFilter, TagRead
 
 
-class TagRepository:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
-    async def create_tag(self, data: TagCreate) -> Tag:
+class TagRepository(BaseRepository):
+    async def create_tag(self, data: TagCreate) -> TagRead:
         """Create a new tag."""
-        tag = Tag(**data.model_dump())
-        self.db.add(tag)
-        await self.db.commit()
-        await self.db.refresh(tag)
+        tag = await self._insert_returning(Tag, data.model_dump(), TagRead)
+        await self.db.flush()
         return tag
 
     async def get_all_tags(self, filters: TagFilter) -> list[Tag]:
@@ -35,29 +30,16 @@ class TagRepository:
         result = await self.db.execute(select(Tag).where(Tag.id == tag_id))
         return result.scalar_one_or_none()
 
-    async def update_tag(self, tag_id: int, data: TagUpdate) -> Tag | None:
+    async def update_tag(self, tag_id: int, data: TagUpdate) -> TagRead | None:
         """Update a tag by ID."""
-        tag = await self.get_tag_by_id(tag_id)
-        if tag is None:
-            return None
-
-        update_data = {k: v for k, v in data.model_dump().items() if v is not None}
-        if not update_data:
-            return tag
-
-        await self.db.execute(update(Tag).where(Tag.id == tag_id).values(**update_data))
-        await self.db.commit()
-        await self.db.refresh(tag)
+        tag = await self._update_returning(Tag, tag_id, changed_fields(data), TagRead)
+        await self.db.flush()
         return tag
 
-    async def delete_tag(self, tag_id: int) -> Tag | None:
+    async def delete_tag(self, tag_id: int) -> TagRead | None:
         """Delete a tag by ID."""
-        tag = await self.get_tag_by_id(tag_id)
-        if tag is None:
-            return None
-
-        await self.db.execute(delete(Tag).where(Tag.id == tag_id))
-        await self.db.commit()
+        tag = await self._delete_returning(Tag, tag_id, TagRead)
+        await self.db.flush()
         return tag
 
     async def get_tags_by_ids(self, tag_ids: list[int]) -> list[Tag]:
@@ -2,4 +2,5 @@ from .Equipment import EquipmentRepository, EquipmentTypeRepository, EquipmentSt
 from .Ingredient import IngredientRepository, IngredientUnitRepository
 from .Table import TableRepository, TableStatusRepository
 from .Dish import DishRepository
-from .Tag import TagRepository
\ No newline at end of file
+from .Tag import TagRepository
+from .Recipe import RecipeRepository
\ No newline at end of file
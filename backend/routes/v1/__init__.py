@@ -9,14 +9,19 @@ from .resources.Dish import router as dish_router
 from .resources.Tag import router as tag_router
 from .resources.Table import router as tables_router
 from .resources.TableStatus import router as table_status_router
+from .resources.BulkImport import router as bulk_import_router
+from .resources.Recipe import router as recipe_router
 
 from .booking.Order import router as orders_router
 from .booking.OrderItem import router as order_items_router
 from .booking.OrderStatus import router as order_statuses_router
 from .booking.OrderItemStatus import router as order_items_statuses_router
+from .booking.Kitchen import router as kitchen_router
 
 from .feedback.Feedback import router as feedback_router
 
+from .jobs.Job import router as jobs_router
+
 
 all_v1_routers = [
     dish_router,
@@ -29,10 +34,14 @@ all_v1_routers = [
     ingredient_router,
     ingredient_unit_router,
     ingredient_analysis_router,
+    bulk_import_router,
+    recipe_router,
     orders_router,
     order_items_router,
     order_statuses_router,
     order_items_statuses_router,
+    kitchen_router,
     feedback_router,
     payments_router,
+    jobs_router,
 ]
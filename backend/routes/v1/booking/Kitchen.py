@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from configs.postgre import get_db
+
+from schemas.booking import PrepTimeGroupBy, PrepTimeRead
+from services.booking import KitchenService
+
+router = APIRouter(prefix="/kitchen", tags=["Kitchen"])
+
+@router.get("/prep-times", response_model=PrepTimeRead)
+async def get_prep_times(
+    start_date: str,
+    end_date: str,
+    group_by: PrepTimeGroupBy = PrepTimeGroupBy.DISH,
+    dish_ids: list[int] | None = Query(None),
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    """p50/p95 time from an item being ordered to it being ready, per dish and/or hour of day."""
+    kitchen_service = KitchenService(db)
+    try:
+        return await kitchen_service.get_prep_times(start_date, end_date, group_by, dish_ids)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
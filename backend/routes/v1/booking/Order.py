@@ -2,8 +2,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 import sys
 
-from configs.postgre import get_db
+from configs.postgre import FAST_READS, get_db
 from repository.booking import OrderRepository
+from repository.fastpath import FastReadRepository
 from schemas.booking import (
     OrderCreate,
     OrderUpdate,
@@ -12,24 +13,18 @@ from schemas.booking import (
 )
 from services.booking import OrderService
 
-from ws import EventBus
-
 router = APIRouter(prefix="/orders", tags=["Orders"])
 
 
 @router.post("", response_model=OrderRead, status_code=status.HTTP_201_CREATED)
 async def create_order(
     payload: OrderCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Create a new order at a table."""
     try:
         order_repo = OrderRepository(db)
-        data = await order_repo.create_order(payload)
-        
-        await EventBus.publish_order_created(data)
-
-        return data
+        return await order_repo.create_order(payload)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -45,7 +40,7 @@ async def create_order(
 @router.get("", response_model=list[OrderRead])
 async def get_orders(
     filters: OrderFilter = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Get all orders with optional filters."""
     order_repo = OrderRepository(db)
@@ -55,11 +50,13 @@ async def get_orders(
 @router.get("/{order_id}", response_model=OrderRead)
 async def get_order(
     order_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Get order by id."""
-    order_repo = OrderRepository(db)
-    order = await order_repo.get_order_by_id(order_id)
+    if FAST_READS:
+        order = await FastReadRepository(db).get_order_by_id(order_id)
+    else:
+        order = await OrderRepository(db).get_order_by_id(order_id)
     
     if order is None:
         raise HTTPException(
@@ -73,7 +70,7 @@ async def get_order(
 async def update_order(
     order_id: int,
     payload: OrderUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Update order status or guest."""
     try:
@@ -85,8 +82,6 @@ async def update_order(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Order {order_id} not found"
             )
-        
-        await EventBus.publish_order_updated(order)
 
         return order
     except ValueError as e:
@@ -99,7 +94,7 @@ async def update_order(
 @router.delete("/{order_id}", response_model=OrderRead | None)
 async def delete_order(
     order_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Delete order."""
     order_repo = OrderRepository(db)
@@ -117,16 +112,12 @@ async def delete_order(
 @router.post("/{order_id}/complete", response_model=OrderRead)
 async def complete_order(
     order_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Complete an order (set status to COMPLETED and free table)."""
     try:
         order_repo = OrderRepository(db)
-        order = await order_repo.complete_order(order_id)
-        
-        await EventBus.publish_order_completed(order)
-        
-        return order
+        return await order_repo.complete_order(order_id)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -137,7 +128,7 @@ async def complete_order(
 @router.get("/{order_id}/total")
 async def get_total(
     order_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     order_service = OrderService(db)
     total = await order_service.calculate_total_amount(order_id)
@@ -1,38 +1,59 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from configs.postgre import get_db
+from configs.postgre import FAST_READS, get_db
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from repository.booking import OrderItemRepository
-from schemas.booking import OrderItemCreate, OrderItemRead, OrderItemUpdate, OrderItemFilter, OrderItemBase
-
-from ws import EventBus
+from repository.fastpath import FastReadRepository
+from schemas.booking import (
+    OrderItemCreate,
+    OrderItemRead,
+    OrderItemUpdate,
+    OrderItemFilter,
+    OrderItemBase,
+    OrderItemBulkTransition,
+    OrderItemBulkTransitionRead,
+)
 
 router = APIRouter(prefix="/orders/items", tags=["OrderItems"])
 
 @router.post("/", response_model=OrderItemBase)
 async def create_order_item(
     order_item: OrderItemCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     order_item_repository = OrderItemRepository(db)
-    item = await order_item_repository.create_order_item(order_item)
-
-    await EventBus.publish_order_item_created(item)
-
-    return item
+    return await order_item_repository.create_order_item(order_item)
 
 @router.get("/", response_model=list[OrderItemRead])
 async def get_order_items(
     filter: OrderItemFilter = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
+    if FAST_READS and filter.model_dump(exclude_none=True).keys() == {"order_id"}:
+        return await FastReadRepository(db).get_order_items_by_order_id(filter.order_id)
     order_item_repository = OrderItemRepository(db)
     return await order_item_repository.get_all_order_items(filter)
 
+@router.post("/transitions", response_model=OrderItemBulkTransitionRead)
+async def transition_order_items(
+    payload: OrderItemBulkTransition,
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    order_item_repository = OrderItemRepository(db)
+    try:
+        return await order_item_repository.transition_order_items(payload)
+    except ValueError as e:
+        code = str(e)
+        if code == "INVALID_STATUS_TRANSITION":
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail=code
+            )
+        raise
+
 @router.get("/{order_item_id}", response_model=OrderItemRead)
 async def get_order_item_by_id(
     order_item_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     order_item_repository = OrderItemRepository(db)
     return await order_item_repository.get_order_item_by_id(order_item_id)
@@ -41,19 +62,23 @@ async def get_order_item_by_id(
 async def update_order_item(
     order_item_id: int,
     order_item: OrderItemUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     order_item_repository = OrderItemRepository(db)
-    item = await order_item_repository.update_order_item(order_item_id, order_item)
-
-    await EventBus.publish_order_item_updated(item)
-
-    return item
+    try:
+        return await order_item_repository.update_order_item(order_item_id, order_item)
+    except ValueError as e:
+        code = str(e)
+        if code == "INVALID_STATUS_TRANSITION":
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail=code
+            )
+        raise
 
 @router.delete("/{order_item_id}", response_model=OrderItemBase | None)
 async def delete_order_item(
     order_item_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     order_item_repository = OrderItemRepository(db)
     item = await order_item_repository.delete_order_item(order_item_id)
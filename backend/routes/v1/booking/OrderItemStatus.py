@@ -17,7 +17,7 @@ router = APIRouter(prefix="/orders/items/statuses", tags=["OrderItemStatuses"])
 @router.post("", response_model=OrderItemStatusRead, status_code=status.HTTP_201_CREATED)
 async def create_status(
 	payload: OrderItemStatusCreate,
-	db: AsyncSession = Depends(get_db),
+	db: AsyncSession = Depends(get_db, scope="function"),
 ):
 	"""Create a new order item status."""
 	try:
@@ -31,7 +31,7 @@ async def create_status(
 @router.get("", response_model=list[OrderItemStatusRead])
 async def get_statuses(
 	filters: OrderItemStatusFilter = Depends(),
-	db: AsyncSession = Depends(get_db),
+	db: AsyncSession = Depends(get_db, scope="function"),
 ):
 	"""List order item statuses (optional filters)."""
 	repo = OrderItemStatusRepository(db)
@@ -42,7 +42,7 @@ async def get_statuses(
 @router.get("/{status_id}", response_model=OrderItemStatusRead)
 async def get_status(
 	status_id: int,
-	db: AsyncSession = Depends(get_db),
+	db: AsyncSession = Depends(get_db, scope="function"),
 ):
 	repo = OrderItemStatusRepository(db)
 	status_obj = await repo.get_status_by_id(status_id)
@@ -55,7 +55,7 @@ async def get_status(
 async def update_status(
 	status_id: int,
 	payload: OrderItemStatusUpdate,
-	db: AsyncSession = Depends(get_db),
+	db: AsyncSession = Depends(get_db, scope="function"),
 ):
 	"""Update an order item status."""
 	try:
@@ -71,7 +71,7 @@ async def update_status(
 @router.delete("/{status_id}", response_model=OrderItemStatusRead)
 async def delete_status(
 	status_id: int,
-	db: AsyncSession = Depends(get_db),
+	db: AsyncSession = Depends(get_db, scope="function"),
 ):
 	repo = OrderItemStatusRepository(db)
 	status_obj = await repo.delete_status(status_id)
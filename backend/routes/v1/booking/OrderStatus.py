@@ -17,7 +17,7 @@ router = APIRouter(prefix="/order/statuses", tags=["OrderStatuses"])
 @router.post("", response_model=OrderStatusRead, status_code=status.HTTP_201_CREATED)
 async def create_status(
 	payload: OrderStatusCreate,
-	db: AsyncSession = Depends(get_db),
+	db: AsyncSession = Depends(get_db, scope="function"),
 ):
 	"""Create a new order status."""
 	try:
@@ -30,7 +30,7 @@ async def create_status(
 @router.get("", response_model=list[OrderStatusRead])
 async def get_statuses(
 	filters: OrderStatusFilter = Depends(),
-	db: AsyncSession = Depends(get_db),
+	db: AsyncSession = Depends(get_db, scope="function"),
 ):
 	"""Get all order statuses (optional filters)."""
 	repo = OrderStatusRepository(db)
@@ -40,7 +40,7 @@ async def get_statuses(
 @router.get("/{status_id}", response_model=OrderStatusRead)
 async def get_status(
 	status_id: int,
-	db: AsyncSession = Depends(get_db),
+	db: AsyncSession = Depends(get_db, scope="function"),
 ):
 	"""Get a single status by id."""
 	repo = OrderStatusRepository(db)
@@ -54,7 +54,7 @@ async def get_status(
 async def update_status(
 	status_id: int,
 	payload: OrderStatusUpdate,
-	db: AsyncSession = Depends(get_db),
+	db: AsyncSession = Depends(get_db, scope="function"),
 ):
 	"""Update an existing order status."""
 	try:
@@ -70,7 +70,7 @@ async def update_status(
 @router.delete("/{status_id}", response_model=OrderStatusRead)
 async def delete_status(
 	status_id: int,
-	db: AsyncSession = Depends(get_db),
+	db: AsyncSession = Depends(get_db, scope="function"),
 ):
 	"""Delete an order status."""
 	repo = OrderStatusRepository(db)
@@ -12,7 +12,7 @@ router = APIRouter(prefix="/feedbacks", tags=["Feedbacks"])
 @router.post("/", response_model=FeedbackRead)
 async def create_feedback(
     feedback: FeedbackCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     feedback_repository = FeedbackRepository(db)
     return await feedback_repository.create_feedback(feedback)
@@ -21,7 +21,7 @@ async def create_feedback(
 @router.get("/", response_model=list[FeedbackRead])
 async def get_feedbacks(
     filter: FeedbackFilter = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     feedback_repository = FeedbackRepository(db)
     return await feedback_repository.get_all_feedback(filter)
@@ -30,7 +30,7 @@ async def get_feedbacks(
 @router.get("/{feedback_id}", response_model=FeedbackRead)
 async def get_feedback_by_id(
     feedback_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     feedback_repository = FeedbackRepository(db)
     return await feedback_repository.get_feedback_by_id(feedback_id)
@@ -40,7 +40,7 @@ async def get_feedback_by_id(
 async def update_feedback(
     feedback_id: int,
     feedback: FeedbackUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     feedback_repository = FeedbackRepository(db)
     return await feedback_repository.update_feedback(feedback_id, feedback)
@@ -49,7 +49,7 @@ async def update_feedback(
 @router.delete("/{feedback_id}", response_model=FeedbackRead)
 async def delete_feedback(
     feedback_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     feedback_repository = FeedbackRepository(db)
     return await feedback_repository.delete_feedback(feedback_id)
\ No newline at end of file
@@ -0,0 +1,139 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from configs.postgre import get_db
+
+from repository.jobs import JobRepository, JobScheduleRepository
+from schemas.jobs import JobCreate, JobFilter, JobRead, JobScheduleCreate, JobScheduleUpdate, JobScheduleRead
+from services.jobs import JOB_REGISTRY
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+def check_job_name(name: str | None):
+    if name is not None and name not in JOB_REGISTRY:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown job '{name}'. Registered jobs: {sorted(JOB_REGISTRY)}"
+        )
+
+
+@router.post("", response_model=JobRead)
+async def enqueue_job(
+    job: JobCreate,
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    check_job_name(job.name)
+    job_repository = JobRepository(db)
+    return await job_repository.enqueue(job, commit=False)
+
+
+@router.get("", response_model=list[JobRead])
+async def get_jobs(
+    filter: JobFilter = Depends(),
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    job_repository = JobRepository(db)
+    return await job_repository.get_jobs(filter)
+
+
+@router.get("/registry", response_model=list[str])
+async def get_registered_jobs():
+    return sorted(JOB_REGISTRY)
+
+
+@router.post("/schedules", response_model=JobScheduleRead)
+async def create_schedule(
+    schedule: JobScheduleCreate,
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    check_job_name(schedule.job_name)
+    schedule_repository = JobScheduleRepository(db)
+    try:
+        return await schedule_repository.create_schedule(schedule)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+
+@router.get("/schedules", response_model=list[JobScheduleRead])
+async def get_schedules(
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    schedule_repository = JobScheduleRepository(db)
+    return await schedule_repository.get_all_schedules()
+
+
+@router.put("/schedules/{schedule_id}", response_model=JobScheduleRead)
+async def update_schedule(
+    schedule_id: int,
+    schedule: JobScheduleUpdate,
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    check_job_name(schedule.job_name)
+    schedule_repository = JobScheduleRepository(db)
+    try:
+        updated = await schedule_repository.update_schedule(schedule_id, schedule)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    if updated is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Schedule with id {schedule_id} not found"
+        )
+    return updated
+
+
+@router.delete("/schedules/{schedule_id}", response_model=JobScheduleRead)
+async def delete_schedule(
+    schedule_id: int,
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    schedule_repository = JobScheduleRepository(db)
+    deleted = await schedule_repository.delete_schedule(schedule_id)
+    if deleted is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Schedule with id {schedule_id} not found"
+        )
+    return deleted
+
+
+@router.get("/{job_id}", response_model=JobRead)
+async def get_job_by_id(
+    job_id: int,
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    job_repository = JobRepository(db)
+    job = await job_repository.get_job_by_id(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with id {job_id} not found"
+        )
+    return job
+
+
+@router.post("/{job_id}/retry", response_model=JobRead)
+async def retry_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    job_repository = JobRepository(db)
+    try:
+        job = await job_repository.retry_job(job_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job with id {job_id} not found"
+        )
+    return job
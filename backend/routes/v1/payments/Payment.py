@@ -1,9 +1,12 @@
 # routes/v1/payments/Payment.py
+from datetime import datetime
+
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from utils.vnpay import build_vnpay_payment_url
 
 from configs.postgre import get_db
+from utils.format import to_naive_utc
 from schemas.payments import (
     Payment,
     PaymentCreate,
@@ -27,15 +30,20 @@ router = APIRouter(prefix="/payments", tags=["Payments"])
 async def list_payments(
     booking_id: int | None = None,
     status_id: int | None = None,
-    db: AsyncSession = Depends(get_db),
+    paid_from: datetime | None = None,
+    paid_to: datetime | None = None,
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
-    return await list_payments_repo(db, booking_id=booking_id, status_id=status_id)
+    return await list_payments_repo(
+        db, booking_id=booking_id, status_id=status_id,
+        paid_from=to_naive_utc(paid_from), paid_to=to_naive_utc(paid_to),
+    )
 
 
 @router.get("/{payment_id}", response_model=Payment)
 async def get_payment(
     payment_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     payment = await get_payment_repo(db, payment_id)
     if payment is None:
@@ -49,7 +57,7 @@ async def get_payment(
 async def create_payment(
     payload: PaymentCreate,
     request: Request, 
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     payment = await create_payment_repo(db, payload)
 
@@ -70,7 +78,7 @@ async def create_payment(
 async def update_payment(
     payment_id: int,
     payload: PaymentUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     try:
         return await update_payment_status_repo(db, payment_id, payload)
@@ -91,7 +99,7 @@ async def update_payment(
 async def handle_webhook(
     provider: str,
     payload: PaymentWebhookPayload,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     try:
         return await handle_webhook_repo(db, provider, payload)
@@ -112,7 +120,7 @@ async def handle_webhook(
 async def refund_payment(
     payment_id: int,
     payload: PaymentRefund,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     try:
         return await refund_payment_repo(db, payment_id, payload)
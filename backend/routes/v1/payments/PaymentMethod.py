@@ -14,7 +14,7 @@ router = APIRouter(prefix="/payment-methods", tags=["Payment Methods"])
 
 @router.get("", response_model=list[PaymentMethodRead])
 async def list_payment_methods(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     repo = PaymentMethodRepository(db)
     methods = await repo.get_all()
@@ -24,7 +24,7 @@ async def list_payment_methods(
 @router.get("/{method_id}", response_model=PaymentMethodRead)
 async def get_payment_method(
     method_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     repo = PaymentMethodRepository(db)
     method = await repo.get_by_id(method_id)
@@ -43,7 +43,7 @@ async def get_payment_method(
 )
 async def create_payment_method(
     payload: PaymentMethodCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     repo = PaymentMethodRepository(db)
     try:
@@ -62,7 +62,7 @@ async def create_payment_method(
 async def update_payment_method(
     method_id: int,
     payload: PaymentMethodUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     repo = PaymentMethodRepository(db)
     try:
@@ -89,7 +89,7 @@ async def update_payment_method(
 )
 async def delete_payment_method(
     method_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     repo = PaymentMethodRepository(db)
     deleted = await repo.delete(method_id)
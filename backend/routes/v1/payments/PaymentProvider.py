@@ -13,7 +13,7 @@ router = APIRouter(prefix="/payment-providers", tags=["Payment Providers"])
 
 
 @router.get("", response_model=list[PaymentProviderRead])
-async def list_payment_providers(db: AsyncSession = Depends(get_db)):
+async def list_payment_providers(db: AsyncSession = Depends(get_db, scope="function")):
     repo = PaymentProviderRepository(db)
     return await repo.get_all()
 
@@ -21,7 +21,7 @@ async def list_payment_providers(db: AsyncSession = Depends(get_db)):
 @router.get("/{provider_id}", response_model=PaymentProviderRead)
 async def get_payment_provider(
     provider_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     repo = PaymentProviderRepository(db)
     provider = await repo.get_by_id(provider_id)
@@ -40,7 +40,7 @@ async def get_payment_provider(
 )
 async def create_payment_provider(
     payload: PaymentProviderCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     repo = PaymentProviderRepository(db)
     return await repo.create(payload)
@@ -50,7 +50,7 @@ async def create_payment_provider(
 async def update_payment_provider(
     provider_id: int,
     payload: PaymentProviderUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     repo = PaymentProviderRepository(db)
     provider = await repo.update(provider_id, payload)
@@ -65,7 +65,7 @@ async def update_payment_provider(
 @router.delete("/{provider_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_payment_provider(
     provider_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     repo = PaymentProviderRepository(db)
     deleted = await repo.delete(provider_id)
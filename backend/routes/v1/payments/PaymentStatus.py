@@ -19,7 +19,7 @@ router = APIRouter(
 
 @router.get("", response_model=List[PaymentStatusRead])
 async def list_payment_statuses(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     repo = PaymentStatusRepository(db)
     statuses = await repo.get_all()
@@ -32,7 +32,7 @@ async def list_payment_statuses(
 @router.get("/{status_id}", response_model=PaymentStatusRead)
 async def get_payment_status(
     status_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     repo = PaymentStatusRepository(db)
     status_obj = await repo.get_by_id(status_id)
@@ -50,28 +50,25 @@ async def get_payment_status(
 )
 async def create_payment_status(
     payload: PaymentStatusCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     repo = PaymentStatusRepository(db)
-    status_obj = await repo.create(payload)
-    return PaymentStatusRead.model_validate(status_obj, from_attributes=True)
+    return await repo.create(payload)
 
 @router.put("/{status_id}", response_model=PaymentStatusRead)
 async def update_payment_status(
     status_id: int,
     payload: PaymentStatusUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     repo = PaymentStatusRepository(db)
-    status_obj = await repo.get_by_id(status_id)
+    status_obj = await repo.update(status_id, payload)
     if status_obj is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Payment status not found",
         )
-
-    status_obj = await repo.update(status_obj, payload)
-    return PaymentStatusRead.model_validate(status_obj, from_attributes=True)
+    return status_obj
 
 @router.delete(
     "/{status_id}",
@@ -79,15 +76,12 @@ async def update_payment_status(
 )
 async def delete_payment_status(
     status_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     repo = PaymentStatusRepository(db)
-    status_obj = await repo.get_by_id(status_id)
-    if status_obj is None:
+    if not await repo.delete(status_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Payment status not found",
         )
-
-    await repo.delete(status_obj)
     return None
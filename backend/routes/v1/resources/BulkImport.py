@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.postgre import get_db
+from schemas.resources import BulkImportEntity, BulkImportFormat, BulkImportResult
+from services.resources import BulkImportService
+from services.resources.BulkImport import detect_format, parse_rows
+
+router = APIRouter(prefix="/resources/imports", tags=["Bulk Import"])
+
+
+@router.post("/{entity}", response_model=BulkImportResult)
+async def bulk_import(
+    entity: BulkImportEntity,
+    file: UploadFile = File(...),
+    format: BulkImportFormat | None = Query(None, description="csv or ndjson; guessed from the file name if omitted"),
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    """
+    Import dishes, ingredients, equipments or tables from a CSV/NDJSON file.
+    Valid rows are loaded in one transaction; invalid rows are reported per row.
+    """
+    fmt = format or detect_format(file.filename, file.content_type)
+    try:
+        rows = parse_rows(await file.read(), fmt)
+    except (UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Could not read file: {str(e)}"
+        )
+
+    service = BulkImportService(db)
+    return await service.import_rows(entity, rows)
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File
-from configs.postgre import get_db
+from configs.postgre import FAST_READS, get_db, release_connection
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from repository.fastpath import FastReadRepository
 from repository.resources import DishRepository
 from schemas.resources import DishCreate, DishUpdate, DishRead, DishReadExtended, DishFilter
 from services.storage import storage_service
@@ -13,10 +14,12 @@ router = APIRouter(prefix="/resources/dishes", tags=["Dishes"])
 async def get_dishes(
     include_tags: bool = Query(False, description="Include tags in the response"),
     filter: DishFilter = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Get all dishes with optional filters and tags."""
     try:
+        if FAST_READS and not include_tags and not filter.model_dump(exclude_none=True):
+            return await FastReadRepository(db).get_dishes()
         dish_repository = DishRepository(db)
         return await dish_repository.get_all_dishes(filter, include_tags=include_tags)
     except Exception as e:
@@ -29,7 +32,7 @@ async def get_dishes(
 @router.post("/", response_model=DishReadExtended, status_code=status.HTTP_201_CREATED)
 async def create_dish(
     dish: DishCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Create a new dish with optional tags."""
     dish_repository = DishRepository(db)
@@ -51,7 +54,7 @@ async def create_dish(
 async def get_dish_by_id(
     dish_id: int,
     include_tags: bool = Query(False, description="Include tags in the response"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Get a dish by ID with optional tags."""
     try:
@@ -78,7 +81,7 @@ async def get_dish_by_id(
 async def update_dish(
     dish_id: int,
     dish: DishUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Update a dish by ID, including tags."""
     dish_repository = DishRepository(db)
@@ -109,7 +112,7 @@ async def update_dish(
 @router.delete("/{dish_id}", response_model=DishRead)
 async def delete_dish(
     dish_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Delete a dish by ID."""
     try:
@@ -136,7 +139,7 @@ async def delete_dish(
 async def upload_dish_image(
     dish_id: int,
     file: UploadFile = File(...),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """
     Upload an image for a specific dish to Supabase Storage.
@@ -159,6 +162,9 @@ async def upload_dish_image(
             detail=f"Dish with id {dish_id} not found"
         )
 
+    # Nothing written yet; don't hold a pooled connection during the upload
+    await release_connection(db)
+
     try:
         # Upload image to Supabase
         image_url = await storage_service.upload_dish_image(
@@ -185,7 +191,7 @@ async def upload_dish_image(
 @router.delete("/{dish_id}/delete-image", response_model=dict)
 async def delete_dish_image(
     dish_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Delete the image for a specific dish from Supabase Storage."""
     try:
@@ -206,6 +212,7 @@ async def delete_dish_image(
 
         # Store the image URL before deleting
         image_url_to_delete = dish.image_url
+        await release_connection(db)
 
         # Delete from Supabase Storage (this will raise exception if it fails)
         await storage_service.delete_dish_image(image_url_to_delete)
@@ -11,7 +11,7 @@ router = APIRouter(prefix="/resources/equipments", tags=["Equipments"])
 @router.post("", response_model=EquipmentReadBase)
 async def create_equipment(
     equipment: EquipmentCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     equip_repository = EquipmentRepository(db)
     return await equip_repository.create_equipment(equipment)
@@ -20,7 +20,7 @@ async def create_equipment(
 @router.get("", response_model=list[EquipmentReadExtended])
 async def get_equipments(
     filter: EquipmentFilter = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     equip_repository = EquipmentRepository(db)
     return await equip_repository.get_all_equipment(filter)
@@ -29,7 +29,7 @@ async def get_equipments(
 @router.get("/{equipment_id}", response_model=EquipmentReadExtended)
 async def get_equipment_by_id(
     equipment_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     equip_repository = EquipmentRepository(db)
     return await equip_repository.get_equipment_by_id(equipment_id)
@@ -39,7 +39,7 @@ async def get_equipment_by_id(
 async def update_equipment(
     equipment_id: int,
     equipment: EquipmentUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     equip_repository = EquipmentRepository(db)
     return await equip_repository.update_equipment(equipment_id, equipment)
@@ -48,7 +48,7 @@ async def update_equipment(
 @router.delete("/{equipment_id}", response_model=EquipmentReadBase)
 async def delete_equipment(
     equipment_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     equip_repository = EquipmentRepository(db)
     return await equip_repository.delete_equipment(equipment_id)
\ No newline at end of file
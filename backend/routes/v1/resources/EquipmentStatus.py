@@ -10,7 +10,7 @@ router = APIRouter(prefix="/resources/equipment-statuses", tags=["Equipments"])
 @router.post("", response_model=EquipmentStatusRead)
 async def create_equipment_status(
     equipment_status: EquipmentStatusCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     equipment_status_repository = EquipmentStatusRepository(db)
     return await equipment_status_repository.create_equipment_status(equipment_status)
@@ -18,7 +18,7 @@ async def create_equipment_status(
 @router.get("", response_model=list[EquipmentStatusRead])
 async def get_equipment_statuses(
     filter: EquipmentStatusFilter = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     equipment_status_repository = EquipmentStatusRepository(db)
     return await equipment_status_repository.get_all_equipment_statuses(filter)
@@ -26,7 +26,7 @@ async def get_equipment_statuses(
 @router.get("/{equipment_status_id}", response_model=EquipmentStatusRead)
 async def get_equipment_status_by_id(
     equipment_status_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     equipment_status_repository = EquipmentStatusRepository(db)
     return await equipment_status_repository.get_equipment_status_by_id(equipment_status_id)
@@ -35,7 +35,7 @@ async def get_equipment_status_by_id(
 async def update_equipment_status(
     equipment_status_id: int,
     equipment_status: EquipmentStatusUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     equipment_status_repository = EquipmentStatusRepository(db)
     return await equipment_status_repository.update_equipment_status(equipment_status_id, equipment_status)
@@ -43,7 +43,7 @@ async def update_equipment_status(
 @router.delete("/{equipment_status_id}", response_model=EquipmentStatusRead)
 async def delete_equipment_status(
     equipment_status_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     equipment_status_repository = EquipmentStatusRepository(db)
     return await equipment_status_repository.delete_equipment_status(equipment_status_id)
\ No newline at end of file
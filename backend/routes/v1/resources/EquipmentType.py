@@ -10,7 +10,7 @@ router = APIRouter(prefix="/resources/equipment-types", tags=["Equipments"])
 @router.post("", response_model=EquipmentTypeRead)
 async def create_equipment_type(
     equipment_type: EquipmentTypeCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     equipment_type_repository = EquipmentTypeRepository(db)
     return await equipment_type_repository.create_equipment_type(equipment_type)
@@ -19,7 +19,7 @@ async def create_equipment_type(
 @router.get("", response_model=list[EquipmentTypeRead])
 async def get_equipment_types(
     filter: EquipmentTypeFilter = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     equipment_type_repository = EquipmentTypeRepository(db)
     return await equipment_type_repository.get_all_equipment_types(filter)
@@ -28,7 +28,7 @@ async def get_equipment_types(
 @router.get("/{equipment_type_id}", response_model=EquipmentTypeRead)
 async def get_equipment_type_by_id(
     equipment_type_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     equipment_type_repository = EquipmentTypeRepository(db)
     return await equipment_type_repository.get_equipment_type_by_id(equipment_type_id)
@@ -38,7 +38,7 @@ async def get_equipment_type_by_id(
 async def update_equipment_type(
     equipment_type_id: int,
     equipment_type: EquipmentTypeUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     equipment_type_repository = EquipmentTypeRepository(db)
     return await equipment_type_repository.update_equipment_type(equipment_type_id, equipment_type)
@@ -47,7 +47,7 @@ async def update_equipment_type(
 @router.delete("/{equipment_type_id}", response_model=EquipmentTypeRead)
 async def delete_equipment_type(
     equipment_type_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     equipment_type_repository = EquipmentTypeRepository(db)
     return await equipment_type_repository.delete_equipment_type(equipment_type_id)
\ No newline at end of file
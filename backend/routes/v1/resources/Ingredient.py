@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from configs.postgre import get_db
 
 from repository.resources import IngredientRepository
-from schemas.resources import IngredientCreate, IngredientUpdate, IngredientReadBase, IngredientReadExtended, IngredientFilter
+from schemas.resources import (IngredientCreate, IngredientUpdate, IngredientReadBase, IngredientReadExtended, IngredientFilter,
+    IngredientStockTakeCreate, IngredientStockTakeRead)
 
 router = APIRouter(prefix="/resources/ingredients", tags=["Ingredients"])
 
@@ -11,16 +12,25 @@ router = APIRouter(prefix="/resources/ingredients", tags=["Ingredients"])
 @router.post("", response_model=IngredientReadBase)
 async def create_ingredient(
     ingredient: IngredientCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     ingredient_repository = IngredientRepository(db)
     return await ingredient_repository.create_ingredient(ingredient)
 
 
+@router.post("/stock-takes", response_model=IngredientStockTakeRead)
+async def adjust_ingredient_stock(
+    stock_take: IngredientStockTakeCreate,
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    ingredient_repository = IngredientRepository(db)
+    return await ingredient_repository.adjust_stock(stock_take)
+
+
 @router.get("", response_model=list[IngredientReadExtended])
 async def get_ingredients(
     filter: IngredientFilter = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     ingredient_repository = IngredientRepository(db)
     return await ingredient_repository.get_all_ingredients(filter)
@@ -29,7 +39,7 @@ async def get_ingredients(
 @router.get("/{ingredient_id}", response_model=IngredientReadExtended)
 async def get_ingredient_by_id(
     ingredient_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     ingredient_repository = IngredientRepository(db)
     return await ingredient_repository.get_ingredient_by_id(ingredient_id)
@@ -39,16 +49,17 @@ async def get_ingredient_by_id(
 async def update_ingredient(
     ingredient_id: int,
     ingredient: IngredientUpdate,
-    db: AsyncSession = Depends(get_db),
+    reason: str | None = Query(None, max_length=255, description="Recorded on the ingredient history row"),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     ingredient_repository = IngredientRepository(db)
-    return await ingredient_repository.update_ingredient(ingredient_id, ingredient)
+    return await ingredient_repository.update_ingredient(ingredient_id, ingredient, reason=reason)
 
 
 @router.delete("/{ingredient_id}", response_model=IngredientReadBase)
 async def delete_ingredient(
     ingredient_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     ingredient_repository = IngredientRepository(db)
     return await ingredient_repository.delete_ingredient(ingredient_id)
\ No newline at end of file
@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from configs.postgre import get_db
 
+from schemas.resources import (IngredientTimeseriesMode, IngredientTimeseriesRead,
+    IngredientUsageEncoding, IngredientUsageMatrixRead)
 from services.resources import TrackingService, RestockService
 
 router = APIRouter(prefix="/resources/ingredient-analyses", tags=["Ingredients"])
@@ -11,14 +13,51 @@ async def track_ingredient_usage(
     ingredient_id: int,
     start_date: str,
     end_date: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     tracking_service = TrackingService(db)
     return await tracking_service.get_history_by_period(ingredient_id, start_date, end_date)
 
+@router.get("/timeseries", response_model=IngredientTimeseriesRead)
+async def get_ingredient_timeseries(
+    start_date: str,
+    end_date: str,
+    ingredient_ids: list[int] = Query(..., min_length=1, max_length=100),
+    points: int = Query(500, ge=10, le=5000, description="Approximate number of points per ingredient"),
+    mode: IngredientTimeseriesMode = IngredientTimeseriesMode.BUCKET,
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    """Chart-ready stock levels for several ingredients as columnar arrays."""
+    tracking_service = TrackingService(db)
+    try:
+        return await tracking_service.get_timeseries(ingredient_ids, start_date, end_date, points, mode)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get("/usage-matrix", response_model=IngredientUsageMatrixRead)
+async def get_ingredient_usage_matrix(
+    start_date: str,
+    end_date: str,
+    ingredient_ids: list[int] | None = Query(None),
+    encoding: IngredientUsageEncoding = IngredientUsageEncoding.DENSE,
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    """Daily usage of every ingredient over a period, as an ingredient x day matrix."""
+    tracking_service = TrackingService(db)
+    try:
+        return await tracking_service.get_usage_matrix(start_date, end_date, ingredient_ids, encoding)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
 @router.get("/restock")
 async def suggest_restock_quantity(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     restock_service = RestockService(db)
     return await restock_service.get_quantity_info()
\ No newline at end of file
@@ -10,7 +10,7 @@ router = APIRouter(prefix="/resources/ingredient-units", tags=["Ingredients"])
 @router.post("", response_model=IngredientUnitRead)
 async def create_ingredient_unit(
     ingredient_unit: IngredientUnitCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     ingredient_unit_repository = IngredientUnitRepository(db)
     return await ingredient_unit_repository.create_ingredient_unit(ingredient_unit)
@@ -19,7 +19,7 @@ async def create_ingredient_unit(
 @router.get("", response_model=list[IngredientUnitRead])
 async def get_ingredient_units(
     filter: IngredientUnitFilter = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     ingredient_unit_repository = IngredientUnitRepository(db)
     return await ingredient_unit_repository.get_all_ingredient_units(filter)
@@ -28,7 +28,7 @@ async def get_ingredient_units(
 @router.get("/{ingredient_unit_id}", response_model=IngredientUnitRead)
 async def get_ingredient_unit_by_id(
     ingredient_unit_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     ingredient_unit_repository = IngredientUnitRepository(db)
     return await ingredient_unit_repository.get_ingredient_unit_by_id(ingredient_unit_id)
@@ -38,7 +38,7 @@ async def get_ingredient_unit_by_id(
 async def update_ingredient_unit(
     ingredient_unit_id: int,
     ingredient_unit: IngredientUnitUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     ingredient_unit_repository = IngredientUnitRepository(db)
     return await ingredient_unit_repository.update_ingredient_unit(ingredient_unit_id, ingredient_unit)
@@ -47,7 +47,7 @@ async def update_ingredient_unit(
 @router.delete("/{ingredient_unit_id}", response_model=IngredientUnitRead)
 async def delete_ingredient_unit(
     ingredient_unit_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     ingredient_unit_repository = IngredientUnitRepository(db)
     return await ingredient_unit_repository.delete_ingredient_unit(ingredient_unit_id)
\ No newline at end of file
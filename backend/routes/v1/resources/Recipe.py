@@ -0,0 +1,64 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.postgre import get_db
+from repository.resources import RecipeRepository
+from schemas.resources import RecipeUpdate, RecipeItemRead, StockConsumptionRead
+from utils.format import to_naive_utc
+
+router = APIRouter(prefix="/resources", tags=["Recipes"])
+
+
+@router.get("/dishes/{dish_id}/recipe", response_model=list[RecipeItemRead])
+async def get_recipe(
+    dish_id: int,
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    """Get the ingredients consumed by one portion of a dish."""
+    recipe_repository = RecipeRepository(db)
+    return await recipe_repository.get_recipe(dish_id)
+
+
+@router.put("/dishes/{dish_id}/recipe", response_model=list[RecipeItemRead])
+async def set_recipe(
+    dish_id: int,
+    payload: RecipeUpdate,
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    """Replace the recipe of a dish."""
+    recipe_repository = RecipeRepository(db)
+    try:
+        recipe = await recipe_repository.set_recipe(dish_id, payload)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    if recipe is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Dish with id {dish_id} not found"
+        )
+    return recipe
+
+
+@router.post("/recipes/consume", response_model=StockConsumptionRead)
+async def consume_served_items(
+    order_id: int | None = None,
+    completed_from: datetime | None = None,   # inclusive
+    completed_to: datetime | None = None,     # exclusive
+    db: AsyncSession = Depends(get_db, scope="function"),
+):
+    """
+    Deduct stock for served order items that have not been consumed yet,
+    for one order, for orders completed in a time window, or for every pending order at once.
+    """
+    completed_from, completed_to = to_naive_utc(completed_from), to_naive_utc(completed_to)
+    recipe_repository = RecipeRepository(db)
+    items = await recipe_repository.consume_served_items(order_id, completed_from, completed_to)
+    return StockConsumptionRead(
+        order_id=order_id, completed_from=completed_from, completed_to=completed_to, items=items
+    )
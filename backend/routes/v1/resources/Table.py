@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from configs.postgre import get_db
+from configs.postgre import FAST_READS, get_db
+from repository.fastpath import FastReadRepository
 from repository.resources import TableRepository
 from schemas.resources import (
     TableCreate,
@@ -17,7 +18,7 @@ router = APIRouter(prefix="/tables", tags=["Tables"])
 @router.post("", response_model=TableReadBase, status_code=status.HTTP_201_CREATED)
 async def create_table(
     payload: TableCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Create a new table."""
     try:
@@ -33,9 +34,11 @@ async def create_table(
 @router.get("", response_model=list[TableReadExtended])
 async def get_tables(
     filters: TableFilter = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Get all tables with optional filters."""
+    if FAST_READS and not filters.model_dump(exclude_none=True):
+        return await FastReadRepository(db).get_tables()
     table_repo = TableRepository(db)
     return await table_repo.get_all_tables(filters)
 
@@ -43,7 +46,7 @@ async def get_tables(
 @router.get("/{table_id}", response_model=TableReadExtended)
 async def get_table(
     table_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Get table by id."""
     table_repo = TableRepository(db)
@@ -61,7 +64,7 @@ async def get_table(
 async def update_table(
     table_id: int,
     payload: TableUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Update table info."""
     try:
@@ -84,7 +87,7 @@ async def update_table(
 @router.delete("/{table_id}", response_model=TableReadBase)
 async def delete_table(
     table_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Delete table."""
     table_repo = TableRepository(db)
@@ -10,7 +10,7 @@ router = APIRouter(prefix="/tables-statuses", tags=["Tables"])
 @router.post("", response_model=TableStatusRead, status_code=status.HTTP_201_CREATED)
 async def create_table_status(
     payload: TableStatusCreate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db, scope="function")
 ):
     try:
         repos = TableStatusRepository(db)
@@ -22,7 +22,7 @@ async def create_table_status(
 @router.get("", response_model=list[TableStatusRead])
 async def get_table_statuses(
     filters: TableStatusFilter = Depends(),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db, scope="function")
 ):
     repos = TableStatusRepository(db)
     statuses = await repos.get_all_table_statuses(filters) 
@@ -32,7 +32,7 @@ async def get_table_statuses(
 @router.get("/{status_id}", response_model=TableStatusRead)
 async def get_table_status(
     status_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db, scope="function")
 ):
     repos = TableStatusRepository(db)
     status_obj = await repos.get_table_status_by_id(status_id)
@@ -45,7 +45,7 @@ async def get_table_status(
 async def update_table_status(
     status_id: int,
     payload: TableStatusUpdate,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db, scope="function")
 ):
     try:
         repos = TableStatusRepository(db)
@@ -60,7 +60,7 @@ async def update_table_status(
 @router.delete("/{status_id}", response_model=TableStatusRead)
 async def delete_table_status(
     status_id: int,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_db, scope="function")
 ):
     repos = TableStatusRepository(db)
     status_obj = await repos.delete_table_status(status_id)
@@ -11,7 +11,7 @@ router = APIRouter(prefix="/resources/tags", tags=["Tags"])
 @router.get("/", response_model=list[TagRead])
 async def get_tags(
     filter: TagFilter = Depends(),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Get all tags with optional filters."""
     tag_repository = TagRepository(db)
@@ -21,7 +21,7 @@ async def get_tags(
 @router.post("/", response_model=TagRead, status_code=status.HTTP_201_CREATED)
 async def create_tag(
     tag: TagCreate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Create a new tag."""
     tag_repository = TagRepository(db)
@@ -37,7 +37,7 @@ async def create_tag(
 @router.get("/{tag_id}", response_model=TagRead)
 async def get_tag_by_id(
     tag_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Get a tag by ID."""
     tag_repository = TagRepository(db)
@@ -56,7 +56,7 @@ async def get_tag_by_id(
 async def update_tag(
     tag_id: int,
     tag: TagUpdate,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Update a tag by ID."""
     tag_repository = TagRepository(db)
@@ -74,7 +74,7 @@ async def update_tag(
 @router.delete("/{tag_id}", response_model=TagRead)
 async def delete_tag(
     tag_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db, scope="function"),
 ):
     """Delete a tag by ID."""
     tag_repository = TagRepository(db)
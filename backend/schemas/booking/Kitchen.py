@@ -0,0 +1,26 @@
+from datetime import datetime
+from enum import Enum
+
+from pydantic import BaseModel
+
+
+# --- Prep Time Schemas ---
+class PrepTimeGroupBy(str, Enum):
+    DISH = "dish"             # one row per dish over the whole period
+    HOUR = "hour"             # one row per hour of day (0-23, UTC) across all dishes
+    DISH_HOUR = "dish_hour"   # one row per dish and hour of day
+
+class PrepTimeStats(BaseModel):
+    dish_id: int | None = None
+    hour: int | None = None
+    count: int
+    p50_seconds: float
+    p95_seconds: float
+    mean_seconds: float
+
+class PrepTimeRead(BaseModel):
+    start: datetime
+    end: datetime
+    group_by: PrepTimeGroupBy
+    relative_accuracy: float    # percentiles are within this fraction of the exact value
+    stats: list[PrepTimeStats]
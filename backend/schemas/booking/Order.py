@@ -1,6 +1,9 @@
-from pydantic import BaseModel
+from datetime import datetime
+from pydantic import BaseModel, field_validator
 from typing import Optional
 
+from utils.format import to_naive_utc
+
 
 class OrderCreate(BaseModel):
     """Create Order at a table"""
@@ -20,6 +23,13 @@ class OrderFilter(BaseModel):
     table_id: Optional[int] = None
     status_id: Optional[int] = None
     guest_id: Optional[int] = None
+    created_from: Optional[datetime] = None  # inclusive
+    created_to: Optional[datetime] = None    # exclusive
+
+    @field_validator("created_from", "created_to")
+    @classmethod
+    def to_naive_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
+        return to_naive_utc(value)
 
 
 class OrderRead(BaseModel):
@@ -28,6 +38,8 @@ class OrderRead(BaseModel):
     table_id: int
     status_id: int
     guest_id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
 
     model_config = {
         "from_attributes": True
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from ..resources import DishRead
 from .OrderItemStatus import OrderItemStatusRead
 
@@ -34,4 +34,19 @@ class OrderItemRead(OrderItemBase):
     dish: DishRead
     status: OrderItemStatusRead
 
-
+# --- Bulk Transition Schemas ---
+class OrderItemBulkTransition(BaseModel):
+    ids: list[int] | None = Field(None, min_length=1)
+    order_id: int | None = None
+    from_status_id: int | None = None   # defaults to every status allowed to move to to_status_id
+    to_status_id: int
+
+    @model_validator(mode="after")
+    def check_ids_or_order(self):
+        if (self.ids is None) == (self.order_id is None):
+            raise ValueError("Provide exactly one of ids or order_id.")
+        return self
+
+class OrderItemBulkTransitionRead(BaseModel):
+    items: list[OrderItemBase]
+    skipped_ids: list[int] = []     # requested ids that do not exist or were not in a source status
@@ -1,5 +1,6 @@
 from .OrderItem import OrderItemCreate, OrderItemRead, OrderItemUpdate, OrderItemFilter, OrderItemBase
+from .OrderItem import OrderItemBulkTransition, OrderItemBulkTransitionRead
 from .Order import OrderCreate, OrderRead, OrderUpdate, OrderFilter
 from .OrderItemStatus import OrderItemStatusCreate, OrderItemStatusFilter, OrderItemStatusRead, OrderItemStatusUpdate
 from .OrderStatus import OrderStatusCreate, OrderStatusFilter, OrderStatusUpdate, OrderStatusRead
-
+from .Kitchen import PrepTimeGroupBy, PrepTimeStats, PrepTimeRead
@@ -1,4 +1,7 @@
-from pydantic import BaseModel, Field
+from datetime import datetime
+from pydantic import BaseModel, Field, field_validator
+
+from utils.format import to_naive_utc
 
 # --- Feedback Schemas ---
 class FeedbackCreate(BaseModel):
@@ -12,12 +15,20 @@ class FeedbackUpdate(BaseModel):
     rating: int | None = Field(None, ge=1, le=5)  # Rating between 1 and 5  
 
 class FeedbackFilter(FeedbackUpdate):
-    pass
+    created_from: datetime | None = None  # inclusive
+    created_to: datetime | None = None    # exclusive
+
+    @field_validator("created_from", "created_to")
+    @classmethod
+    def to_naive_utc(cls, value: datetime | None) -> datetime | None:
+        return to_naive_utc(value)
+
 class FeedbackRead(BaseModel):
     id: int
     order_id: int
     comment: str
     rating: int
+    created_at: datetime | None = None
 
     model_config = {
         "from_attributes": True
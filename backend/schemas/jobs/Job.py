@@ -0,0 +1,81 @@
+from datetime import datetime
+from typing import Any
+from pydantic import BaseModel, Field, field_validator
+
+from utils.cron import CronExpression
+from utils.format import to_naive_utc
+
+# --- Job Schemas ---
+class JobCreate(BaseModel):
+    name: str = Field(..., max_length=100)
+    payload: dict[str, Any] = {}
+    priority: int = 0
+    max_attempts: int = Field(5, ge=1, le=20)
+    run_at: datetime | None = None   # UTC, defaults to now
+
+    @field_validator("run_at")
+    @classmethod
+    def to_naive_utc(cls, value: datetime | None) -> datetime | None:
+        return to_naive_utc(value)
+
+class JobFilter(BaseModel):
+    name: str | None = None
+    status: str | None = None
+    limit: int = Field(100, ge=1, le=1000)
+
+class JobRead(BaseModel):
+    id: int
+    name: str
+    payload: dict[str, Any]
+    status: str
+    priority: int
+    attempts: int
+    max_attempts: int
+    run_at: datetime
+    locked_at: datetime | None = None
+    locked_by: str | None = None
+    last_error: str | None = None
+    schedule_id: int | None = None
+    created_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+# --- Job Schedule Schemas ---
+class JobScheduleCreate(BaseModel):
+    name: str = Field(..., max_length=100)
+    job_name: str = Field(..., max_length=100)
+    cron: str = Field(..., max_length=100)
+    payload: dict[str, Any] = {}
+    enabled: bool = True
+
+    @field_validator("cron")
+    @classmethod
+    def check_cron(cls, value: str | None):
+        if value is not None:
+            CronExpression(value)
+        return value
+
+class JobScheduleUpdate(JobScheduleCreate):
+    name: str | None = Field(None, max_length=100)
+    job_name: str | None = Field(None, max_length=100)
+    cron: str | None = Field(None, max_length=100)
+    payload: dict[str, Any] | None = None
+    enabled: bool | None = None
+
+class JobScheduleRead(BaseModel):
+    id: int
+    name: str
+    job_name: str
+    cron: str
+    payload: dict[str, Any]
+    enabled: bool
+    next_run_at: datetime
+    last_run_at: datetime | None = None
+
+    model_config = {
+        "from_attributes": True
+    }
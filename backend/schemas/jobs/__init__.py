@@ -0,0 +1 @@
+from .Job import (JobCreate, JobFilter, JobRead, JobScheduleCreate, JobScheduleUpdate, JobScheduleRead)
@@ -0,0 +1,27 @@
+from enum import Enum
+from pydantic import BaseModel
+
+
+class BulkImportEntity(str, Enum):
+    DISHES = "dishes"
+    INGREDIENTS = "ingredients"
+    EQUIPMENTS = "equipments"
+    TABLES = "tables"
+
+
+class BulkImportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+# --- Bulk Import Schemas ---
+class BulkImportRowError(BaseModel):
+    row: int  # 1-based data row number in the uploaded file
+    message: str
+
+
+class BulkImportResult(BaseModel):
+    entity: BulkImportEntity
+    received: int
+    inserted: int
+    errors: list[BulkImportRowError] = []
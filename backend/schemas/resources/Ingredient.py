@@ -1,4 +1,7 @@
-from pydantic import BaseModel
+from datetime import date, datetime
+from enum import Enum
+from uuid import UUID
+from pydantic import BaseModel, Field, model_validator
 
 # --- Ingredient Unit Schemas ---
 class IngredientUnitCreate(BaseModel):
@@ -59,5 +62,64 @@ class IngredientHistoryRead(BaseModel):
     new_quantity: float 
     quantity_change: float 
     reason: str | None = None
+    stock_take_id: UUID | None = None
     created_at: str 
 
+
+class IngredientTimeseriesMode(str, Enum):
+    BUCKET = "bucket"   # last stock level per fixed-width time bucket (date_bin)
+    LTTB = "lttb"       # shape-preserving downsampling of the raw history points
+
+class IngredientSeries(BaseModel):
+    ingredient_id: int
+    t: list[float]          # epoch seconds
+    quantity: list[float]   # stock level at t
+
+class IngredientTimeseriesRead(BaseModel):
+    start: datetime
+    end: datetime
+    mode: IngredientTimeseriesMode
+    bucket_seconds: int | None = None
+    series: list[IngredientSeries]
+
+class IngredientUsageEncoding(str, Enum):
+    DENSE = "dense"     # values holds every cell, row-major (ingredient, day)
+    SPARSE = "sparse"   # only non-zero cells; index holds their row-major positions
+
+class IngredientUsageMatrixRead(BaseModel):
+    start: date
+    days: int
+    ingredient_ids: list[int]
+    encoding: IngredientUsageEncoding
+    values: list[float]
+    index: list[int] | None = None
+
+
+# --- Stock Take Schemas ---
+class IngredientAdjustment(BaseModel):
+    ingredient_id: int
+    quantity: float | None = Field(None, ge=0)  # absolute counted quantity
+    delta: float | None = None                  # relative change, e.g. -2.5
+
+    @model_validator(mode="after")
+    def check_quantity_or_delta(self):
+        if (self.quantity is None) == (self.delta is None):
+            raise ValueError("Provide exactly one of quantity or delta.")
+        return self
+
+class IngredientStockTakeCreate(BaseModel):
+    reason: str | None = Field(None, max_length=255)
+    items: list[IngredientAdjustment] = Field(..., min_length=1)
+
+    @model_validator(mode="after")
+    def check_unique_ingredients(self):
+        ids = [item.ingredient_id for item in self.items]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Each ingredient may appear only once per stock take.")
+        return self
+
+class IngredientStockTakeRead(BaseModel):
+    stock_take_id: UUID
+    reason: str | None = None
+    items: list[IngredientReadBase]
+    missing_ids: list[int] = []
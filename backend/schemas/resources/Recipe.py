@@ -0,0 +1,37 @@
+from datetime import datetime
+from pydantic import BaseModel, Field, model_validator
+from .Ingredient import IngredientReadBase
+
+# --- Recipe Schemas ---
+class RecipeItemCreate(BaseModel):
+    ingredient_id: int
+    quantity: float = Field(..., gt=0)  # per portion, in the ingredient's unit
+
+class RecipeUpdate(BaseModel):
+    """Replaces the whole recipe of a dish; an empty list clears it."""
+    items: list[RecipeItemCreate]
+
+    @model_validator(mode="after")
+    def check_unique_ingredients(self):
+        ids = [item.ingredient_id for item in self.items]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Each ingredient may appear only once per recipe.")
+        return self
+
+class RecipeItemRead(BaseModel):
+    dish_id: int
+    ingredient_id: int
+    quantity: float
+    ingredient: IngredientReadBase
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+# --- Stock Consumption Schemas ---
+class StockConsumptionRead(BaseModel):
+    order_id: int | None = None
+    completed_from: datetime | None = None
+    completed_to: datetime | None = None
+    items: list[IngredientReadBase]  # ingredients after deduction
@@ -4,9 +4,12 @@ from .Equipment import (EquipmentCreate, EquipmentFilter, EquipmentUpdate,Equipm
 
 from .Ingredient import (IngredientCreate, IngredientUpdate, IngredientFilter, IngredientReadBase, IngredientReadExtended,
     IngredientUnitCreate, IngredientUnitUpdate, IngredientUnitFilter,IngredientUnitRead,
-    IngredientHistoryRead)
+    IngredientHistoryRead, IngredientTimeseriesMode, IngredientSeries, IngredientTimeseriesRead,
+    IngredientUsageEncoding, IngredientUsageMatrixRead, IngredientAdjustment, IngredientStockTakeCreate, IngredientStockTakeRead)
 
 from .Dish import (DishCreate, DishRead, DishReadBase, DishUpdate, DishFilter)
 from .Table import (TableCreate, TableReadBase, TableUpdate, TableFilter, TableReadExtended)
 from .Table import (TableStatusCreate, TableStatusFilter, TableStatusUpdate, TableStatusRead)
-from .Tag import (TagCreate, TagRead, TagUpdate, TagFilter, DishReadExtended)
\ No newline at end of file
+from .Tag import (TagCreate, TagRead, TagUpdate, TagFilter, DishReadExtended)
+from .BulkImport import (BulkImportEntity, BulkImportFormat, BulkImportRowError, BulkImportResult)
+from .Recipe import (RecipeItemCreate, RecipeUpdate, RecipeItemRead, StockConsumptionRead)
\ No newline at end of file
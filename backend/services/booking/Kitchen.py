@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import delete, extract, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import OrderItemPrepTimeSketch, OrderItemStatusHistory
+from schemas.booking import PrepTimeGroupBy, PrepTimeRead, PrepTimeStats
+from utils.format import safe_str_to_datetime, to_naive_utc
+from utils.sketch import RELATIVE_ACCURACY, LogHistogram
+
+
+class KitchenService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_prep_times(
+        self,
+        start: str,
+        end: str,
+        group_by: PrepTimeGroupBy,
+        dish_ids: list[int] | None = None,
+    ) -> PrepTimeRead:
+        """
+        Prep time percentiles from the hourly per-dish sketches kept by the order item trigger.
+        Reads at most (dishes x hours x buckets) pre-aggregated rows, never the raw history.
+        The period is applied at hour granularity.
+        """
+        # Sketch hours are naive UTC
+        start_dt = to_naive_utc(safe_str_to_datetime(start))
+        end_dt = to_naive_utc(safe_str_to_datetime(end))
+        if not start_dt or not end_dt:
+            raise ValueError("Invalid date format. Use ISO 8601 format.")
+        if start_dt >= end_dt:
+            raise ValueError("Start date must be earlier than end date.")
+
+        sketch = OrderItemPrepTimeSketch
+        keys = []
+        if group_by in (PrepTimeGroupBy.DISH, PrepTimeGroupBy.DISH_HOUR):
+            keys.append(sketch.dish_id.label("dish_id"))
+        if group_by in (PrepTimeGroupBy.HOUR, PrepTimeGroupBy.DISH_HOUR):
+            keys.append(extract("hour", sketch.hour).label("hour"))
+
+        query = (
+            select(*keys, sketch.bucket, func.sum(sketch.count).label("count"))
+            .where(sketch.hour >= start_dt, sketch.hour < end_dt)
+            .group_by(*keys, sketch.bucket)
+        )
+        if dish_ids:
+            query = query.where(sketch.dish_id.in_(dish_ids))
+        result = await self.db.execute(query)
+
+        histograms: dict[tuple, LogHistogram] = {}
+        for row in result.all():
+            dish_id = row.dish_id if "dish_id" in row._fields else None
+            hour = int(row.hour) if "hour" in row._fields else None
+            histogram = histograms.setdefault((dish_id, hour), LogHistogram())
+            histogram.add_bucket(row.bucket, int(row.count))
+
+        stats = [
+            PrepTimeStats(
+                dish_id=dish_id,
+                hour=hour,
+                count=histogram.count,
+                p50_seconds=round(histogram.quantile(0.5), 1),
+                p95_seconds=round(histogram.quantile(0.95), 1),
+                mean_seconds=round(histogram.mean(), 1),
+            )
+            for (dish_id, hour), histogram in sorted(
+                histograms.items(), key=lambda entry: (entry[0][0] or 0, entry[0][1] or 0)
+            )
+        ]
+        return PrepTimeRead(
+            start=start_dt,
+            end=end_dt,
+            group_by=group_by,
+            relative_accuracy=RELATIVE_ACCURACY,
+            stats=stats,
+        )
+
+    async def delete_status_history(self, days: int) -> int:
+        """Drop raw status history older than `days`; the prep time sketches are kept."""
+        cutoff = datetime.utcnow() - timedelta(days=days)
+        result = await self.db.execute(
+            delete(OrderItemStatusHistory).where(OrderItemStatusHistory.changed_at < cutoff)
+        )
+        await self.db.commit()
+        return result.rowcount
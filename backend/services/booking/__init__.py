@@ -1 +1,2 @@
-from .Order import OrderService
\ No newline at end of file
+from .Order import OrderService
+from .Kitchen import KitchenService
@@ -0,0 +1,132 @@
+import asyncio
+import os
+import socket
+import sys
+import time
+import traceback
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.jobs import JobConfig, job_config
+from configs.postgre import SessionFactory
+from models import Job
+from repository.jobs import JobRepository, JobScheduleRepository
+
+JobHandler = Callable[[AsyncSession, dict[str, Any]], Awaitable[Any]]
+
+# name -> handler; filled by the @job decorator when task modules are imported
+JOB_REGISTRY: dict[str, JobHandler] = {}
+
+
+def job(name: str):
+    """Register an async handler(db, payload) under a job name."""
+    def decorator(handler: JobHandler) -> JobHandler:
+        if name in JOB_REGISTRY:
+            raise ValueError(f"Job '{name}' is already registered.")
+        JOB_REGISTRY[name] = handler
+        return handler
+    return decorator
+
+
+class JobWorker:
+    def __init__(self, worker_id: str, config: JobConfig):
+        self.worker_id = worker_id
+        self.config = config
+        self.wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task | None = None
+        self._last_maintenance = 0.0
+
+    async def _maintain(self):
+        """Fire due schedules and release jobs of dead workers, at most once per poll interval."""
+        if time.monotonic() - self._last_maintenance < self.config.poll_interval_seconds:
+            return
+        self._last_maintenance = time.monotonic()
+        async with SessionFactory() as db:
+            await JobScheduleRepository(db).enqueue_due()
+            requeued = await JobRepository(db).requeue_stale(self.config.stale_after_seconds)
+        if requeued:
+            print(f"[JOBS] {self.worker_id} requeued {requeued} stale job(s)", file=sys.stdout, flush=True)
+
+    async def _execute(self, job: Job):
+        handler = JOB_REGISTRY.get(job.name)
+        started = time.perf_counter()
+        error = None
+        if handler is None:
+            error = f"No handler registered for job '{job.name}'."
+        else:
+            try:
+                async with SessionFactory() as db:
+                    await asyncio.wait_for(handler(db, job.payload), timeout=self.config.job_timeout_seconds)
+            except asyncio.TimeoutError:
+                error = f"Timed out after {self.config.job_timeout_seconds}s."
+            except Exception:
+                error = traceback.format_exc()
+
+        async with SessionFactory() as db:
+            repository = JobRepository(db)
+            if error is None:
+                await repository.complete_job(job.id, self.worker_id)
+            else:
+                await repository.fail_job(
+                    job, self.worker_id, error,
+                    self.config.backoff_base_seconds, self.config.backoff_max_seconds,
+                )
+
+        elapsed = (time.perf_counter() - started) * 1000
+        outcome = "done" if error is None else "failed"
+        print(f"[JOBS] {self.worker_id} {job.name}#{job.id} {outcome} in {elapsed:.0f}ms", file=sys.stdout, flush=True)
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await self._maintain()
+                async with SessionFactory() as db:
+                    jobs = await JobRepository(db).claim_jobs(self.worker_id, self.config.batch_size)
+                for claimed in jobs:
+                    await self._execute(claimed)
+                if jobs:
+                    continue
+            except Exception as e:
+                print(f"[JOBS] {self.worker_id} error: {e}", file=sys.stderr, flush=True)
+
+            # Idle: sleep until NOTIFY wakes us or the poll interval passes
+            self.wakeup.clear()
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), timeout=self.config.poll_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Finish the running job, then exit."""
+        self._stopping = True
+        self.wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+
+class JobWorkerPool:
+    """N workers sharing one process; throughput scales with the worker count."""
+    def __init__(self, size: int, config: JobConfig = job_config, prefix: str | None = None):
+        prefix = prefix or f"{socket.gethostname()}:{os.getpid()}"
+        self.workers = [JobWorker(f"{prefix}:{i}", config) for i in range(size)]
+
+    def wake(self, channel: str = "", payload: str = ""):
+        """PgListener handler for the jobs channel."""
+        for worker in self.workers:
+            worker.wakeup.set()
+
+    def start(self):
+        for worker in self.workers:
+            worker.start()
+        if self.workers:
+            print(f"[JOBS] Started {len(self.workers)} worker(s)", file=sys.stdout, flush=True)
+
+    async def stop(self):
+        await asyncio.gather(*(worker.stop() for worker in self.workers))
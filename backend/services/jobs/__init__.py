@@ -0,0 +1,2 @@
+from .Worker import JOB_REGISTRY, JobWorker, JobWorkerPool, job
+from . import tasks
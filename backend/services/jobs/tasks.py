@@ -0,0 +1,49 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.jobs import job_config
+from repository.jobs import JobRepository
+from repository.outbox import OutboxRepository
+from repository.resources import RecipeRepository
+from services.booking import KitchenService
+from services.resources import ForecastService
+from utils.format import safe_str_to_datetime, to_naive_utc
+from .Worker import job
+
+
+@job("forecast.refresh")
+async def refresh_forecast(db: AsyncSession, payload: dict):
+    """Warm the ingredient forecast cache so /restock never pays for a refit."""
+    await ForecastService().get_forecast()
+
+
+@job("stock.consume_served")
+async def consume_served_items(db: AsyncSession, payload: dict):
+    """
+    Deduct stock for served items of all orders, or of one (payload order_id), or of orders
+    completed in a window (payload completed_from / completed_to, ISO 8601).
+    """
+    await RecipeRepository(db).consume_served_items(
+        payload.get("order_id"),
+        to_naive_utc(safe_str_to_datetime(payload.get("completed_from"))),
+        to_naive_utc(safe_str_to_datetime(payload.get("completed_to"))),
+    )
+    await db.commit()
+
+
+@job("jobs.cleanup")
+async def cleanup_jobs(db: AsyncSession, payload: dict):
+    """Delete finished jobs older than payload days (default from config)."""
+    days = int(payload.get("days", job_config.keep_finished_days))
+    await JobRepository(db).delete_finished(days)
+
+
+@job("outbox.cleanup")
+async def cleanup_outbox(db: AsyncSession, payload: dict):
+    """Delete dispatched outbox events older than payload days (default 3)."""
+    await OutboxRepository(db).delete_dispatched(int(payload.get("days", 3)))
+
+
+@job("kitchen.history_cleanup")
+async def cleanup_status_history(db: AsyncSession, payload: dict):
+    """Delete order item status history older than payload days (default 90)."""
+    await KitchenService(db).delete_status_history(int(payload.get("days", 90)))
@@ -0,0 +1,247 @@
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import (
+    Dish,
+    Equipment,
+    EquipmentStatus,
+    EquipmentType,
+    Ingredient,
+    IngredientUnit,
+    Table,
+    TableStatus,
+    Tag,
+)
+from repository.resources.BulkImport import BulkImportRepository
+from schemas.resources import (
+    BulkImportEntity,
+    BulkImportFormat,
+    BulkImportResult,
+    BulkImportRowError,
+    DishCreate,
+    EquipmentCreate,
+    IngredientCreate,
+    TableCreate,
+)
+
+
+@dataclass
+class _ImportSpec:
+    schema: type[BaseModel]
+    model: type                                            # target table, for column limits
+    columns: tuple[str, ...]
+    foreign_keys: dict = field(default_factory=dict)       # field -> look-up model
+    list_foreign_keys: dict = field(default_factory=dict)  # list field -> look-up model
+    unique: object = None                                  # unique model column, if any
+
+
+_SPECS = {
+    BulkImportEntity.INGREDIENTS: _ImportSpec(
+        schema=IngredientCreate,
+        model=Ingredient,
+        columns=("name", "unit_id", "quantity", "threshold"),
+        foreign_keys={"unit_id": IngredientUnit},
+        unique=Ingredient.name,
+    ),
+    BulkImportEntity.TABLES: _ImportSpec(
+        schema=TableCreate,
+        model=Table,
+        columns=("number", "seats", "status_id"),
+        foreign_keys={"status_id": TableStatus},
+        unique=Table.number,
+    ),
+    BulkImportEntity.EQUIPMENTS: _ImportSpec(
+        schema=EquipmentCreate,
+        model=Equipment,
+        columns=("name", "type_id", "status_id"),
+        foreign_keys={"type_id": EquipmentType, "status_id": EquipmentStatus},
+    ),
+    BulkImportEntity.DISHES: _ImportSpec(
+        schema=DishCreate,
+        model=Dish,
+        columns=("name", "price", "description", "image_url", "tag_ids"),
+        list_foreign_keys={"tag_ids": Tag},
+    ),
+}
+
+# Separator for list cells in CSV files, e.g. tag_ids = "1|4|7"
+CSV_LIST_SEPARATOR = "|"
+
+
+def detect_format(filename: str | None, content_type: str | None) -> BulkImportFormat:
+    """Guess the upload format from the file name or content type."""
+    name = (filename or "").lower()
+    if name.endswith((".ndjson", ".jsonl")):
+        return BulkImportFormat.NDJSON
+    if name.endswith(".csv"):
+        return BulkImportFormat.CSV
+    if content_type and ("ndjson" in content_type or "json" in content_type):
+        return BulkImportFormat.NDJSON
+    return BulkImportFormat.CSV
+
+
+def parse_rows(content: bytes, fmt: BulkImportFormat) -> list[dict | None]:
+    """
+    Parse raw file content into one dict per data row.
+    Rows that cannot be parsed at all are returned as None so they keep their row number.
+    """
+    text_content = content.decode("utf-8-sig")
+
+    if fmt == BulkImportFormat.NDJSON:
+        rows = []
+        for line in text_content.splitlines():
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                row = None
+            rows.append(row if isinstance(row, dict) else None)
+        return rows
+
+    reader = csv.DictReader(io.StringIO(text_content))
+    rows = []
+    for row in reader:
+        cleaned = {}
+        for key, value in row.items():
+            if key is None:
+                continue
+            value = value.strip() if isinstance(value, str) else value
+            if value == "":
+                continue
+            if key == "tag_ids":
+                value = [v for v in value.split(CSV_LIST_SEPARATOR) if v.strip()]
+            cleaned[key.strip()] = value
+        rows.append(cleaned)
+    return rows
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}" for e in error.errors()
+    )
+
+
+def _column_limit_error(model, item: BaseModel, columns: tuple[str, ...]) -> str | None:
+    """
+    First value that would not fit its target column (VARCHAR length, NUMERIC digits).
+    The Create schemas do not carry these limits, and a value that fails inside COPY
+    would abort the whole batch instead of just its row.
+    """
+    table_columns = model.__table__.c
+    for name in columns:
+        value = getattr(item, name)
+        if value is None or name not in table_columns:
+            continue
+        column_type = table_columns[name].type
+        length = getattr(column_type, "length", None)
+        if length is not None and isinstance(value, str) and len(value) > length:
+            return f"{name}: at most {length} characters (got {len(value)})."
+        precision = getattr(column_type, "precision", None)
+        scale = getattr(column_type, "scale", None) or 0
+        if precision is not None and isinstance(value, Decimal) and abs(value) >= Decimal(10) ** (precision - scale):
+            return f"{name}: must be less than {Decimal(10) ** (precision - scale)} in absolute value."
+    return None
+
+
+class BulkImportService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repo = BulkImportRepository(db)
+
+    async def import_rows(self, entity: BulkImportEntity, rows: list[dict | None]) -> BulkImportResult:
+        """
+        Validate rows, check foreign keys with one query per look-up table,
+        then COPY the valid rows into a staging table and merge them in one transaction.
+        Invalid rows are reported and skipped; they never abort the batch.
+        """
+        spec = _SPECS[entity]
+        errors: dict[int, str] = {}
+        valid: dict[int, BaseModel] = {}
+
+        for row_no, row in enumerate(rows, start=1):
+            if row is None:
+                errors[row_no] = "Row could not be parsed."
+                continue
+            try:
+                item = spec.schema.model_validate(row)
+            except ValidationError as e:
+                errors[row_no] = _format_validation_error(e)
+                continue
+            limit_error = _column_limit_error(spec.model, item, spec.columns)
+            if limit_error:
+                errors[row_no] = limit_error
+            else:
+                valid[row_no] = item
+
+        # Set-based foreign key validation: one SELECT per referenced table
+        for field_name, model in spec.foreign_keys.items():
+            ids = {getattr(item, field_name) for item in valid.values()}
+            existing = await self.repo.get_existing_ids(model, ids)
+            for row_no, item in list(valid.items()):
+                value = getattr(item, field_name)
+                if value not in existing:
+                    errors[row_no] = f"{model.__name__} with id {value} does not exist."
+                    del valid[row_no]
+
+        for field_name, model in spec.list_foreign_keys.items():
+            ids = {v for item in valid.values() for v in getattr(item, field_name)}
+            existing = await self.repo.get_existing_ids(model, ids)
+            for row_no, item in list(valid.items()):
+                missing = set(getattr(item, field_name)) - existing
+                if missing:
+                    errors[row_no] = f"{model.__name__}s with ids {missing} do not exist."
+                    del valid[row_no]
+
+        # Unique keys: reject duplicates inside the file and rows that already exist
+        if spec.unique is not None:
+            key = spec.unique.key
+            seen: dict[str, int] = {}
+            for row_no, item in list(valid.items()):
+                value = getattr(item, key)
+                if value in seen:
+                    errors[row_no] = f"Duplicate {key} '{value}' (first seen in row {seen[value]})."
+                    del valid[row_no]
+                else:
+                    seen[value] = row_no
+
+            existing = await self.repo.get_existing_values(spec.unique, set(seen))
+            for row_no, item in list(valid.items()):
+                value = getattr(item, key)
+                if value in existing:
+                    errors[row_no] = f"{key} '{value}' already exists."
+                    del valid[row_no]
+
+        inserted = 0
+        if valid:
+            records = [
+                (row_no, *(getattr(item, column) for column in spec.columns))
+                for row_no, item in valid.items()
+            ]
+            merged = await self.repo.copy_and_merge(entity.value, records)
+
+            if isinstance(merged, set):
+                # Rows inserted concurrently by someone else lose the ON CONFLICT race
+                key = spec.unique.key
+                for row_no, item in valid.items():
+                    if getattr(item, key) not in merged:
+                        errors[row_no] = f"{key} '{getattr(item, key)}' already exists."
+                inserted = len(merged)
+            else:
+                inserted = merged
+
+        return BulkImportResult(
+            entity=entity,
+            received=len(rows),
+            inserted=inserted,
+            errors=[
+                BulkImportRowError(row=row_no, message=message)
+                for row_no, message in sorted(errors.items())
+            ],
+        )
@@ -0,0 +1,178 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from configs.postgre import SessionFactory
+from models import IngredientHistory
+
+HISTORY_DAYS = 56      # eight weeks of daily consumption per series
+SEASON_LENGTH = 7      # weekly seasonality
+HORIZON_DAYS = 28      # how far ahead forecasts are produced
+
+# Smoothing parameter grid; every series picks the pair with the lowest one-step-ahead error
+ALPHAS = np.array([0.1, 0.2, 0.3, 0.5, 0.7])
+GAMMAS = np.array([0.05, 0.1, 0.2, 0.3])
+
+
+@dataclass
+class ForecastResult:
+    version: tuple            # (day, latest history id) the forecast was computed for
+    ingredient_ids: np.ndarray
+    daily_usage: np.ndarray   # shape (n_ingredients, HORIZON_DAYS), forecast usage per day
+    computed_at: datetime
+
+    def index_of(self) -> dict[int, int]:
+        return {int(ingredient_id): i for i, ingredient_id in enumerate(self.ingredient_ids)}
+
+
+def fit_seasonal_smoothing(series: np.ndarray, horizon: int = HORIZON_DAYS) -> np.ndarray:
+    """
+    Additive exponential smoothing with weekly seasonality (Holt-Winters without trend),
+    fitted for every series at once.
+
+    series: (n_series, n_days) daily consumption, oldest day first.
+    Returns (n_series, horizon) forecasts, clipped at zero.
+    """
+    n_series, n_days = series.shape
+    if n_series == 0:
+        return np.zeros((0, horizon))
+
+    alpha, gamma = np.meshgrid(ALPHAS, GAMMAS, indexing="ij")
+    alpha = alpha.reshape(-1, 1)          # (n_params, 1), broadcast over series
+    gamma = gamma.reshape(-1, 1)
+    n_params = alpha.shape[0]
+
+    first_week = series[:, :SEASON_LENGTH]
+    level = np.broadcast_to(first_week.mean(axis=1), (n_params, n_series)).copy()
+    season = np.broadcast_to(
+        first_week - first_week.mean(axis=1, keepdims=True), (n_params, n_series, SEASON_LENGTH)
+    ).copy()
+    sse = np.zeros((n_params, n_series))
+
+    for t in range(n_days):
+        s = t % SEASON_LENGTH
+        y = series[:, t]
+        error = y - (level + season[:, :, s])
+        if t >= SEASON_LENGTH:
+            sse += error ** 2
+        new_level = alpha * (y - season[:, :, s]) + (1 - alpha) * level
+        season[:, :, s] = gamma * (y - new_level) + (1 - gamma) * season[:, :, s]
+        level = new_level
+
+    best = sse.argmin(axis=0)             # best parameter pair per series
+    columns = np.arange(n_series)
+    level = level[best, columns]
+    season = season[best, columns]
+
+    steps = (n_days + np.arange(horizon)) % SEASON_LENGTH
+    forecast = level[:, None] + season[:, steps]
+    return np.clip(forecast, 0, None)
+
+
+def days_until(remaining: np.ndarray, daily_usage: np.ndarray) -> np.ndarray:
+    """
+    Days until cumulative forecast usage uses up `remaining`, per row.
+    Rows that do not run out within the horizon are extrapolated at their mean rate;
+    rows with no forecast usage get NaN.
+    """
+    cumulative = np.cumsum(daily_usage, axis=1)
+    reached = cumulative >= remaining[:, None]
+    within = reached.any(axis=1)
+
+    first = reached.argmax(axis=1)
+    rows = np.arange(len(remaining))
+    before = np.where(first > 0, cumulative[rows, np.maximum(first - 1, 0)], 0.0)
+    day_usage = daily_usage[rows, first]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Interpolate inside the day the threshold is crossed
+        inside = first + np.where(day_usage > 0, (remaining - before) / day_usage, 0.0)
+        mean_rate = daily_usage.mean(axis=1)
+        beyond = remaining / mean_rate
+
+    days = np.where(within, inside, beyond)
+    days = np.where(remaining <= 0, 0.0, days)
+    return np.where(np.isfinite(days), days, np.nan)
+
+
+class ForecastService:
+    """
+    Serves per-ingredient consumption forecasts. The fit is cached process-wide and only
+    recomputed when the day rolls over or history for an earlier day arrives.
+    Reads go through their own short sessions rather than the caller's: the connection is
+    back in the pool before waiting on the refit lock or fitting, and the caller's unit of
+    work is never committed early.
+    """
+    _cache: ForecastResult | None = None
+    _lock = asyncio.Lock()
+
+    @staticmethod
+    async def _current_version(db: AsyncSession, today: datetime) -> tuple:
+        # The fit only reads history from before today, so today's stock writes must not
+        # invalidate it; a late row for an earlier day still does
+        latest = await db.execute(
+            select(func.max(IngredientHistory.id)).where(IngredientHistory.created_at < today)
+        )
+        return (today.date(), latest.scalar())
+
+    @staticmethod
+    async def _load_daily_usage(db: AsyncSession, today: datetime) -> tuple[np.ndarray, np.ndarray]:
+        """One grouped query for every ingredient's daily consumption series."""
+        start = today - timedelta(days=HISTORY_DAYS)
+        day = func.date_trunc("day", IngredientHistory.created_at).label("day")
+        result = await db.execute(
+            select(
+                IngredientHistory.ingredient_id,
+                day,
+                func.sum(-IngredientHistory.quantity_change).label("usage"),
+            )
+            .where(
+                IngredientHistory.created_at >= start,
+                IngredientHistory.created_at < today,
+                IngredientHistory.quantity_change < 0,
+            )
+            .group_by(IngredientHistory.ingredient_id, day)
+        )
+        rows = result.all()
+        if not rows:
+            return np.zeros(0, dtype=np.int64), np.zeros((0, HISTORY_DAYS))
+
+        ingredient_col = np.fromiter((row.ingredient_id for row in rows), dtype=np.int64, count=len(rows))
+        day_col = np.fromiter(((row.day - start).days for row in rows), dtype=np.int64, count=len(rows))
+        usage_col = np.fromiter((row.usage for row in rows), dtype=np.float64, count=len(rows))
+
+        ingredient_ids, row_index = np.unique(ingredient_col, return_inverse=True)
+        series = np.zeros((len(ingredient_ids), HISTORY_DAYS))
+        np.add.at(series, (row_index, day_col), usage_col)
+        return ingredient_ids, series
+
+    async def get_forecast(self, now: datetime | None = None) -> ForecastResult:
+        if now is None:
+            now = datetime.utcnow()
+        today = datetime(now.year, now.month, now.day)
+        async with SessionFactory() as db:
+            version = await self._current_version(db, today)
+
+        cached = ForecastService._cache
+        if cached is not None and cached.version == version:
+            return cached
+
+        async with ForecastService._lock:
+            cached = ForecastService._cache
+            if cached is not None and cached.version == version:
+                return cached
+
+            async with SessionFactory() as db:
+                ingredient_ids, series = await self._load_daily_usage(db, today)
+            daily_usage = await asyncio.to_thread(fit_seasonal_smoothing, series)
+
+            ForecastService._cache = ForecastResult(
+                version=version,
+                ingredient_ids=ingredient_ids,
+                daily_usage=daily_usage,
+                computed_at=now,
+            )
+            return ForecastService._cache
@@ -1,29 +1,49 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, delete, select, update
+from sqlalchemy import Date, and_, cast, delete, func, select, update
 from sqlalchemy.orm import selectinload
 from models import IngredientHistory, Ingredient
 from schemas.resources import (
-    IngredientHistoryRead
+    IngredientHistoryRead,
+    IngredientTimeseriesMode,
+    IngredientSeries,
+    IngredientTimeseriesRead,
+    IngredientUsageEncoding,
+    IngredientUsageMatrixRead,
 )
-from utils.format import safe_str_to_datetime
+from utils.downsample import lttb
+from utils.format import safe_str_to_datetime, to_naive_utc
 from datetime import datetime, timedelta
+from itertools import groupby
+import math
+
+import numpy as np
+
+from .Forecast import ForecastService, HORIZON_DAYS, days_until
+
+MAX_USAGE_MATRIX_DAYS = 366
 
 
 class TrackingService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_history_by_period(self, ingredient_id: int, start: str, end: str) -> list[IngredientHistoryRead]:
-        if not ingredient_id:
-            raise ValueError("ingredient_id is required.")
+    @staticmethod
+    def _parse_period(start: str, end: str) -> tuple[datetime, datetime]:
         if not start or not end:
             raise ValueError("Both start and end dates are required.")
-        start_dt = safe_str_to_datetime(start)
-        end_dt = safe_str_to_datetime(end)
+        # Stored timestamps are naive UTC
+        start_dt = to_naive_utc(safe_str_to_datetime(start))
+        end_dt = to_naive_utc(safe_str_to_datetime(end))
         if not start_dt or not end_dt:
             raise ValueError("Invalid date format. Use ISO 8601 format.")
         if start_dt >= end_dt:
             raise ValueError("Start date must be earlier than end date.")
+        return start_dt, end_dt
+
+    async def get_history_by_period(self, ingredient_id: int, start: str, end: str) -> list[IngredientHistoryRead]:
+        if not ingredient_id:
+            raise ValueError("ingredient_id is required.")
+        start_dt, end_dt = self._parse_period(start, end)
         records = await self.db.execute(
             select(IngredientHistory).where(
                 and_(
@@ -35,6 +55,87 @@ class TrackingService:
         )
         history_list = records.scalars().all()
         return history_list
+
+    async def get_timeseries(
+        self,
+        ingredient_ids: list[int],
+        start: str,
+        end: str,
+        points: int,
+        mode: IngredientTimeseriesMode = IngredientTimeseriesMode.BUCKET,
+    ) -> IngredientTimeseriesRead:
+        """
+        Stock level series for several ingredients, reduced to about `points` values each.
+        bucket: the database bins history rows with date_bin and keeps the last level per bin.
+        lttb: raw rows are fetched in one query and downsampled with LTTB per ingredient.
+        """
+        if not ingredient_ids:
+            raise ValueError("At least one ingredient_id is required.")
+        start_dt, end_dt = self._parse_period(start, end)
+        ingredient_ids = sorted(set(ingredient_ids))
+
+        period_filter = [
+            IngredientHistory.ingredient_id.in_(ingredient_ids),
+            IngredientHistory.created_at >= start_dt,
+            IngredientHistory.created_at < end_dt,
+        ]
+        bucket_seconds = None
+
+        if mode == IngredientTimeseriesMode.BUCKET:
+            bucket_seconds = max(math.ceil((end_dt - start_dt).total_seconds() / points), 1)
+            # Bin in a subquery so DISTINCT ON and ORDER BY refer to the same column
+            binned = (
+                select(
+                    IngredientHistory.ingredient_id,
+                    func.date_bin(
+                        timedelta(seconds=bucket_seconds), IngredientHistory.created_at, start_dt
+                    ).label("bucket"),
+                    IngredientHistory.created_at,
+                    IngredientHistory.new_quantity,
+                )
+                .where(*period_filter)
+                .subquery()
+            )
+            query = (
+                select(
+                    binned.c.ingredient_id,
+                    func.extract("epoch", binned.c.bucket).label("t"),
+                    binned.c.new_quantity,
+                )
+                .distinct(binned.c.ingredient_id, binned.c.bucket)
+                .order_by(binned.c.ingredient_id, binned.c.bucket, binned.c.created_at.desc())
+            )
+        else:
+            query = (
+                select(
+                    IngredientHistory.ingredient_id,
+                    func.extract("epoch", IngredientHistory.created_at).label("t"),
+                    IngredientHistory.new_quantity,
+                )
+                .where(*period_filter)
+                .order_by(IngredientHistory.ingredient_id, IngredientHistory.created_at)
+            )
+
+        result = await self.db.execute(query)
+        series_by_id = {}
+        for ingredient_id, rows in groupby(result.all(), key=lambda row: row.ingredient_id):
+            rows = list(rows)
+            xs = [float(row.t) for row in rows]
+            ys = [row.new_quantity for row in rows]
+            if mode == IngredientTimeseriesMode.LTTB:
+                xs, ys = lttb(xs, ys, points)
+            series_by_id[ingredient_id] = IngredientSeries(ingredient_id=ingredient_id, t=xs, quantity=ys)
+
+        return IngredientTimeseriesRead(
+            start=start_dt,
+            end=end_dt,
+            mode=mode,
+            bucket_seconds=bucket_seconds,
+            series=[
+                series_by_id.get(ingredient_id, IngredientSeries(ingredient_id=ingredient_id, t=[], quantity=[]))
+                for ingredient_id in ingredient_ids
+            ],
+        )
     
     async def get_usage_stats(self, ingredient_id: int, start: str, end: str):
         start_q = (
@@ -58,133 +159,139 @@ class TrackingService:
             .scalar_subquery()
         )
         query = (
-        select(
-            Ingredient.id,
-            Ingredient.name,
-            (end_q - start_q).label("usage"),
-        )
-        .join(
-            Ingredient,
-            Ingredient.id == IngredientHistory.ingredient_id,
-        )
-        .where(Ingredient.id == ingredient_id)  
+            select(
+                Ingredient.id,
+                Ingredient.name,
+                (end_q - start_q).label("usage"),
+            )
+            .where(Ingredient.id == ingredient_id)
         )
         row = await self.db.execute(query)
-        result = row.one_or_none() 
+        result = row.one_or_none()
+        if result is None:
+            return None
 
         return {
             "ingredient_id": result.id,
             "ingredient_name": result.name,
             "usage": result.usage if result.usage is not None else 0,
         }
-    
-
 
-class RestockService:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
-    async def get_avg_daily_usage_last_3_days(
+    async def get_usage_matrix(
         self,
-        ingredient_id: int,
-        now: datetime | None = None,
-    ):
-        if now is None:
-            now = datetime.utcnow()
+        start: str,
+        end: str,
+        ingredient_ids: list[int] | None = None,
+        encoding: IngredientUsageEncoding = IngredientUsageEncoding.DENSE,
+    ) -> IngredientUsageMatrixRead:
+        """
+        Daily consumption (sum of stock decreases) for every ingredient, as an
+        ingredient x day matrix built from a single grouped query.
+        """
+        start_dt, end_dt = self._parse_period(start, end)
+        start_day = start_dt.date()
+        days = (end_dt.date() - start_day).days + (1 if end_dt.time() != datetime.min.time() else 0)
+        if days > MAX_USAGE_MATRIX_DAYS:
+            raise ValueError(f"Period may span at most {MAX_USAGE_MATRIX_DAYS} days.")
 
-        start = now - timedelta(days=3)
+        ingredient_query = select(Ingredient.id).order_by(Ingredient.id)
+        if ingredient_ids:
+            ingredient_query = ingredient_query.where(Ingredient.id.in_(ingredient_ids))
+        ids = (await self.db.execute(ingredient_query)).scalars().all()
 
-        start_q = (
-            select(IngredientHistory.new_quantity)
-            .where(
-                IngredientHistory.ingredient_id == ingredient_id,
-                IngredientHistory.created_at < start,
+        day = cast(IngredientHistory.created_at, Date).label("day")
+        usage_query = (
+            select(
+                IngredientHistory.ingredient_id,
+                day,
+                func.sum(-IngredientHistory.quantity_change).label("usage"),
             )
-            .order_by(IngredientHistory.created_at.desc())
-            .limit(1)
-            .scalar_subquery()
-        )
-
-        end_q = (
-            select(IngredientHistory.new_quantity)
             .where(
-                IngredientHistory.ingredient_id == ingredient_id,
-                IngredientHistory.created_at < now,
+                IngredientHistory.created_at >= datetime.combine(start_day, datetime.min.time()),
+                IngredientHistory.created_at < end_dt,
+                IngredientHistory.quantity_change < 0,
             )
-            .order_by(IngredientHistory.created_at.desc())
-            .limit(1)
-            .scalar_subquery()
+            .group_by(IngredientHistory.ingredient_id, day)
         )
+        if ingredient_ids:
+            usage_query = usage_query.where(IngredientHistory.ingredient_id.in_(ingredient_ids))
+        rows = (await self.db.execute(usage_query)).all()
 
-        query = select(end_q - start_q)
+        matrix = np.zeros((len(ids), days))
+        row_of = {ingredient_id: i for i, ingredient_id in enumerate(ids)}
+        cells = [(row_of[row.ingredient_id], (row.day - start_day).days, row.usage) for row in rows]
+        if cells:
+            row_index, col_index, usage = zip(*cells)
+            matrix[list(row_index), list(col_index)] = usage
+        matrix = np.round(matrix, 3)
 
-        result = await self.db.execute(query)
-        usage = result.scalar()
-
-        if usage is None or usage <= 0:
-            return None
+        flat = matrix.ravel()
+        if encoding == IngredientUsageEncoding.SPARSE:
+            index = np.flatnonzero(flat)
+            return IngredientUsageMatrixRead(
+                start=start_day,
+                days=days,
+                ingredient_ids=ids,
+                encoding=encoding,
+                values=flat[index].tolist(),
+                index=index.tolist(),
+            )
+        return IngredientUsageMatrixRead(
+            start=start_day,
+            days=days,
+            ingredient_ids=ids,
+            encoding=encoding,
+            values=flat.tolist(),
+        )
 
-        return usage / 3
 
 
+class RestockService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
 
     async def get_quantity_info(self):
         now = datetime.utcnow()
+        forecast = await ForecastService().get_forecast(now)
 
         query = select(
             Ingredient.id,
             Ingredient.name,
             Ingredient.quantity,
             Ingredient.threshold,
-        )
+        ).order_by(Ingredient.id)
 
         result = await self.db.execute(query)
         rows = result.all()
+        if not rows:
+            return []
 
-        data = []
+        # Line every ingredient up with its forecast row; ingredients without history forecast zero usage
+        index = forecast.index_of()
+        daily_usage = np.zeros((len(rows), HORIZON_DAYS))
+        positions = np.fromiter((index.get(row.id, -1) for row in rows), dtype=np.int64, count=len(rows))
+        known = positions >= 0
+        daily_usage[known] = forecast.daily_usage[positions[known]]
 
-        for row in rows:
-            avg_daily_usage = await self.get_avg_daily_usage_last_3_days(
-                row.id, now
-            )
-
-            if avg_daily_usage and avg_daily_usage > 0:
-                remaining = row.quantity - row.threshold
+        remaining = np.array([(row.quantity or 0) - (row.threshold or 0) for row in rows], dtype=np.float64)
+        avg_daily_usage = daily_usage.mean(axis=1)
+        days_left = days_until(remaining, daily_usage)
 
-                if remaining <= 0:
-                    predicted_time = now
-                    days_left = 0
-                else:
-                    days_left = remaining / avg_daily_usage
-                    predicted_time = now + timedelta(days=days_left)
+        data = []
+        for row, avg, days in zip(rows, avg_daily_usage.tolist(), days_left.tolist()):
+            if avg > 0 and not np.isnan(days):
+                predicted_time = now + timedelta(days=days)
             else:
-                predicted_time = None
-                days_left = None
+                avg, days, predicted_time = None, None, None
 
             data.append({
                 "ingredient_id": row.id,
                 "ingredient_name": row.name,
                 "quantity": row.quantity,
                 "threshold": row.threshold,
-                "avg_daily_usage": avg_daily_usage,
-                "days_left": days_left,
+                "avg_daily_usage": avg,
+                "days_left": days,
                 "predicted_restock_time": predicted_time,
             })
 
         return data
-
-
-
-class NotificationService:
-    def __init__(self, db: AsyncSession):
-        self.db = db
-
-    #scheduler (table for custom schedule config) - msq queue - consumer -> (noti mail, noti real time - ws, log)
-    async def alert_usage(self):
-        pass
-
-    async def alert_low_stock(self):
-        pass
-    
-    
-
@@ -0,0 +1,214 @@
+import asyncio
+import json
+import smtplib
+import sys
+import time
+from abc import ABC, abstractmethod
+from email.message import EmailMessage
+
+import asyncpg
+from sqlalchemy import select
+
+from configs.notification import NotificationConfig, notification_config
+from configs.postgre import ASYNCPG_DSN, SessionFactory, ssl_context
+from models import Ingredient
+from ws import ws_manager
+
+
+class AlertSink(ABC):
+    """Delivery channel for a batch of low-stock alerts."""
+    @abstractmethod
+    async def send(self, alerts: list[dict]):
+        ...
+
+
+class WebSocketSink(AlertSink):
+    async def send(self, alerts: list[dict]):
+        await ws_manager.broadcast({
+            "event": "low_stock",
+            "data": alerts
+        })
+
+
+# Session-level advisory lock held by the one replica that sends alert emails
+EMAIL_SENDER_LOCK_KEY = 0x4C4F5753  # "LOWS"
+
+
+class SmtpEmailSink(AlertSink):
+    """
+    Plain SMTP without auth; point it at a real relay or a local stand-in such as mailpit.
+    Every API replica LISTENs and sees the same crossings, so only the replica holding
+    EMAIL_SENDER_LOCK_KEY emails. The lock sits on a dedicated connection outside the pool;
+    when that replica goes away the lock is freed and the next one to send takes it over.
+    """
+    def __init__(self, config: NotificationConfig):
+        self.config = config
+        self._lock_conn: asyncpg.Connection | None = None
+
+    async def _holds_sender_lock(self) -> bool:
+        if self._lock_conn is not None:
+            try:
+                await self._lock_conn.fetchval("SELECT 1")
+                return True
+            except Exception:
+                # Connection lost, and the lock with it; try to take it again below
+                self._lock_conn.terminate()
+                self._lock_conn = None
+
+        conn = await asyncpg.connect(ASYNCPG_DSN, ssl=ssl_context)
+        try:
+            acquired = await conn.fetchval("SELECT pg_try_advisory_lock($1)", EMAIL_SENDER_LOCK_KEY)
+        except Exception:
+            conn.terminate()
+            raise
+        if acquired:
+            self._lock_conn = conn
+        else:
+            await conn.close()
+        return acquired
+
+    def _send(self, message: EmailMessage):
+        with smtplib.SMTP(self.config.smtp_host, self.config.smtp_port, timeout=10) as smtp:
+            smtp.send_message(message)
+
+    async def send(self, alerts: list[dict]):
+        if not self.config.email_recipients or not await self._holds_sender_lock():
+            return
+        message = EmailMessage()
+        message["From"] = self.config.smtp_sender
+        message["To"] = ", ".join(self.config.email_recipients)
+        message["Subject"] = f"Low stock: {len(alerts)} ingredient(s) below threshold"
+        message.set_content("\n".join(
+            f"- {alert['name']} (#{alert['id']}): {alert['quantity']} left, threshold {alert['threshold']}"
+            for alert in alerts
+        ))
+        await asyncio.to_thread(self._send, message)
+
+
+class NotificationService:
+    """
+    Consumes threshold crossings published by the ingredient history trigger
+    (pg_notify on the low-stock channel) and delivers them to every sink.
+
+    - dedupe: an ingredient is alerted at most once per cooldown
+    - batching: crossings arriving within the batch window are sent together
+    - rate limit: at most one delivery per min interval; anything arriving meanwhile is
+      merged into the next delivery, newest state per ingredient wins
+    """
+    def __init__(self, config: NotificationConfig = notification_config, sinks: list[AlertSink] | None = None):
+        self.config = config
+        if sinks is None:
+            sinks = [WebSocketSink()]
+            if config.email_enabled:
+                sinks.append(SmtpEmailSink(config))
+        self.sinks = sinks
+        self._queue: asyncio.Queue[dict] = asyncio.Queue()
+        self._pending: dict[int, dict] = {}
+        self._last_alerted: dict[int, float] = {}
+        self._last_delivery = 0.0
+        self._task: asyncio.Task | None = None
+
+    def handle_notification(self, channel: str, payload: str):
+        """PgListener handler; only parses and enqueues."""
+        try:
+            crossings = json.loads(payload)
+        except ValueError:
+            print(f"[NOTIFICATION] Invalid payload on {channel}: {payload}", file=sys.stderr, flush=True)
+            return
+        for crossing in crossings:
+            self._queue.put_nowait(crossing)
+
+    def _collect(self, crossing: dict):
+        last = self._last_alerted.get(crossing["id"])
+        if last is not None and time.monotonic() - last < self.config.cooldown_seconds:
+            return
+        self._pending[crossing["id"]] = crossing
+
+    def _drain(self):
+        while not self._queue.empty():
+            self._collect(self._queue.get_nowait())
+
+    async def _consume(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            self._collect(await self._queue.get())
+
+            deadline = loop.time() + self.config.batch_window_seconds
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    self._collect(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            wait = self._last_delivery + self.config.min_interval_seconds - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                self._drain()
+
+            try:
+                await self.alert_low_stock()
+            except Exception as e:
+                print(f"[NOTIFICATION] Delivery failed: {e}", file=sys.stderr, flush=True)
+
+    async def alert_low_stock(self):
+        """Deliver every pending alert in one batch."""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        try:
+            async with SessionFactory() as session:
+                result = await session.execute(
+                    select(Ingredient.id, Ingredient.name).where(Ingredient.id.in_(pending))
+                )
+                names = dict(result.all())
+        except Exception:
+            self._requeue(pending)
+            raise
+
+        alerts = [
+            {**crossing, "name": names.get(ingredient_id)}
+            for ingredient_id, crossing in sorted(pending.items())
+            if ingredient_id in names
+        ]
+        if not alerts:
+            return  # every ingredient was deleted meanwhile
+
+        delivered = False
+        for sink in self.sinks:
+            try:
+                await sink.send(alerts)
+                delivered = True
+            except Exception as e:
+                print(f"[NOTIFICATION] {type(sink).__name__} failed: {e}", file=sys.stderr, flush=True)
+
+        now = time.monotonic()
+        self._last_delivery = now
+        if not delivered:
+            # No cooldown for alerts nobody received; they go out with the next batch
+            self._requeue(pending)
+            return
+        for ingredient_id in pending:
+            self._last_alerted[ingredient_id] = now
+        print(f"[NOTIFICATION] Sent low stock alert for {len(alerts)} ingredient(s)", file=sys.stdout, flush=True)
+
+    def _requeue(self, pending: dict[int, dict]):
+        # Crossings collected meanwhile are newer and win
+        self._pending = {**pending, **self._pending}
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._consume())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# Global singleton instance
+notification_service = NotificationService()
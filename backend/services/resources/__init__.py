@@ -1 +1,4 @@
-from .Ingredient import TrackingService, RestockService
\ No newline at end of file
+from .Ingredient import TrackingService, RestockService
+from .BulkImport import BulkImportService
+from .Forecast import ForecastService
+from .Notification import NotificationService, notification_service
@@ -0,0 +1,47 @@
+"""
+Tests run against the database in DATABASE_URL (migrated to head). Each test works inside
+one outer transaction that is rolled back afterwards, so nothing it writes is kept;
+repository flushes and commits land in a savepoint, as in benchmarks/write_round_trips.py.
+Database tests are the test_*_db.py modules; without DATABASE_URL they are not collected.
+
+Usage (from backend/):
+    pip install -r requirements-dev.txt
+    python -m pytest
+"""
+import asyncio
+import os
+
+import pytest
+from dotenv import load_dotenv
+
+load_dotenv()
+
+if not os.getenv("DATABASE_URL"):
+    collect_ignore_glob = ["test_*_db.py"]
+
+
+@pytest.fixture
+def in_rollback():
+    """Run scenario(db) on a session whose work is rolled back; returns its result."""
+    def run(scenario):
+        from sqlalchemy.ext.asyncio import AsyncSession
+        from configs.postgre import engine
+
+        async def main():
+            engine.echo = False
+            try:
+                async with engine.connect() as conn:
+                    outer = await conn.begin()
+                    try:
+                        async with AsyncSession(
+                            bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False
+                        ) as db:
+                            return await scenario(db)
+                    finally:
+                        await outer.rollback()
+            finally:
+                # asyncio.run gives every test a new loop; pooled connections belong to the old one
+                await engine.dispose()
+
+        return asyncio.run(main())
+    return run
@@ -0,0 +1,113 @@
+import uuid
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import insert
+
+from models import Order, OrderItem, Table
+from repository.booking import OrderItemRepository, OrderItemStatusRepository, OrderRepository, OrderStatusRepository
+from repository.fastpath import FastReadRepository
+from repository.resources import DishRepository, TableRepository, TableStatusRepository
+from schemas.booking import OrderItemFilter, OrderItemStatusCreate, OrderStatusCreate
+from schemas.resources import DishCreate, DishFilter, DishRead, TableCreate, TableFilter, TableStatusCreate
+
+
+def _by_id(rows):
+    # The ORM reads have no ORDER BY; the fast path orders by id
+    return sorted(rows, key=lambda row: row["id"])
+
+
+async def _insert(db, model, **values) -> int:
+    return await db.scalar(insert(model.__table__).values(**values).returning(model.__table__.c.id))
+
+
+async def _seed(db):
+    """A table, two dishes and two orders: one with two items, one with none."""
+    tag = uuid.uuid4().hex[:8]
+    table_status = await TableStatusRepository(db).create_table_status(TableStatusCreate(status=f"test {tag}"))
+    table = await TableRepository(db).create_table(TableCreate(number=f"T-{tag}", seats=4, status_id=table_status.id))
+    order_status = await OrderStatusRepository(db).create_status(OrderStatusCreate(status=f"test {tag}"))
+    item_status = await OrderItemStatusRepository(db).create_status(OrderItemStatusCreate(status=f"test {tag}"))
+    dishes = [
+        (await DishRepository(db).create_dish(DishCreate(name=f"test {tag}", price="12.50"))).id,
+        (await DishRepository(db).create_dish(
+            DishCreate(name=f"test {tag} 2", price=30000, description="spicy", image_url="https://example.com/d.png"))).id,
+    ]
+
+    order_id = await _insert(db, Order, table_id=table.id, status_id=order_status.id)
+    empty_order_id = await _insert(db, Order, table_id=table.id, status_id=order_status.id)
+    for dish_id, quantity in zip(dishes, (1, 3)):
+        await _insert(db, OrderItem, order_id=order_id, dish_id=dish_id, status_id=item_status.id, quantity=quantity)
+    return {"table": table, "order": order_id, "empty_order": empty_order_id, "item_status": item_status.id}
+
+
+def test_fast_reads_match_orm(in_rollback):
+    async def scenario(db):
+        seeded = await _seed(db)
+        fast = FastReadRepository(db)
+        compared = {}
+
+        orm_tables = await TableRepository(db).get_all_tables(TableFilter())
+        compared["tables"] = (_by_id(t.model_dump() for t in orm_tables), await fast.get_tables())
+
+        orm_dishes = await DishRepository(db).get_all_dishes(DishFilter())
+        compared["dishes"] = (_by_id(DishRead.model_validate(d).model_dump() for d in orm_dishes), await fast.get_dishes())
+
+        for name in ("order", "empty_order"):
+            order_id = seeded[name]
+            order = await OrderRepository(db).get_order_by_id(order_id)
+            compared[name] = (order.model_dump(), await fast.get_order_by_id(order_id))
+            items = await OrderItemRepository(db).get_all_order_items(OrderItemFilter(order_id=order_id))
+            compared[f"{name} items"] = (_by_id(i.model_dump() for i in items),
+                                         await fast.get_order_items_by_order_id(order_id))
+
+        compared["missing order"] = (await OrderRepository(db).get_order_by_id(0), await fast.get_order_by_id(0))
+        compared["missing order items"] = (
+            await OrderItemRepository(db).get_all_order_items(OrderItemFilter(order_id=0)),
+            await fast.get_order_items_by_order_id(0),
+        )
+        return seeded, compared
+
+    seeded, compared = in_rollback(scenario)
+    for name, (orm, fast) in compared.items():
+        assert fast == orm, name
+    # Same types too, not just equal-comparing values (Decimal prices, naive datetimes)
+    orm_items, fast_items = compared["order items"]
+    assert type(fast_items[0]["dish"]["price"]) is type(orm_items[0]["dish"]["price"])
+    assert type(compared["order"][1]["created_at"]) is type(compared["order"][0]["created_at"])
+    assert len(compared["order items"][1]) == 2
+    assert compared["empty_order items"][1] == []
+    assert compared["missing order"][1] is None
+
+
+def test_fast_tables_fail_like_orm_on_null_status(in_rollback):
+    async def scenario(db):
+        await _insert(db, Table, number=f"T-{uuid.uuid4().hex[:8]}", seats=2, status_id=None)
+        errors = []
+        for read in (lambda: TableRepository(db).get_all_tables(TableFilter()), FastReadRepository(db).get_tables):
+            with pytest.raises(ValidationError) as raised:
+                await read()
+            errors.append({(e["loc"], e["type"]) for e in raised.value.errors()})
+        return errors
+
+    orm_errors, fast_errors = in_rollback(scenario)
+    assert fast_errors == orm_errors
+
+
+def test_fast_order_items_fail_like_orm_on_null_dish(in_rollback):
+    async def scenario(db):
+        seeded = await _seed(db)
+        order_id = seeded["order"]
+        await _insert(db, OrderItem, order_id=order_id, dish_id=None, status_id=seeded["item_status"], quantity=1)
+        errors = []
+        for read in (
+            lambda: OrderItemRepository(db).get_all_order_items(OrderItemFilter(order_id=order_id)),
+            lambda: FastReadRepository(db).get_order_items_by_order_id(order_id),
+        ):
+            with pytest.raises(ValidationError) as raised:
+                await read()
+            errors.append({(e["loc"], e["type"]) for e in raised.value.errors()})
+        return errors
+
+    orm_errors, fast_errors = in_rollback(scenario)
+    assert fast_errors == orm_errors
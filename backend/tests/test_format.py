@@ -0,0 +1,14 @@
+from datetime import datetime, timedelta, timezone
+
+from utils.format import safe_str_to_datetime, to_naive_utc
+
+
+def test_to_naive_utc_converts_offsets():
+    aware = datetime(2026, 10, 19, 7, 0, tzinfo=timezone(timedelta(hours=7)))
+    assert to_naive_utc(aware) == datetime(2026, 10, 19, 0, 0)
+    assert to_naive_utc(safe_str_to_datetime("2026-10-19T00:00:00Z")) == datetime(2026, 10, 19)
+
+
+def test_to_naive_utc_keeps_naive_and_none():
+    assert to_naive_utc(datetime(2026, 10, 19, 12)) == datetime(2026, 10, 19, 12)
+    assert to_naive_utc(None) is None
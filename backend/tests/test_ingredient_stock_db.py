@@ -0,0 +1,59 @@
+import uuid
+
+from repository.resources import IngredientRepository, IngredientUnitRepository
+from schemas.resources import IngredientCreate, IngredientStockTakeCreate, IngredientUnitCreate
+
+
+async def _ingredients(db, *quantities):
+    unit = await IngredientUnitRepository(db).create_ingredient_unit(IngredientUnitCreate(name=f"kg {uuid.uuid4().hex[:8]}"))
+    repo = IngredientRepository(db)
+    return [
+        (await repo.create_ingredient(IngredientCreate(
+            name=f"test {uuid.uuid4().hex[:8]}", unit_id=unit.id, quantity=quantity, threshold=1))).id
+        for quantity in quantities
+    ]
+
+
+def _quantities(result):
+    return {item.id: item.quantity for item in result.items}
+
+
+def test_stock_take_with_only_counts(in_rollback):
+    async def scenario(db):
+        a, b = await _ingredients(db, 10, 20)
+        result = await IngredientRepository(db).adjust_stock(IngredientStockTakeCreate(items=[
+            {"ingredient_id": a, "quantity": 7},
+            {"ingredient_id": b, "quantity": 0},
+        ]))
+        return a, b, result
+
+    a, b, result = in_rollback(scenario)
+    assert _quantities(result) == {a: 7, b: 0}
+    assert result.missing_ids == []
+
+
+def test_stock_take_with_only_deltas(in_rollback):
+    async def scenario(db):
+        a, b = await _ingredients(db, 10, 20)
+        result = await IngredientRepository(db).adjust_stock(IngredientStockTakeCreate(items=[
+            {"ingredient_id": a, "delta": -2.5},
+            {"ingredient_id": b, "delta": 4},
+        ]))
+        return a, b, result
+
+    a, b, result = in_rollback(scenario)
+    assert _quantities(result) == {a: 7.5, b: 24}
+
+
+def test_stock_take_mixed_reports_missing(in_rollback):
+    async def scenario(db):
+        (a,) = await _ingredients(db, 10)
+        result = await IngredientRepository(db).adjust_stock(IngredientStockTakeCreate(items=[
+            {"ingredient_id": a, "delta": 1},
+            {"ingredient_id": 0, "quantity": 3},
+        ]))
+        return a, result
+
+    a, result = in_rollback(scenario)
+    assert _quantities(result) == {a: 11}
+    assert result.missing_ids == [0]
@@ -0,0 +1,46 @@
+"""
+Bulk import dishes, ingredients, equipments or tables from a CSV/NDJSON file.
+
+Usage (from backend/):
+    python -m utils.bulk_import ingredients ./ingredients.csv
+    python -m utils.bulk_import dishes ./dishes.ndjson --format ndjson
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from configs.postgre import SessionFactory
+from schemas.resources import BulkImportEntity, BulkImportFormat
+from services.resources import BulkImportService
+from services.resources.BulkImport import detect_format, parse_rows
+
+
+async def run_import(entity: BulkImportEntity, path: Path, fmt: BulkImportFormat | None) -> int:
+    fmt = fmt or detect_format(path.name, None)
+    rows = parse_rows(path.read_bytes(), fmt)
+
+    async with SessionFactory() as session:
+        result = await BulkImportService(session).import_rows(entity, rows)
+        await session.commit()
+
+    print(f"{result.entity.value}: received {result.received}, inserted {result.inserted}, "
+          f"rejected {len(result.errors)}")
+    for error in result.errors:
+        print(f"  row {error.row}: {error.message}", file=sys.stderr)
+
+    return 1 if result.errors else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import resources from CSV/NDJSON.")
+    parser.add_argument("entity", type=BulkImportEntity, choices=list(BulkImportEntity))
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", type=BulkImportFormat, choices=list(BulkImportFormat), default=None)
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(run_import(args.entity, args.path, args.format)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 def safe_str_to_datetime(value: str | None) -> datetime | None:
     if not value:
@@ -9,3 +9,8 @@ def safe_str_to_datetime(value: str | None) -> datetime | None:
         return None
 
 
+def to_naive_utc(value: datetime | None) -> datetime | None:
+    """Timestamps are stored as naive UTC; convert an offset-aware value to match."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
@@ -0,0 +1,383 @@
+"""
+Index advisor: ranks the statements that dominate database time, names the repository
+methods behind them, and proposes indexes (costed with HypoPG) and query rewrites.
+
+Workload sources (either or both):
+  - pg_stat_statements on the target database (needs the extension in
+    shared_preload_libraries and CREATE EXTENSION pg_stat_statements)
+  - a capture file written by the API with QUERY_CAPTURE_PATH set (utils.query_capture),
+    which also knows which repository/service method issued each statement
+
+Statements are planned with a forced generic plan (PREPARE + EXPLAIN EXECUTE with NULL
+arguments), so parameterized text from either source can be analysed without values.
+Candidate indexes come from sequential scans with filters, join keys or sorts; each is
+created as a hypothetical HypoPG index, the affected statements are re-planned and the
+estimated saving is weighted by their total time. Nothing is created for real.
+
+Usage (from backend/):
+    python -m utils.index_advisor                       # pg_stat_statements of DATABASE_URL
+    python -m utils.index_advisor --capture queries.json --database-url postgresql://...staging
+    python -m utils.index_advisor --capture queries.json --no-pg-stat-statements
+"""
+import argparse
+import asyncio
+import json
+import re
+import statistics
+import sys
+from dataclasses import dataclass, field
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from configs.postgre import DATABASE_URL, ssl_context
+from utils.query_capture import load_capture, normalize
+
+ANALYZABLE = ("select", "with", "update", "delete")
+MIN_COST_GAIN = 0.1          # hypothetical index must cut a statement's plan cost by 10%
+
+_column_ref = re.compile(r"(?:\b(\w+)\.)?\b(\w+)\s*(=|<>|<=|>=|<|>|~~\*|~~|!~~\*|!~~)\s*")
+_any_ref = re.compile(r"(?:\b(\w+)\.)?\b(\w+)\s*=\s*ANY\b")
+_qualified = re.compile(r"\b(\w+)\.(\w+)\b")
+_param = re.compile(r"\$(\d+)")
+_id_lookup = re.compile(r"\.id = \$\?", re.IGNORECASE)
+
+
+@dataclass
+class Statement:
+    query: str                      # runnable text
+    calls: int = 0
+    total_ms: float = 0.0
+    rows: int = 0
+    callers: dict[str, int] = field(default_factory=dict)
+    cost: float | None = None
+    plan: dict | None = None
+    error: str | None = None
+
+    @property
+    def key(self) -> str:
+        return normalize(self.query)
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+    @property
+    def caller(self) -> str:
+        if not self.callers:
+            return "?"
+        return max(self.callers, key=self.callers.get)
+
+
+@dataclass
+class Candidate:
+    table: str                      # schema-qualified
+    columns: tuple[str, ...]
+    statements: set[int] = field(default_factory=set)
+    saved_ms: float = 0.0
+    size_bytes: int | None = None
+
+    @property
+    def ddl(self) -> str:
+        return f"CREATE INDEX CONCURRENTLY ON {self.table} ({', '.join(self.columns)});"
+
+
+# --- Workload -------------------------------------------------------------------
+
+async def load_pg_stat_statements(conn: asyncpg.Connection, limit: int, min_calls: int) -> list[Statement]:
+    rows = await conn.fetch(
+        """
+        SELECT query, calls, total_exec_time, rows
+        FROM pg_stat_statements
+        WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+          AND calls >= $1
+          AND query NOT ILIKE '%pg_stat_statements%'
+        ORDER BY total_exec_time DESC
+        LIMIT $2
+        """,
+        min_calls, limit,
+    )
+    return [Statement(row["query"], row["calls"], row["total_exec_time"], row["rows"]) for row in rows]
+
+
+def merge_capture(statements: list[Statement], capture: list[dict], use_timings: bool) -> list[Statement]:
+    """Attach callers to pg_stat_statements entries, or use the capture as the workload."""
+    by_key = {statement.key: statement for statement in statements}
+    for entry in capture:
+        statement = by_key.get(normalize(entry["query"]))
+        if statement is None:
+            if not use_timings:
+                continue
+            statement = Statement(entry.get("example", entry["query"]))
+            by_key[statement.key] = statement
+            statements.append(statement)
+        if use_timings:
+            statement.calls += entry["calls"]
+            statement.total_ms += entry["total_ms"]
+            statement.rows += entry["rows"]
+        for caller, count in entry["callers"].items():
+            statement.callers[caller] = statement.callers.get(caller, 0) + count
+    return statements
+
+
+# --- Planning -------------------------------------------------------------------
+
+async def generic_plan(conn: asyncpg.Connection, query: str) -> dict:
+    """Top plan node of the statement's generic plan, without executing it."""
+    params = max((int(n) for n in _param.findall(query)), default=0)
+    await conn.execute(f"PREPARE index_advisor_stmt AS {query}")
+    try:
+        arguments = f"({', '.join(['NULL'] * params)})" if params else ""
+        result = await conn.fetchval(f"EXPLAIN (FORMAT JSON, VERBOSE) EXECUTE index_advisor_stmt{arguments}")
+    finally:
+        await conn.execute("DEALLOCATE index_advisor_stmt")
+    plan = json.loads(result) if isinstance(result, str) else result
+    return plan[0]["Plan"]
+
+
+def walk(node: dict):
+    yield node
+    for child in node.get("Plans", []):
+        yield from walk(child)
+
+
+def columns_in(expression: str, alias: str, known: set[str]) -> list[tuple[str, str]]:
+    """(column, operator) pairs of `alias` referenced in a plan condition."""
+    found = []
+    for pattern, fixed in ((_any_ref, "= ANY"), (_column_ref, None)):
+        for match in pattern.finditer(expression):
+            qualifier, column = match.group(1), match.group(2)
+            if qualifier not in (None, alias) or column not in known:
+                continue
+            found.append((column, fixed or match.group(3)))
+    return found
+
+
+def qualified_in(expression: str, alias: str, known: set[str]) -> list[str]:
+    """Columns of `alias` on either side of a join condition."""
+    return [column for qualifier, column in _qualified.findall(expression) if qualifier == alias and column in known]
+
+
+async def table_columns(conn: asyncpg.Connection, table: str, cache: dict) -> set[str]:
+    if table not in cache:
+        rows = await conn.fetch(
+            "SELECT attname FROM pg_attribute WHERE attrelid = to_regclass($1) AND attnum > 0 AND NOT attisdropped",
+            table,
+        )
+        cache[table] = {row["attname"] for row in rows}
+    return cache[table]
+
+
+async def existing_prefixes(conn: asyncpg.Connection, table: str, cache: dict) -> list[tuple[str, ...]]:
+    """Column lists of the table's valid btree indexes."""
+    if table not in cache:
+        rows = await conn.fetch(
+            """
+            SELECT array_agg(a.attname ORDER BY k.ord) AS columns
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            JOIN pg_am am ON am.oid = c.relam AND am.amname = 'btree'
+            CROSS JOIN LATERAL unnest(i.indkey) WITH ORDINALITY AS k(attnum, ord)
+            JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = k.attnum
+            WHERE i.indrelid = to_regclass($1) AND i.indisvalid AND i.indpred IS NULL
+            GROUP BY i.indexrelid
+            """,
+            table,
+        )
+        cache[table] = [tuple(row["columns"]) for row in rows]
+    return cache[table]
+
+
+async def propose(conn: asyncpg.Connection, plan: dict, caches: dict) -> list[tuple[str, tuple[str, ...]]]:
+    """Candidate (table, columns) for every sequentially scanned relation in a plan."""
+    scans = {}
+    for node in walk(plan):
+        if node["Node Type"] == "Seq Scan":
+            table = f"{node.get('Schema', 'public')}.{node['Relation Name']}"
+            scans[node.get("Alias", node["Relation Name"])] = (table, node)
+
+    candidates = []
+    for alias, (table, scan) in scans.items():
+        known = await table_columns(conn, table, caches.setdefault("columns", {}))
+        equality, ranges, joins, order = [], [], [], []
+
+        for column, operator in columns_in(scan.get("Filter", ""), alias, known):
+            if operator in ("=", "= ANY"):
+                equality.append(column)
+            elif operator in ("<", ">", "<=", ">="):
+                ranges.append(column)
+        for node in walk(plan):
+            for key in ("Hash Cond", "Merge Cond", "Join Filter"):
+                joins += qualified_in(node.get(key, ""), alias, known)
+            if node["Node Type"] in ("Sort", "Incremental Sort"):
+                for sort_key in node.get("Sort Key", []):
+                    parts = sort_key.split()
+                    qualifier, _, column = parts[0].rpartition(".")
+                    if qualifier in ("", alias) and column in known:
+                        order.append(column + (" DESC" if "DESC" in parts else ""))
+
+        columns = list(dict.fromkeys(equality + joins))
+        if ranges:
+            columns.append(ranges[0])
+        elif order and not columns:
+            columns += order[:2]
+        if not columns:
+            continue
+        columns = tuple(columns[:3])
+
+        bare = tuple(c.split()[0] for c in columns)
+        prefixes = await existing_prefixes(conn, table, caches.setdefault("indexes", {}))
+        if any(existing[:len(bare)] == bare for existing in prefixes):
+            continue
+        candidates.append((table, columns))
+    return candidates
+
+
+# --- Suggestions ----------------------------------------------------------------
+
+def rewrite_hints(statement: Statement, median_calls: float) -> list[str]:
+    hints = []
+    key = statement.key
+    lowered = key.lower()
+    if "$n, ..." in key:
+        hints.append("IN list with one parameter per element: pass one array, `= ANY($1)`, "
+                     "so the text (and its prepared plan) does not change with the list length")
+    if "~~*" in (json.dumps(statement.plan) if statement.plan else "") or " ilike " in lowered:
+        hints.append("ILIKE '%...%' cannot use a btree; a pg_trgm GIN index "
+                     "(USING gin (col gin_trgm_ops)) or full-text search can")
+    if statement.calls > 20 * max(median_calls, 1) and _id_lookup.search(key) and statement.rows <= statement.calls:
+        hints.append(f"{statement.calls} single-row lookups from {statement.caller}: likely an N+1, "
+                     "load the ids in one query (selectinload / = ANY)")
+    if statement.calls and statement.rows / statement.calls > 1000 and " limit " not in lowered:
+        hints.append(f"returns {statement.rows // statement.calls} rows per call without LIMIT: "
+                     "paginate or aggregate in SQL")
+    if lowered.startswith("select") and " count(" in lowered and statement.mean_ms > 50:
+        hints.append("slow COUNT: consider a maintained counter or an estimate (pg_class.reltuples)")
+    return hints
+
+
+async def hypopg_available(conn: asyncpg.Connection) -> bool:
+    return bool(await conn.fetchval("SELECT 1 FROM pg_extension WHERE extname = 'hypopg'"))
+
+
+async def cost_candidates(conn: asyncpg.Connection, candidates: list[Candidate], statements: list[Statement]):
+    """Estimated ms saved per candidate: each affected statement's total time x cost reduction."""
+    for candidate in candidates:
+        column_list = ", ".join(candidate.columns)
+        row = await conn.fetchrow(
+            "SELECT indexrelid FROM hypopg_create_index($1)",
+            f"CREATE INDEX ON {candidate.table} ({column_list})",
+        )
+        try:
+            candidate.size_bytes = await conn.fetchval("SELECT hypopg_relation_size($1)", row["indexrelid"])
+            for index in candidate.statements:
+                statement = statements[index]
+                try:
+                    cost = (await generic_plan(conn, statement.query))["Total Cost"]
+                except asyncpg.PostgresError:
+                    continue
+                gain = 1 - cost / statement.cost if statement.cost else 0
+                if gain >= MIN_COST_GAIN:
+                    candidate.saved_ms += statement.total_ms * gain
+        finally:
+            await conn.execute("SELECT hypopg_drop_index($1)", row["indexrelid"])
+
+
+# --- Report ---------------------------------------------------------------------
+
+def shorten(text: str, width: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
+def report(statements: list[Statement], candidates: list[Candidate], costed: bool, top: int):
+    total = sum(s.total_ms for s in statements) or 1
+    print(f"\nTop statements by total time ({len(statements)} analysed)")
+    print(f"{'#':>3} {'total ms':>11} {'share':>6} {'calls':>9} {'mean ms':>9}  caller / statement")
+    for i, statement in enumerate(statements[:top], 1):
+        print(f"{i:>3} {statement.total_ms:>11.1f} {statement.total_ms / total:>6.1%} "
+              f"{statement.calls:>9} {statement.mean_ms:>9.2f}  {statement.caller}")
+        print(f"{'':>42}{shorten(statement.query, 100)}")
+        if statement.error:
+            print(f"{'':>42}(not planned: {shorten(statement.error, 80)})")
+
+    print("\nIndex suggestions" + (" (ranked by estimated time saved)" if costed else
+                                   " (HypoPG not installed: ranked by time of affected statements)"))
+    if not candidates:
+        print("  none: every filtered or joined scan already has a usable index")
+    for candidate in candidates:
+        helped = ", ".join(f"#{i + 1}" for i in sorted(candidate.statements))
+        if costed:
+            size = f", ~{candidate.size_bytes / 2**20:.1f} MiB" if candidate.size_bytes else ""
+            print(f"  {candidate.ddl}\n      saves ~{candidate.saved_ms:.0f} ms of {total:.0f} ms{size}; statements {helped}")
+        else:
+            print(f"  {candidate.ddl}\n      statements {helped}")
+
+    print("\nRewrite suggestions")
+    median_calls = statistics.median([s.calls for s in statements]) if statements else 0
+    any_hint = False
+    for i, statement in enumerate(statements[:top], 1):
+        for hint in rewrite_hints(statement, median_calls):
+            any_hint = True
+            print(f"  #{i} {statement.caller}: {hint}")
+    if not any_hint:
+        print("  none")
+
+
+async def main(args):
+    url = make_url(args.database_url or DATABASE_URL).set(drivername="postgresql", query={})
+    conn = await asyncpg.connect(url.render_as_string(hide_password=False), ssl=None if args.no_ssl else ssl_context)
+    try:
+        await conn.execute("SET plan_cache_mode = force_generic_plan")
+        statements: list[Statement] = []
+        if args.pg_stat_statements:
+            try:
+                statements = await load_pg_stat_statements(conn, args.limit, args.min_calls)
+            except asyncpg.PostgresError as e:
+                print(f"pg_stat_statements unavailable ({e}); use --capture", file=sys.stderr)
+        if args.capture:
+            statements = merge_capture(statements, load_capture(args.capture), use_timings=not statements)
+        statements = [s for s in statements if s.calls >= args.min_calls]
+        statements.sort(key=lambda s: -s.total_ms)
+        statements = statements[:args.limit]
+        if not statements:
+            print("No workload: enable pg_stat_statements or pass --capture FILE", file=sys.stderr)
+            return
+
+        caches: dict = {}
+        by_columns: dict[tuple, Candidate] = {}
+        for index, statement in enumerate(statements):
+            if not statement.query.lstrip().lower().startswith(ANALYZABLE):
+                continue
+            try:
+                statement.plan = await generic_plan(conn, statement.query)
+                statement.cost = statement.plan["Total Cost"]
+                for table, columns in await propose(conn, statement.plan, caches):
+                    candidate = by_columns.setdefault((table, columns), Candidate(table, columns))
+                    candidate.statements.add(index)
+            except asyncpg.PostgresError as e:
+                statement.error = str(e)   # e.g. text truncated by track_activity_query_size
+
+        candidates = list(by_columns.values())
+        costed = await hypopg_available(conn)
+        if costed:
+            await cost_candidates(conn, candidates, statements)
+            candidates = [c for c in candidates if c.saved_ms > 0]
+            candidates.sort(key=lambda c: -c.saved_ms)
+        else:
+            candidates.sort(key=lambda c: -sum(statements[i].total_ms for i in c.statements))
+        report(statements, candidates, costed, args.top)
+    finally:
+        await conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", help="defaults to DATABASE_URL")
+    parser.add_argument("--capture", help="capture file written with QUERY_CAPTURE_PATH")
+    parser.add_argument("--no-pg-stat-statements", dest="pg_stat_statements", action="store_false")
+    parser.add_argument("--limit", type=int, default=50, help="statements to analyse")
+    parser.add_argument("--top", type=int, default=20, help="statements to print")
+    parser.add_argument("--min-calls", type=int, default=1)
+    parser.add_argument("--no-ssl", action="store_true", help="for a local server without TLS")
+    asyncio.run(main(parser.parse_args()))
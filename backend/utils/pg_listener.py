@@ -0,0 +1,85 @@
+import asyncio
+import sys
+from typing import Awaitable, Callable
+
+import asyncpg
+
+from configs.postgre import ASYNCPG_DSN, ssl_context
+
+Handler = Callable[[str, str], Awaitable[None] | None]
+
+
+class PgListener:
+    """
+    Dedicated asyncpg connection for LISTEN/NOTIFY, kept outside the SQLAlchemy pool so it
+    never holds a pooled connection. Reconnects with backoff and re-subscribes every channel.
+    Handlers receive (channel, payload) and must not block.
+    """
+
+    def __init__(self):
+        self._dsn = ASYNCPG_DSN
+        self._handlers: dict[str, list[Handler]] = {}
+        self._conn: asyncpg.Connection | None = None
+        self._task: asyncio.Task | None = None
+        self._stopped = asyncio.Event()
+
+    def add_handler(self, channel: str, handler: Handler):
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def _dispatch(self, connection, pid, channel, payload):
+        for handler in self._handlers.get(channel, []):
+            try:
+                result = handler(channel, payload)
+                if asyncio.iscoroutine(result):
+                    asyncio.create_task(result)
+            except Exception as e:
+                print(f"[PG_LISTENER] Handler error on {channel}: {e}", file=sys.stderr, flush=True)
+
+    async def _run(self):
+        backoff = 1
+        while not self._stopped.is_set():
+            try:
+                self._conn = await asyncpg.connect(self._dsn, ssl=ssl_context)
+                for channel in self._handlers:
+                    await self._conn.add_listener(channel, self._dispatch)
+                print(f"[PG_LISTENER] Listening on {', '.join(self._handlers)}", file=sys.stdout, flush=True)
+                backoff = 1
+
+                lost = asyncio.Event()
+                self._conn.add_termination_listener(lambda _: lost.set())
+                waiters = [asyncio.create_task(self._stopped.wait()), asyncio.create_task(lost.wait())]
+                _, pending = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                for waiter in pending:
+                    waiter.cancel()
+            except Exception as e:
+                # Anything (InterfaceError, connect timeouts, ...) must retry rather than end
+                # the task: alerts, job and outbox wake-ups all depend on this loop
+                print(f"[PG_LISTENER] Connection failed: {e!r}, retrying in {backoff}s", file=sys.stderr, flush=True)
+            finally:
+                if self._conn is not None and not self._conn.is_closed():
+                    try:
+                        await self._conn.close(timeout=5)
+                    except Exception:
+                        self._conn.terminate()
+                self._conn = None
+
+            if not self._stopped.is_set():
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), timeout=backoff)
+                except asyncio.TimeoutError:
+                    pass
+                backoff = min(backoff * 2, 30)
+
+    def start(self):
+        if self._task is None and self._handlers:
+            self._stopped.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._stopped.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+
+pg_listener = PgListener()
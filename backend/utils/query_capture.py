@@ -0,0 +1,123 @@
+"""
+Records the SQL the app issues, with timings and the repository/service method that
+issued it, for the index advisor (python -m utils.index_advisor --capture FILE).
+
+Set QUERY_CAPTURE_PATH to enable: the API attaches the capture at startup and writes the
+aggregate there on shutdown. Each statement costs a stack walk; meant for local/staging.
+"""
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+
+from sqlalchemy import event
+
+CALLER_PACKAGES = ("repository.", "services.", "routes.", "utils.")
+SKIP_MODULES = ("utils.query_capture",)
+
+_whitespace = re.compile(r"\s+")
+# IN lists of any length collapse to one shape: ($1::INTEGER, $2::INTEGER, ...) -> ($n, ...)
+_param_list = re.compile(r"\$\d+(?:::[\w ]+(?:\[\])?)?(?:\s*,\s*\$\d+(?:::[\w ]+(?:\[\])?)?)+")
+_param = re.compile(r"\$\d+")
+
+
+def normalize(statement: str) -> str:
+    """
+    Shape of a statement, shared by captured SQL and pg_stat_statements text. Parameter
+    numbers are dropped because they shift with the length of any IN list before them.
+    """
+    collapsed = _param_list.sub("$n, ...", _whitespace.sub(" ", statement).strip())
+    return _param.sub("$?", collapsed)
+
+
+def _caller_in(frame) -> str | None:
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith(CALLER_PACKAGES) and not module.startswith(SKIP_MODULES):
+            code = frame.f_code
+            return f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+        frame = frame.f_back
+    return None
+
+
+def find_caller() -> str:
+    """
+    First repository/service/route frame above the driver call. Async sessions run the
+    driver in a child greenlet whose stack starts fresh, so the awaiting coroutine is
+    found through the parent greenlet's suspended frame.
+    """
+    caller = _caller_in(sys._getframe(1))
+    if caller is None:
+        try:
+            import greenlet
+            parent = greenlet.getcurrent().parent
+            if parent is not None:
+                caller = _caller_in(parent.gr_frame)
+        except ImportError:
+            pass
+    return caller or "unknown"
+
+
+class QueryCapture:
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.stats: dict[str, dict] = {}
+        self._engine = None
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        # One statement at a time per connection; a failed one is simply overwritten
+        conn.info["query_capture"] = (time.perf_counter(), find_caller())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        started, caller = conn.info.pop("query_capture", (time.perf_counter(), "unknown"))
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        key = normalize(statement)
+        entry = self.stats.get(key)
+        if entry is None:
+            entry = self.stats[key] = {
+                "example": _whitespace.sub(" ", statement).strip(),   # runnable text for EXPLAIN
+                "calls": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0, "callers": Counter(),
+            }
+        entry["calls"] += 1
+        entry["total_ms"] += elapsed_ms
+        entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+        entry["rows"] += max(getattr(cursor, "rowcount", 0) or 0, 0)
+        entry["callers"][caller] += 1
+
+    def attach(self, engine):
+        """Hook an (async or sync) SQLAlchemy engine."""
+        sync_engine = getattr(engine, "sync_engine", engine)
+        event.listen(sync_engine, "before_cursor_execute", self._before)
+        event.listen(sync_engine, "after_cursor_execute", self._after)
+        self._engine = sync_engine
+
+    def detach(self):
+        if self._engine is not None:
+            event.remove(self._engine, "before_cursor_execute", self._before)
+            event.remove(self._engine, "after_cursor_execute", self._after)
+            self._engine = None
+
+    def dump(self, path: str | None = None):
+        path = path or self.path
+        entries = [
+            {"query": query, **{k: v for k, v in entry.items() if k != "callers"},
+             "callers": dict(entry["callers"].most_common())}
+            for query, entry in sorted(self.stats.items(), key=lambda item: -item[1]["total_ms"])
+        ]
+        with open(path, "w") as f:
+            json.dump(entries, f, indent=2)
+        print(f"[QUERY_CAPTURE] Wrote {len(entries)} statements to {path}", file=sys.stdout, flush=True)
+
+
+def load_capture(path: str) -> list[dict]:
+    with open(path) as f:
+        return json.load(f)
+
+
+query_capture = QueryCapture(os.getenv("QUERY_CAPTURE_PATH"))
@@ -0,0 +1,45 @@
+"""
+Run background job workers beside the API process.
+
+Usage (from backend/):
+    python -m utils.run_workers --workers 4
+
+Set JOB_API_WORKERS=0 for the API if all jobs should run here instead.
+"""
+import argparse
+import asyncio
+import signal
+
+from configs.jobs import job_config
+from configs.postgre import engine
+from repository.jobs import JOB_NOTIFY_CHANNEL
+from services.jobs import JobWorkerPool
+from utils.pg_listener import PgListener
+
+
+async def main(workers: int):
+    engine.echo = False
+    pool = JobWorkerPool(workers, job_config)
+    listener = PgListener()
+    listener.add_handler(JOB_NOTIFY_CHANNEL, pool.wake)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    listener.start()
+    pool.start()
+    await stop.wait()
+
+    print("Stopping workers after their current job...")
+    await pool.stop()
+    await listener.stop()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.workers))
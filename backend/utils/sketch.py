@@ -0,0 +1,62 @@
+import math
+
+# Values v in (GAMMA**(i-1), GAMMA**i] fall into bucket i, so any quantile read back is within
+# RELATIVE_ACCURACY of the true value. The order-item status trigger computes the same index in
+# SQL; change both together.
+RELATIVE_ACCURACY = 0.02
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+LOG_GAMMA = math.log(GAMMA)
+MIN_VALUE = 1.0     # smaller values share bucket 0
+
+
+def bucket_of(value: float) -> int:
+    return math.ceil(math.log(max(value, MIN_VALUE)) / LOG_GAMMA)
+
+
+def bucket_value(bucket: int) -> float:
+    """Representative value of a bucket, at most RELATIVE_ACCURACY away from anything in it."""
+    return 2 * GAMMA ** bucket / (GAMMA + 1)
+
+
+class LogHistogram:
+    """
+    Mergeable quantile sketch: counts per log-scale bucket. Merging is adding counts,
+    so partial aggregates (per dish, per hour) combine into any coarser grouping exactly.
+    """
+    __slots__ = ("counts",)
+
+    def __init__(self, counts: dict[int, int] | None = None):
+        self.counts: dict[int, int] = dict(counts) if counts else {}
+
+    def add(self, value: float, count: int = 1):
+        bucket = bucket_of(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + count
+
+    def add_bucket(self, bucket: int, count: int):
+        self.counts[bucket] = self.counts.get(bucket, 0) + count
+
+    def merge(self, other: "LogHistogram"):
+        for bucket, count in other.counts.items():
+            self.add_bucket(bucket, count)
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts.values())
+
+    def quantile(self, q: float) -> float | None:
+        total = self.count
+        if total == 0:
+            return None
+        rank = q * (total - 1)
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen > rank:
+                return bucket_value(bucket)
+        return bucket_value(max(self.counts))
+
+    def mean(self) -> float | None:
+        total = self.count
+        if total == 0:
+            return None
+        return sum(bucket_value(b) * c for b, c in self.counts.items()) / total
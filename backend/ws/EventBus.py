@@ -1,43 +1,134 @@
-from .manager import ws_manager
+import asyncio
 import sys
 
+from .manager import ws_manager
+from .sse import sse_broker
+from .versions import ROUTING_FIELDS, entity_of, version_store
+
+COALESCE_WINDOW_SECONDS = 0.05
+
+
+class EventCoalescer:
+    """
+    Buffers event frames for a short window and sends them as one frame.
+    A frame for an entity whose latest pending frame has the same event name is merged into
+    it: full frames are replaced, deltas are folded together (from the first from_version to
+    the last version), so each entity's version chain stays contiguous. A window holding a
+    single frame is sent as is, otherwise as {"event": "batch", "events": [...]}.
+    """
+    def __init__(self, window: float = COALESCE_WINDOW_SECONDS):
+        self.window = window
+        self._pending: list[dict] = []
+        self._tail: dict[tuple, int] = {}   # entity key -> index of its latest pending frame
+        self._flush_task: asyncio.Task | None = None
+
+    def add(self, frame: dict):
+        data = frame.get("data")
+        if isinstance(data, dict) and "items" in data:
+            # Bulk frame: later frames for its items must not be merged into earlier ones
+            for item in data["items"]:
+                self._tail.pop((frame.get("entity"), item.get("id")), None)
+        entity_id = data.get("id") if isinstance(data, dict) else None
+        key = (frame.get("entity", frame["event"]), entity_id)
+        index = self._tail.get(key) if entity_id is not None else None
+
+        if index is not None and self._pending[index]["event"] == frame["event"]:
+            previous = self._pending[index]
+            if frame.get("delta"):
+                merged = {**previous, "version": frame.get("version")}
+                merged["data"] = {**previous["data"], **frame["data"]}
+                self._pending[index] = merged
+            else:
+                self._pending[index] = frame
+        else:
+            self._pending.append(frame)
+            if entity_id is not None:
+                self._tail[key] = len(self._pending) - 1
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.window)
+        self._flush_task = None
+        await self.flush()
+
+    async def flush(self):
+        if not self._pending:
+            return
+        events, self._pending, self._tail = self._pending, [], {}
+        sse_broker.publish(events)
+        frame = events[0] if len(events) == 1 else {"event": "batch", "events": events}
+        try:
+            await ws_manager.broadcast(frame)
+        except Exception as e:
+            print(f"[EVENT] Broadcast of {len(events)} event(s) failed: {e}", file=sys.stderr, flush=True)
+
+
+coalescer = EventCoalescer()
+
+
 class EventBus:
-    @staticmethod
-    async def publish_order_created(order):
-        print(f"[EVENT] Publishing order_created event for order: {order}", file=sys.stdout, flush=True)
-        await ws_manager.broadcast({
-            "event": "order_created",
-            "data": order
-        })
+    """
+    Fan-out of domain events to WebSocket clients. Repositories do not call this directly;
+    they stage events in the outbox and the dispatcher publishes them after commit.
 
+    Events about a known entity (order, order item, payment) are versioned. The first time
+    an entity is seen the frame carries the full object; afterwards only the changed fields
+    plus routing ids, with "delta": true and from_version -> version. A client whose known
+    version differs from from_version (or whose epoch differs) fetches a snapshot.
+    Bulk events ({"items": [...]}) version every item and carry the same per-item fields.
+    """
     @staticmethod
-    async def publish_order_updated(order):
-        print(f"[EVENT] Publishing order_updated event for order: {order}", file=sys.stdout, flush=True)
-        await ws_manager.broadcast({
-            "event": "order_updated",
-            "data": order
-        })
+    async def publish(event: str, data: dict):
+        entity = entity_of(event)
+        if entity is not None and isinstance(data, dict) and isinstance(data.get("items"), list):
+            EventBus._publish_bulk(event, entity, data)
+            return
+        entity_id = data.get("id") if isinstance(data, dict) else None
+        if entity is None or entity_id is None:
+            coalescer.add({"event": event, "data": data})
+            return
+
+        from_version, version, changed = version_store.record(entity, entity_id, data)
+        if changed == {}:
+            return  # same state again, e.g. an outbox redelivery
+
+        frame = {
+            "event": event,
+            "entity": entity,
+            "epoch": version_store.epoch,
+            "version": version,
+        }
+        if changed is None:
+            frame["data"] = data
+        else:
+            frame["delta"] = True
+            frame["from_version"] = from_version
+            frame["data"] = {**{f: data[f] for f in ROUTING_FIELDS if f in data}, **changed}
+        coalescer.add(frame)
 
     @staticmethod
-    async def publish_order_completed(order):
-        print(f"[EVENT] Publishing order_completed event for order: {order}", file=sys.stdout, flush=True)
-        await ws_manager.broadcast({
-            "event": "order_completed",
-            "data": order
-        })
-    
-    @staticmethod
-    async def publish_order_item_created(order_item):
-        print(f"[EVENT] Publishing order_item_created event for item: {order_item}", file=sys.stdout, flush=True)
-        await ws_manager.broadcast({
-            "event": "order_item_created",
-            "data": order_item
+    def _publish_bulk(event: str, entity: str, data: dict):
+        items = []
+        for item in data["items"]:
+            from_version, version, changed = version_store.record(entity, item["id"], item)
+            if changed == {}:
+                continue
+            if changed is None:
+                items.append({**item, "version": version})
+            else:
+                routing = {f: item[f] for f in ROUTING_FIELDS if f in item}
+                items.append({**routing, **changed, "version": version, "from_version": from_version, "delta": True})
+        if not items:
+            return
+        coalescer.add({
+            "event": event,
+            "entity": entity,
+            "epoch": version_store.epoch,
+            "data": {**data, "items": items},
         })
 
     @staticmethod
-    async def publish_order_item_updated(order_item):
-        print(f"[EVENT] Publishing order_item_updated event for item: {order_item}", file=sys.stdout, flush=True)
-        await ws_manager.broadcast({
-            "event": "order_item_updated",
-            "data": order_item
-        })
\ No newline at end of file
+    async def flush():
+        await coalescer.flush()
@@ -1,3 +1,4 @@
 from .manager import ws_manager
 from .router import router
-from .EventBus import EventBus
\ No newline at end of file
+from .EventBus import EventBus
+from .dispatcher import outbox_dispatcher
\ No newline at end of file
@@ -0,0 +1,76 @@
+import asyncio
+import sys
+
+from configs.postgre import SessionFactory
+from repository.outbox import OutboxRepository
+from .EventBus import EventBus
+
+BATCH_SIZE = 100
+POLL_INTERVAL_SECONDS = 5.0     # fallback when a NOTIFY is missed
+RETRY_BASE_SECONDS = 1.0
+RETRY_MAX_SECONDS = 300.0
+
+
+class OutboxDispatcher:
+    """
+    Relays committed outbox events to the EventBus, oldest first, in batches.
+    Woken by NOTIFY on the outbox channel; polls as a fallback. An event is marked
+    dispatched once the EventBus accepted it; the bus coalesces for a few ms before sending.
+    """
+    def __init__(self, batch_size: int = BATCH_SIZE, poll_interval: float = POLL_INTERVAL_SECONDS):
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task | None = None
+
+    def wake(self, channel: str = "", payload: str = ""):
+        """PgListener handler for the outbox channel."""
+        self._wakeup.set()
+
+    async def dispatch_batch(self) -> int:
+        """Publish one batch; returns how many events were claimed."""
+        async with SessionFactory() as db:
+            repository = OutboxRepository(db)
+            events = await repository.claim_batch(self.batch_size)
+            delivered = []
+            for event in events:
+                try:
+                    await EventBus.publish(event.event, event.payload)
+                    delivered.append(event.id)
+                except Exception as e:
+                    retry_in = min(RETRY_BASE_SECONDS * 2 ** event.attempts, RETRY_MAX_SECONDS)
+                    await repository.mark_failed(event, str(e), retry_in)
+                    print(f"[OUTBOX] {event.event}#{event.id} failed, retry in {retry_in}s: {e}", file=sys.stderr, flush=True)
+            await repository.mark_dispatched(delivered)
+            await db.commit()
+        return len(events)
+
+    async def _run(self):
+        while not self._stopping:
+            self._wakeup.clear()
+            try:
+                if await self.dispatch_batch() >= self.batch_size:
+                    continue  # more may be waiting
+            except Exception as e:
+                print(f"[OUTBOX] Dispatch error: {e}", file=sys.stderr, flush=True)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self._stopping = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await EventBus.flush()
+
+
+# Global singleton instance
+outbox_dispatcher = OutboxDispatcher()
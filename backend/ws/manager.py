@@ -1,41 +1,79 @@
-from typing import List
-from fastapi import WebSocket, WebSocketDisconnect
-import sys
+from fastapi import WebSocket
+import asyncio
 import json
+import sys
+import time
+
+import msgpack
+
+ENCODING_JSON = "json"
+ENCODING_MSGPACK = "msgpack"
+
+# Subprotocols a client may request in Sec-WebSocket-Protocol; JSON is used when none match
+SUBPROTOCOLS = {
+    "msgpack": ENCODING_MSGPACK,
+}
+
+
+class Connection:
+    """Per-socket record; __slots__ keeps it to a few dozen bytes per idle client."""
+    __slots__ = ("ws", "connected_at", "encoding")
+
+    def __init__(self, ws: WebSocket, encoding: str = ENCODING_JSON):
+        self.ws = ws
+        self.connected_at = time.monotonic()
+        self.encoding = encoding
+
+
+def encode(data: dict, encoding: str) -> str | bytes:
+    if encoding == ENCODING_MSGPACK:
+        return msgpack.packb(data, use_bin_type=True)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
 
 class WebSocketManager:
     def __init__(self):
-        self.active: List[WebSocket] = []
+        # keyed by id(ws) (WebSocket is a Mapping, so not hashable), O(1) connect/disconnect
+        self.active: dict[int, Connection] = {}
 
     async def connect(self, ws: WebSocket):
-        await ws.accept()
-        self.active.append(ws)
-        print(f"[WS_MANAGER] Client connected. Total connections: {len(self.active)}", file=sys.stdout, flush=True)
+        subprotocol = next((p for p in ws.scope.get("subprotocols", []) if p in SUBPROTOCOLS), None)
+        await ws.accept(subprotocol=subprotocol)
+        self.active[id(ws)] = Connection(ws, SUBPROTOCOLS.get(subprotocol, ENCODING_JSON))
 
     def disconnect(self, ws: WebSocket):
-        if ws in self.active:
-            self.active.remove(ws)
-            print(f"[WS_MANAGER] Client disconnected. Total connections: {len(self.active)}", file=sys.stdout, flush=True)
+        self.active.pop(id(ws), None)
+
+    async def _send(self, connection: Connection, frame: str | bytes):
+        try:
+            if isinstance(frame, bytes):
+                await connection.ws.send_bytes(frame)
+            else:
+                await connection.ws.send_text(frame)
+        except Exception as e:
+            print(f"[WS_MANAGER] Error sending message: {e}", file=sys.stderr, flush=True)
+            self.disconnect(connection.ws)
 
     async def broadcast(self, data: dict):
-        print(f"[WS_MANAGER] Broadcasting to {len(self.active)} active connections: {data}", file=sys.stdout, flush=True)
-        
-        # Convert Pydantic models to dicts for JSON serialization
+        # Pydantic models become plain JSON-compatible values, valid for every encoding
         serialized_data = {}
         for key, value in data.items():
             if hasattr(value, 'model_dump'):
-                serialized_data[key] = value.model_dump()
+                serialized_data[key] = value.model_dump(mode="json")
             else:
                 serialized_data[key] = value
-        
-        for ws in list(self.active):
-            try:
-                await ws.send_json(serialized_data)
-                print(f"[WS_MANAGER] Message sent successfully", file=sys.stdout, flush=True)
-            except Exception as e:
-                print(f"[WS_MANAGER] Error sending message: {e}", file=sys.stderr, flush=True)
-                self.disconnect(ws)
+
+        # Encode once per encoding in use, not once per socket
+        connections = list(self.active.values())
+        frames = {}
+        for connection in connections:
+            if connection.encoding not in frames:
+                frames[connection.encoding] = encode(serialized_data, connection.encoding)
+
+        await asyncio.gather(*(
+            self._send(connection, frames[connection.encoding]) for connection in connections
+        ))
 
 
 # Global singleton instance
-ws_manager = WebSocketManager()
\ No newline at end of file
+ws_manager = WebSocketManager()
@@ -1,27 +1,92 @@
 from .manager import ws_manager
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-import asyncio
+from .sse import SSEFilter, sse_broker
+from .versions import version_store
+from fastapi import APIRouter, Header, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
 import sys
 
 router = APIRouter()
 
 @router.websocket("/ws")
 async def websocket_endpoint(ws: WebSocket):
+    # Keepalive is protocol-level: uvicorn pings every ws_ping_interval seconds and closes
+    # peers that miss the pong, which ends receive() below. Idle sockets cost no wakeups here.
     await ws_manager.connect(ws)
-    print(f"[WS_ROUTER] WebSocket connected successfully", file=sys.stdout, flush=True)
     try:
         while True:
-            # Keep connection alive with a timeout - client can send messages or just stay connected
-            try:
-                data = await asyncio.wait_for(ws.receive_text(), timeout=30)
-                print(f"[WS_ROUTER] Received message: {data}", file=sys.stdout, flush=True)
-            except asyncio.TimeoutError:
-                # Timeout is fine, just keep the connection open
-                print(f"[WS_ROUTER] No message received (timeout), keeping connection alive", file=sys.stdout, flush=True)
-                continue
+            # Clients are not expected to send anything; drain and ignore
+            message = await ws.receive()
+            if message["type"] == "websocket.disconnect":
+                break
     except WebSocketDisconnect:
-        print(f"[WS_ROUTER] WebSocket disconnected", file=sys.stdout, flush=True)
-        ws_manager.disconnect(ws)
+        pass
     except Exception as e:
         print(f"[WS_ROUTER] Error: {e}", file=sys.stderr, flush=True)
-        ws_manager.disconnect(ws)
\ No newline at end of file
+    finally:
+        ws_manager.disconnect(ws)
+
+
+@router.get("/events/snapshots/{entity}/{entity_id}")
+async def get_event_snapshot(
+    entity: str,
+    entity_id: int,
+    version: int | None = Query(None, ge=1, description="Latest if omitted"),
+):
+    """
+    Full state of an entity as known to the event stream, for clients that missed a delta.
+    """
+    snapshot = version_store.snapshot(entity, entity_id, version)
+    if snapshot is None:
+        latest = version_store.latest_version(entity, entity_id)
+        if latest is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No event state for {entity} {entity_id}; fetch it from its resource endpoint"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail=f"Version {version} of {entity} {entity_id} is no longer retained, latest is {latest}"
+        )
+
+    snapshot_version, data = snapshot
+    return {
+        "entity": entity,
+        "id": entity_id,
+        "epoch": version_store.epoch,
+        "version": snapshot_version,
+        "data": data,
+    }
+
+
+@router.get("/events/stream")
+async def stream_events(
+    events: list[str] | None = Query(None, description="Only these event names"),
+    entities: list[str] | None = Query(None, description="Only these entities: order, order_item, payment"),
+    order_ids: list[int] | None = Query(None, description="Only events about these orders"),
+    last_event_id: str | None = Query(None, description="Resume point for clients that cannot set the header"),
+    last_event_id_header: str | None = Header(None, alias="Last-Event-ID"),
+    accept_encoding: str = Header("", alias="Accept-Encoding"),
+):
+    """
+    Server-Sent Events feed of the same frames WebSocket clients get, for read-only displays.
+    Resumes after Last-Event-ID from a ring buffer; sends a resync event when that is not possible.
+    """
+    stream_filter = SSEFilter(
+        set(events) if events else None,
+        set(entities) if entities else None,
+        set(order_ids) if order_ids else None,
+    )
+    gzip = "gzip" in accept_encoding.lower()
+    headers = {
+        "Cache-Control": "no-cache, no-transform",
+        "X-Accel-Buffering": "no",   # disable proxy buffering (nginx)
+        "Vary": "Accept-Encoding",
+    }
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        sse_broker.stream(stream_filter, last_event_id_header or last_event_id, gzip),
+        media_type="text/event-stream",
+        headers=headers,
+    )
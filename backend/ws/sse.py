@@ -0,0 +1,137 @@
+import asyncio
+import json
+import sys
+import uuid
+import zlib
+from collections import deque
+
+RING_SIZE = 2000              # events kept for Last-Event-ID resume
+SUBSCRIBER_QUEUE_SIZE = 500   # a display this far behind is dropped and resumes on reconnect
+HEARTBEAT_SECONDS = 15        # comment lines keep proxies from closing idle streams
+RETRY_MS = 3000
+
+
+class SSEEvent:
+    __slots__ = ("seq", "event", "entity", "order_ids", "text")
+
+    def __init__(self, seq: int, event_id: str, frame: dict):
+        data = frame.get("data") if isinstance(frame.get("data"), dict) else {}
+        self.seq = seq
+        self.event = frame["event"]
+        self.entity = frame.get("entity")
+        # Orders are routed by their own id, everything else by the order it belongs to
+        if "order_ids" in data:
+            self.order_ids = frozenset(data["order_ids"])
+        else:
+            self.order_ids = frozenset((data.get("id") if self.entity == "order" else data.get("order_id"),))
+        payload = json.dumps(frame, separators=(",", ":"), ensure_ascii=False)
+        self.text = f"id: {event_id}\nevent: {self.event}\ndata: {payload}\n\n"
+
+
+class SSEFilter:
+    __slots__ = ("events", "entities", "order_ids")
+
+    def __init__(self, events: set[str] | None, entities: set[str] | None, order_ids: set[int] | None):
+        self.events = events
+        self.entities = entities
+        self.order_ids = order_ids
+
+    def matches(self, event: SSEEvent) -> bool:
+        if self.events is not None and event.event not in self.events:
+            return False
+        if self.entities is not None and event.entity not in self.entities:
+            return False
+        if self.order_ids is not None and self.order_ids.isdisjoint(event.order_ids):
+            return False
+        return True
+
+
+class SSEBroker:
+    """
+    Fans EventBus frames out to Server-Sent Event streams. Each event is serialized once;
+    streams only filter and (optionally) compress. Event ids are "<epoch>-<seq>", so a
+    Last-Event-ID from before a restart or older than the ring buffer is detected and the
+    client is told to resync.
+    """
+    def __init__(self, ring_size: int = RING_SIZE):
+        self.epoch = uuid.uuid4().hex[:12]
+        self._seq = 0
+        self._ring: deque[SSEEvent] = deque(maxlen=ring_size)
+        self._subscribers: dict[asyncio.Queue, SSEFilter] = {}
+
+    def publish(self, frames: list[dict]):
+        for frame in frames:
+            self._seq += 1
+            event = SSEEvent(self._seq, f"{self.epoch}-{self._seq}", frame)
+            self._ring.append(event)
+            for queue, stream_filter in list(self._subscribers.items()):
+                if not stream_filter.matches(event):
+                    continue
+                try:
+                    queue.put_nowait(event)
+                except asyncio.QueueFull:
+                    # Too slow: end the stream, the client reconnects with Last-Event-ID
+                    self._subscribers.pop(queue, None)
+                    while not queue.empty():
+                        queue.get_nowait()
+                    queue.put_nowait(None)
+
+    def replay(self, last_event_id: str | None, stream_filter: SSEFilter) -> tuple[list[SSEEvent], bool]:
+        """Events after last_event_id and whether the client must resync instead."""
+        if not last_event_id:
+            return [], False
+        epoch, _, seq = last_event_id.partition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return [], True
+        seq = int(seq)
+        if self._ring and seq < self._ring[0].seq - 1:
+            return [], True
+        return [event for event in self._ring if event.seq > seq and stream_filter.matches(event)], False
+
+    def subscribe(self, stream_filter: SSEFilter) -> asyncio.Queue:
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers[queue] = stream_filter
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.pop(queue, None)
+
+    async def stream(self, stream_filter: SSEFilter, last_event_id: str | None, gzip: bool):
+        """Async generator of response chunks for one display."""
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if gzip else None
+
+        def encode(text: str) -> bytes:
+            if compressor is None:
+                return text.encode()
+            # SYNC_FLUSH pushes every event out immediately while keeping one gzip stream
+            return compressor.compress(text.encode()) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+        # Subscribe before replaying so nothing published in between is lost
+        queue = self.subscribe(stream_filter)
+        try:
+            yield encode(f"retry: {RETRY_MS}\n\n")
+            backlog, resync = self.replay(last_event_id, stream_filter)
+            if resync:
+                yield encode(f"id: {self.epoch}-{self._seq}\nevent: resync\ndata: {{}}\n\n")
+            replayed = backlog[-1].seq if backlog else 0
+            for event in backlog:
+                yield encode(event.text)
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield encode(": keepalive\n\n")
+                    continue
+                if event is None:
+                    break
+                if event.seq <= replayed:
+                    continue
+                yield encode(event.text)
+        except Exception as e:
+            print(f"[SSE] Stream error: {e}", file=sys.stderr, flush=True)
+        finally:
+            self.unsubscribe(queue)
+
+
+sse_broker = SSEBroker()
@@ -0,0 +1,84 @@
+import uuid
+from collections import OrderedDict, deque
+
+MAX_ENTITIES = 10000        # least recently changed entities are forgotten beyond this
+HISTORY_PER_ENTITY = 16     # snapshots kept per entity for gap recovery
+
+# Event name prefix -> entity type; longest prefix first
+ENTITY_PREFIXES = [
+    ("order_items_", "order_item"),
+    ("order_item_", "order_item"),
+    ("order_", "order"),
+    ("payment_", "payment"),
+]
+
+# Fields always carried in a delta so clients can route it without the full object
+ROUTING_FIELDS = ("id", "order_id", "booking_id")
+
+
+def entity_of(event: str) -> str | None:
+    for prefix, entity in ENTITY_PREFIXES:
+        if event.startswith(prefix):
+            return entity
+    return None
+
+
+class VersionStore:
+    """
+    In-memory per-entity version counter and recent snapshots, fed by published events.
+    Versions restart with the process; `epoch` changes with them so clients can tell.
+    """
+    def __init__(self, max_entities: int = MAX_ENTITIES, history: int = HISTORY_PER_ENTITY):
+        self.epoch = uuid.uuid4().hex[:12]
+        self.max_entities = max_entities
+        self.history = history
+        self._entities: OrderedDict[tuple[str, int], deque[tuple[int, dict]]] = OrderedDict()
+
+    def record(self, entity: str, entity_id: int, state: dict) -> tuple[int | None, int, dict | None]:
+        """
+        Store a new state. Returns (previous version, new version, changed fields);
+        changed is None when there is no previous state to diff against.
+        If nothing changed the version is not bumped (e.g. a redelivered event).
+        """
+        key = (entity, entity_id)
+        snapshots = self._entities.get(key)
+        if snapshots is None:
+            snapshots = deque(maxlen=self.history)
+            self._entities[key] = snapshots
+            if len(self._entities) > self.max_entities:
+                self._entities.popitem(last=False)
+        else:
+            self._entities.move_to_end(key)
+
+        if not snapshots:
+            snapshots.append((1, state))
+            return None, 1, None
+
+        previous_version, previous = snapshots[-1]
+        # Events may carry a subset of fields; unknown fields keep their last value
+        merged = {**previous, **state}
+        changed = {k: v for k, v in merged.items() if previous.get(k) != v or k not in previous}
+        if not changed:
+            return previous_version, previous_version, {}
+
+        snapshots.append((previous_version + 1, merged))
+        return previous_version, previous_version + 1, changed
+
+    def snapshot(self, entity: str, entity_id: int, version: int | None = None) -> tuple[int, dict] | None:
+        """The state at `version` (latest if None), or None if unknown or no longer retained."""
+        snapshots = self._entities.get((entity, entity_id))
+        if not snapshots:
+            return None
+        if version is None:
+            return snapshots[-1]
+        for snapshot_version, state in snapshots:
+            if snapshot_version == version:
+                return snapshot_version, state
+        return None
+
+    def latest_version(self, entity: str, entity_id: int) -> int | None:
+        snapshots = self._entities.get((entity, entity_id))
+        return snapshots[-1][0] if snapshots else None
+
+
+version_store = VersionStore()
@@ -4,16 +4,80 @@ import { useQueryClient } from '@tanstack/react-query';
 /**
  * WebSocket Event Types from Backend EventBus
  */
-interface WebSocketMessage {
+interface WebSocketEvent {
   event:
     | 'order_created'
     | 'order_updated'
     | 'order_completed'
     | 'order_item_created'
-    | 'order_item_updated';
+    | 'order_item_updated'
+    | 'order_items_updated'
+    | 'payment_created'
+    | 'payment_updated'
+    | 'low_stock';
   data: any;
+  // Versioned entity events: the first frame per entity carries the full object,
+  // later ones (delta: true) only changed fields plus id/order_id
+  entity?: 'order' | 'order_item' | 'payment';
+  epoch?: string;
+  version?: number;
+  from_version?: number;
+  delta?: boolean;
 }
 
+/**
+ * Events published within a short window arrive as one batch frame,
+ * already merged to the latest state per entity
+ */
+interface WebSocketBatch {
+  event: 'batch';
+  events: WebSocketEvent[];
+}
+
+type WebSocketMessage = WebSocketEvent | WebSocketBatch;
+
+/**
+ * React Query keys affected by one event
+ */
+const queryKeysFor = (message: WebSocketEvent): unknown[][] => {
+  switch (message.event) {
+    case 'order_created':
+    case 'order_completed':
+      return [['orders'], ['tables']];
+
+    case 'order_updated':
+      // Invalidate specific order if we have the ID
+      return message.data?.id
+        ? [['orders'], ['tables'], ['orders', message.data.id]]
+        : [['orders'], ['tables']];
+
+    case 'order_item_created':
+    case 'order_item_updated':
+      // Invalidate specific order's items
+      return message.data?.order_id
+        ? [['orderItems'], ['orders'], ['orderItems', message.data.order_id]]
+        : [['orderItems'], ['orders']];
+
+    case 'order_items_updated': {
+      // Bulk kitchen transition: one event for many items, possibly across orders
+      const orderIds: number[] = message.data?.order_ids ?? [];
+      return [['orderItems'], ['orders'], ...orderIds.map((id) => ['orderItems', id])];
+    }
+
+    case 'payment_created':
+    case 'payment_updated':
+      return [['payments']];
+
+    case 'low_stock':
+      // Stock crossed an ingredient's threshold
+      return [['ingredients']];
+
+    default:
+      console.warn('Unknown WebSocket event:', (message as WebSocketEvent).event);
+      return [];
+  }
+};
+
 /**
  * Custom hook for WebSocket connection to backend
  * Automatically invalidates React Query caches when events are received
@@ -57,60 +121,20 @@ export const useWebSocket = () => {
         ws.current.onmessage = (event) => {
           try {
             const message: WebSocketMessage = JSON.parse(event.data);
-            console.log('📨 WebSocket Event:', message.event, message.data);
-
-            // Invalidate React Query caches based on event type
-            // This triggers automatic refetch of affected data
-            switch (message.event) {
-              case 'order_created':
-                console.log('🆕 New order created:', message.data);
-                queryClient.invalidateQueries({ queryKey: ['orders'] });
-                queryClient.invalidateQueries({ queryKey: ['tables'] });
-                break;
-
-              case 'order_updated':
-                console.log('🔄 Order updated:', message.data);
-                queryClient.invalidateQueries({ queryKey: ['orders'] });
-                queryClient.invalidateQueries({ queryKey: ['tables'] });
-                // Invalidate specific order if we have the ID
-                if (message.data?.id) {
-                  queryClient.invalidateQueries({ queryKey: ['orders', message.data.id] });
-                }
-                break;
-
-              case 'order_completed':
-                console.log('✅ Order completed:', message.data);
-                queryClient.invalidateQueries({ queryKey: ['orders'] });
-                queryClient.invalidateQueries({ queryKey: ['tables'] });
-                break;
-
-              case 'order_item_created':
-                console.log('🍽️ Order item created:', message.data);
-                queryClient.invalidateQueries({ queryKey: ['orderItems'] });
-                queryClient.invalidateQueries({ queryKey: ['orders'] });
-                // Invalidate specific order's items
-                if (message.data?.order_id) {
-                  queryClient.invalidateQueries({
-                    queryKey: ['orderItems', message.data.order_id]
-                  });
-                }
-                break;
-
-              case 'order_item_updated':
-                console.log('🔄 Order item updated:', message.data);
-                queryClient.invalidateQueries({ queryKey: ['orderItems'] });
-                queryClient.invalidateQueries({ queryKey: ['orders'] });
-                // Invalidate specific order's items
-                if (message.data?.order_id) {
-                  queryClient.invalidateQueries({
-                    queryKey: ['orderItems', message.data.order_id]
-                  });
-                }
-                break;
-
-              default:
-                console.warn('Unknown WebSocket event:', message.event);
+            const events = message.event === 'batch' ? message.events : [message];
+            console.log('📨 WebSocket Events:', events.map((e) => e.event));
+
+            // Invalidate each affected React Query cache once per frame,
+            // however many events in the batch touch it
+            const queryKeys = new Map<string, unknown[]>();
+            for (const e of events) {
+              for (const queryKey of queryKeysFor(e)) {
+                queryKeys.set(JSON.stringify(queryKey), queryKey);
+              }
             }
+            queryKeys.forEach((queryKey) => {
+              queryClient.invalidateQueries({ queryKey });
+            });
           } catch (error) {
             console.error('Error parsing WebSocket message:', error);
           }